@@ -25,6 +25,7 @@ from epstein_files.documents.messenger_log import MessengerLog
 from epstein_files.documents.other_file import OtherFile
 from epstein_files.output.doc_printer import DocPrinter
 from epstein_files.output.epstein_highlighter import highlighter, temp_highlighter
+from epstein_files.output.html.precompress import wait_for_precompression
 from epstein_files.output.output import (print_chronological, print_document_notes, print_doj_files, print_emails_section,
      print_json_files, print_stats, print_other_files_section, print_text_msgs_section, print_all_emails_chronological,
      print_signatures_and_emojis, print_emailers_info, print_json_metadata, show_urls, print_annotated_only)
@@ -105,6 +106,7 @@ def epstein_generate() -> None:
     if args.stats:
         print_stats(epstein_files)  # Used for building pytest checks
 
+    wait_for_precompression()
     logger.warning(f"Total time: {timer.seconds_since_start_str()}")
 
 
@@ -291,4 +293,5 @@ def _load_files_and_check_early_exit_args() -> tuple[Timer, EpsteinFiles]:
         else:
             return timer, epstein_files
 
+    wait_for_precompression()
     sys.exit()
@@ -10,7 +10,7 @@ from epstein_files.documents.config.communication_cfg import CommunicationCfg
 from epstein_files.output.highlight_config import get_style_for_name
 from epstein_files.output.rich import styled_key_value
 from epstein_files.people.entity import Entity, EntityScanArg
-from epstein_files.people.names import UNKNOWN, Name, extract_last_name
+from epstein_files.people.names import UNKNOWN, Name, extract_last_name, intern_names
 from epstein_files.util.constant.strings import QUESTION_MARKS
 from epstein_files.util.helpers.data_helpers import uniq_sorted
 from epstein_files.util.helpers.rich_helpers import no_bold, join_texts
@@ -29,7 +29,7 @@ class Communication(Document):
 
     def __post_init__(self):
         super().__post_init__()
-        self.extracted_recipients = [] if self._config.recipients else self.extract_recipients()
+        self.extracted_recipients = [] if self._config.recipients else intern_names(self.extract_recipients())
 
     @property
     def border_style(self) -> str:
@@ -3,7 +3,7 @@ from epstein_files.documents.config.config_builder import (fedex_invoice, import
 from epstein_files.documents.config.doc_cfg import DocCfg
 from epstein_files.documents.config.communication_cfg import imessage_screenshot, skype_log
 from epstein_files.documents.documents.categories import Interesting, Neutral
-from epstein_files.output.site.sites import PHONE_LOG_FILE_ID, Site
+from epstein_files.output.site.sites import Site
 from epstein_files.people.names import *
 from epstein_files.util.constant.strings import *
 from epstein_files.util.constant.urls import JMAIL_JCAL_URL
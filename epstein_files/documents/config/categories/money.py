@@ -6,6 +6,7 @@ import re
 from epstein_files.documents.config.config_builder import inventory, letter, memo
 from epstein_files.documents.config.doc_cfg import EMAIL_TRUNCATE_TO, NO_TRUNCATE, DocCfg
 from epstein_files.documents.config.email_cfg import EmailCfg
+from epstein_files.documents.documents.ocr_repairer import OcrRepairer
 from epstein_files.people.entity import epstein_trust_name
 from epstein_files.people.names import *
 from epstein_files.util.constant.strings import *
@@ -27,6 +28,8 @@ MONEY_OCR_REPAIRS: OcrRepair = {
     'D.B. Zwim': DB_ZWIRN,
 }
 
+MONEY_OCR_REPAIRER = OcrRepairer.compile(MONEY_OCR_REPAIRS)
+
 
 def banca_del_fucino_doc(id: str, note: str = '', **kwargs) -> DocCfg:
     return DocCfg(id=id, author='Banca del Fucino', note=note, **kwargs)
@@ -1,7 +1,8 @@
 from epstein_files.documents.config.config_builder import phone_bill_cfg
 from epstein_files.documents.config.doc_cfg import DocCfg
 from epstein_files.people.names import SARAH_KELLEN
-from epstein_files.output.site.sites import PHONE_LOG_FILE_ID, Site
+from epstein_files.output.site.sites import Site
+from epstein_files.util.constant.strings import PHONE_LOG_FILE_ID
 
 
 PHONE_BILL_CFGS = [
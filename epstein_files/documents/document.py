@@ -19,14 +19,16 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
 
-from epstein_files.documents.config.categories.money import MONEY_OCR_REPAIRS
+from epstein_files.documents.config.categories.money import MONEY_OCR_REPAIRER
 from epstein_files.documents.config.doc_cfg import (AUTO_QUOTE_NUM_CHARS, DOC_CHAR_RANGE, EMAIL_TRUNCATE_TO,
      DUPE_TYPE_STRS, NO_TRUNCATE, WHOLE_FILE_CHAR_RANGE, DebugDict, DocCfg, Metadata)
 from epstein_files.documents.config.email_cfg import EmailCfg
 from epstein_files.documents.documents.categories import Interesting
 from epstein_files.documents.documents.file_info import FileInfo
+from epstein_files.documents.documents.ocr_repairer import OcrRepairer
 from epstein_files.documents.documents.search_result import MatchedLine
-from epstein_files.documents.emails.constants import DOJ_EMAIL_OCR_REPAIRS, FALLBACK_TIMESTAMP
+from epstein_files.documents.documents.text_store import StoredText, TextRef
+from epstein_files.documents.emails.constants import DOJ_EMAIL_OCR_REPAIRER, FALLBACK_TIMESTAMP
 from epstein_files.documents.emails.emailers import get_entities
 from epstein_files.documents.emails.email_header import DETECT_EMAIL_REGEX
 from epstein_files.output.highlight_config import (HIGHLIGHTED_ENTITIES, get_style_for_category,
@@ -40,7 +42,7 @@ from epstein_files.output.rich import (INFO_STYLE, SYMBOL_STYLE, console, styled
 from epstein_files.output.site.sites import EXTRACTS_BASE_URL
 from epstein_files.people.entity import Entity, EntityScanArg
 from epstein_files.people.interesting_people import PERSONS_OF_INTEREST, UNINTERESTING_AUTHORS
-from epstein_files.people.names import UNKNOWN, Name
+from epstein_files.people.names import UNKNOWN, Name, intern_name
 from epstein_files.util.constant.strings import *
 from epstein_files.util.constants import CONFIGS_BY_ID
 from epstein_files.util.env import DEFAULT_WIDTH, args, site_config, temporary_args
@@ -77,6 +79,8 @@ OCR_REPAIRS: OcrRepair = {
     re.compile(r"^Fronn: ?", re.MULTILINE): 'From: ',
 }
 
+OCR_REPAIRER = OcrRepairer.compile(OCR_REPAIRS)
+
 DEBUG_PROPS = [
     'is_interesting',
     'num_lines',
@@ -110,6 +114,8 @@ WARN_ON_ENTITY_NAMES = set([
 T = TypeVar('T', bound=str | Text)
 
 
+# Not slotted: `StoredText` keeps the decoded text in `__dict__` and dataclass(slots=True) breaks the
+# zero argument super() calls all over the subclasses (fixed in python 3.14).
 @dataclass
 class Document(LoggingEntity):
     """
@@ -120,8 +126,10 @@ class Document(LoggingEntity):
         extracted_author (Name): who created the text in this file, extracted from the text (AKA "not configured")
         extracted_timestamp (datetime, optional): When the file was originally created, extracted from the text
         file_info (FileInfo): Manages things having to do with the underlying file (paths, URLs, etc.)
-        lines (list[str]): Number of lines in the file after all the cleanup
-        text (str): Contents of the file
+        text (str): Contents of the file (decoded from `TEXT_STORE` on first access if this obj was unpickled)
+        _lines (list[str], optional): `text` split into lines, built on demand and not saved in the pickle
+        _looks_like_email (bool, optional): cached result of the `DETECT_EMAIL_REGEX` check done by `looks_like_email`
+        _text_ref (TextRef, optional): location of `text` in `TEXT_STORE`, pickled instead of the text itself
     """
     file_path: Path
 
@@ -129,23 +137,26 @@ class Document(LoggingEntity):
     extracted_author: Name = None
     extracted_timestamp: datetime | None = None
     file_info: FileInfo = field(init=False)
-    lines: list[str] = field(default_factory=list)
-    text: str = ''
+    text: str = StoredText()  # type: ignore[assignment]
+    _lines: list[str] | None = field(default=None, repr=False)
+    _looks_like_email: bool | None = None
+    _text_ref: TextRef | None = field(default=None, repr=False)
 
     # Class constants, overloaded in some subclasses
     MAX_TIMESTAMP: ClassVar[datetime] = coerce_utc_strict(datetime(2026, 1, 29))  # Cutoff for extract_timestamp()
     STRIP_WHITESPACE: ClassVar[bool] = True                                       # Should strip whitespace (overridden in JsonFile)
     _INCLUDE_DESCRIPTION_IN_SUMMARY_PANEL: ClassVar[bool] = False                 # For logging only
+    TEXT_CACHE_FIELDS: ClassVar[list[str]] = ['_lines']                           # Derived from text, reset by _set_text()
 
     def __post_init__(self):
         self.file_info = FileInfo(self.file_path)
 
-        if self.file_info.has_file and not self.file_path.exists():
+        if self.file_info.has_file and not (self.text or self.file_path.exists()):
             raise FileNotFoundError(f"File '{self.file_path}' does not exist!")
 
         self._set_text(text=self.text or self._load_file())
         self._repair()
-        self.extracted_author = None if self.author else self.extract_author()
+        self.extracted_author = None if self.author else intern_name(self.extract_author())
 
         try:
             self.extracted_timestamp = None if self.timestamp else coerce_utc(self.extract_timestamp())
@@ -301,9 +312,8 @@ class Document(LoggingEntity):
 
     @property
     def is_email(self) -> bool:
-        """True if the text looks like it's probably an email."""
-        search_area = self.repair_ocr_text(DOJ_EMAIL_OCR_REPAIRS, self.text[0:5000])
-        return isinstance(self.config, EmailCfg) or bool(DETECT_EMAIL_REGEX.match(search_area) and self.config is None)
+        """True if the text looks like it's probably an email (config is checked every time, text only once)."""
+        return isinstance(self.config, EmailCfg) or (self.config is None and self.looks_like_email)
 
     @property
     def is_empty(self) -> bool:
@@ -338,6 +348,23 @@ class Document(LoggingEntity):
     def length(self) -> int:
         return len(self.text)
 
+    @property
+    def lines(self) -> list[str]:
+        """`text` split into lines (whitespace stripped unless `STRIP_WHITESPACE` is False)."""
+        if self._lines is None:
+            self._lines = [line.strip() if self.STRIP_WHITESPACE else line for line in self.text.split('\n')]
+
+        return self._lines
+
+    @property
+    def looks_like_email(self) -> bool:
+        """True if the start of the text matches `DETECT_EMAIL_REGEX`. Only scanned once (result is pickled)."""
+        if self._looks_like_email is None:
+            search_area = self.repair_ocr_text(DOJ_EMAIL_OCR_REPAIRER, self.text[0:5000])
+            self._looks_like_email = bool(DETECT_EMAIL_REGEX.match(search_area))
+
+        return self._looks_like_email
+
     @property
     def metadata(self) -> Metadata:
         metadata = self.config.metadata if self.config else {}
@@ -356,7 +383,7 @@ class Document(LoggingEntity):
 
     @property
     def num_lines(self) -> int:
-        return len(self.lines)
+        return self.text.count('\n') + 1
 
     @property
     def panel_title_timestamp(self) -> str:
@@ -664,15 +691,9 @@ class Document(LoggingEntity):
         """Rebuild a new version of this object by loading the source file from disk again."""
         return type(self)(self.file_path)
 
-    def repair_ocr_text(self, repairs: dict[str | re.Pattern, str], text: str) -> str:
-        """Apply a dict of repairs (key is pattern or string, value is replacement string) to text."""
-        for k, v in repairs.items():
-            if isinstance(k, re.Pattern):
-                text = k.sub(v, text)
-            else:
-                text = text.replace(k, v)
-
-        return text
+    def repair_ocr_text(self, repairer: OcrRepairer, text: str) -> str:
+        """Apply a compiled dict of repairs (key is pattern or string, value is replacement string) to text."""
+        return repairer.repair(text)
 
     def rich_header(self) -> Group:
         """Panel + subheaders with filename linking to raw file plus any additional info about the file."""
@@ -770,7 +791,7 @@ class Document(LoggingEntity):
 
     def _repair(self) -> None:
         """Can optionally be overloaded in subclasses to further improve self.text."""
-        text = self.repair_ocr_text(OCR_REPAIRS, self.text.lstrip('\ufeff').strip())  # remove BOM
+        text = self.repair_ocr_text(OCR_REPAIRER, self.text.lstrip('\ufeff').strip())  # remove BOM
 
         lines = [
             line.strip() if self.STRIP_WHITESPACE else line for line in text.split('\n')
@@ -779,13 +800,13 @@ class Document(LoggingEntity):
 
         if self._config.category == Interesting.MONEY:
             self._debug_log(f"applying MONEY_OCR_REPAIRS")
-            text = self.repair_ocr_text(MONEY_OCR_REPAIRS, '\n'.join(lines))
+            text = self.repair_ocr_text(MONEY_OCR_REPAIRER, '\n'.join(lines))
             lines = text.split('\n')
 
         self._set_text(text=collapse_newlines('\n'.join(lines)))
 
     def _set_text(self, lines: list[str] | None = None, text: str | None = None) -> None:
-        """Set `self.text` and `self.lines` based on arguments passed."""
+        """Set `self.text` based on arguments passed and throw away anything derived from the old text."""
         if lines and text:
             raise RuntimeError(f"[{self.filename}] Either 'lines' or 'text' arg must be provided (got both)")
         elif lines is not None:
@@ -796,7 +817,8 @@ class Document(LoggingEntity):
             raise RuntimeError(f"[{self.filename}] Either 'lines' or 'text' arg must be provided (neither was)")
 
         # logger.debug(f"_set_text() set self.text to\n---\n{self.text}\n---")
-        self.lines = [line.strip() if self.STRIP_WHITESPACE else line for line in self.text.split('\n')]
+        for cache_field in self.TEXT_CACHE_FIELDS:
+            setattr(self, cache_field, None)
 
     def _skipped_file_txt(self, reason: str | Text) -> Text:
         txt = Text(f"Skipping ", f"{INFO_STYLE} dim").append(self.file_info.external_link_txt(self.author_style))
@@ -830,6 +852,14 @@ class Document(LoggingEntity):
             self._log(f"created tmp file '{tmp_doc_file.name}' ({file_size_str(tmp_path)})")
             yield Path(tmp_doc_file.name)
 
+    def __getstate__(self) -> dict:
+        """
+        Don't pickle `TEXT_CACHE_FIELDS`; they're rebuilt from `text` on demand and would duplicate it.
+        Don't pickle `text` either if it's been written to `TEXT_STORE`.
+        """
+        excluded_fields = self.TEXT_CACHE_FIELDS + (['text'] if self._text_ref else [])
+        return {k: v for k, v in self.__dict__.items() if k not in excluded_fields}
+
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
         """Default `Document` renderer (Email and MessengerLog override this)."""
         yield self.make_layout()
@@ -0,0 +1,68 @@
+"""
+Index of the attachments listed in every email's header (and the MIME attachments of Dropsite .eml files).
+"""
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from epstein_files.util.helpers.string_helper import collapse_whitespace
+from epstein_files.util.logging import logger
+
+EXTENSION_REGEX = re.compile(r"\.([a-z0-9]{1,5})$")
+SPREADSHEET_EXTENSIONS = ['csv', 'numbers', 'ods', 'xls', 'xlsm', 'xlsx']
+
+
+def normalize_attachment_name(name: str) -> str:
+    """Lowercase with whitespace collapsed and quotes / angle brackets removed, e.g. '"Scan  1.PDF"' -> 'scan 1.pdf'."""
+    return collapse_whitespace(name).strip(' "\'<>').lower()
+
+
+def attachment_extension(name: str) -> str:
+    """Extension of a normalized attachment name without the dot ('' if there isn't one)."""
+    return extension_match.group(1) if (extension_match := EXTENSION_REGEX.search(name)) else ''
+
+
+@dataclass
+class AttachmentIndex:
+    """
+    Maps normalized attachment filenames and extensions to the emails that carry them. Like `PhoneNumberIndex`
+    it only holds file IDs so it can be pickled along with the `Document` objects.
+
+    Attributes:
+        by_extension (dict[str, list[str]]): IDs of the emails with an attachment with each extension
+        by_name (dict[str, list[str]]): IDs of the emails with an attachment with each normalized name
+    """
+    by_extension: dict[str, list[str]] = field(default_factory=dict)
+    by_name: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, emails: Sequence['Email']) -> 'AttachmentIndex':
+        """Alternate constructor that reads the attachments of every email in `emails`."""
+        by_extension = defaultdict(list)
+        by_name = defaultdict(list)
+
+        for email in emails:
+            names = set(normalize_attachment_name(a) for a in email.attachments)
+
+            for name in sorted(n for n in names if n):
+                by_name[name].append(email.file_id)
+
+            for extension in sorted(set(attachment_extension(n) for n in names) - {''}):
+                by_extension[extension].append(email.file_id)
+
+        logger.warning(f"Indexed {len(by_name):,} attachment names with {len(by_extension):,} extensions")
+        return cls(dict(by_extension), dict(by_name))
+
+    @property
+    def spreadsheet_email_ids(self) -> list[str]:
+        return self.email_ids_with_extension(*SPREADSHEET_EXTENSIONS)
+
+    def email_ids_with(self, attachment_name: str) -> list[str]:
+        """IDs of the emails with an attachment called `attachment_name` (after normalizing)."""
+        return self.by_name.get(normalize_attachment_name(attachment_name), [])
+
+    def email_ids_with_extension(self, *extensions: str) -> list[str]:
+        """IDs of the emails with an attachment with any of `extensions` (e.g. 'pdf' or '.PDF')."""
+        email_ids = [id for ext in extensions for id in self.by_extension.get(ext.lower().lstrip('.'), [])]
+        return list(dict.fromkeys(email_ids))
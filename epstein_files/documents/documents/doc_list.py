@@ -146,6 +146,11 @@ class DocList:
     def other_files(self) -> Sequence[OtherFile]:
         return OtherFile.filter_for_type(self.documents)
 
+    @property
+    def phone_log_files(self) -> list[DojFile]:
+        """DOJ files that are phone bills or call logs."""
+        return [f for f in self.doj_files if f.is_phone_log]
+
     @property
     def sorted_by_length(self) -> Sequence[Document]:
         """Sort by number of characters."""
@@ -29,9 +29,11 @@ FILE_PROPS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo(LoggingEntity):
     """
+    Every `Document` has one so it's slotted to save memory.
+
     Attributes:
 
         local_path (Path): local path of the document's underlying .txt file
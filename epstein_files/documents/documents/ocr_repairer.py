@@ -0,0 +1,119 @@
+"""
+Compiled form of the `OcrRepair` dicts used to fix up OCR text.
+"""
+import re
+from dataclasses import dataclass, field
+from re import _constants, _parser  # type: ignore[attr-defined]
+
+from epstein_files.util.constant.strings import OcrRepair
+from epstein_files.util.logging import logger
+
+MIN_REQUIRED_LITERAL_LENGTH = 1
+
+
+@dataclass
+class OcrRepairStep:
+    """
+    One entry of an `OcrRepair` dict plus a cheap test that can rule out a match before running the regex.
+
+    Attributes:
+        pattern (re.Pattern | str): regex or literal string to replace
+        replacement (str): replacement string (can contain backreferences if `pattern` is a regex)
+        required (str): literal substring every match of `pattern` must contain ('' if none could be found)
+        _required_regex (re.Pattern | None): case insensitive search for `required` if `pattern` is `re.IGNORECASE`
+    """
+    pattern: re.Pattern | str
+    replacement: str
+    required: str = field(init=False)
+    _required_regex: re.Pattern | None = field(init=False)
+
+    def __post_init__(self):
+        if isinstance(self.pattern, str):
+            self.required = self.pattern
+            self._required_regex = None
+        else:
+            self.required = required_literal(self.pattern)
+            is_ignorecase = bool(self.pattern.flags & re.IGNORECASE)
+            self._required_regex = re.compile(re.escape(self.required), re.IGNORECASE) if is_ignorecase else None
+
+    def apply(self, text: str) -> str:
+        if isinstance(self.pattern, str):
+            return text.replace(self.pattern, self.replacement)
+        elif self.could_match(text):
+            return self.pattern.sub(self.replacement, text)
+        else:
+            return text
+
+    def could_match(self, text: str) -> bool:
+        if not self.required:
+            return True
+        elif self._required_regex:
+            return bool(self._required_regex.search(text))
+        else:
+            return self.required in text
+
+
+@dataclass
+class OcrRepairer:
+    """
+    Applies the repairs in an `OcrRepair` dict in order, which matters because some repairs depend on earlier ones.
+    Regexes are only run if the text contains a literal substring that every match of the regex has to contain
+    (extracted from the parsed regex when it's compiled) so most of them are never run against most documents.
+
+    Attributes:
+        steps (list[OcrRepairStep]): compiled repairs in the same order as the `OcrRepair` dict
+    """
+    steps: list[OcrRepairStep]
+
+    @classmethod
+    def compile(cls, repairs: OcrRepair) -> 'OcrRepairer':
+        """Compile `repairs` (do this once, where the dict is defined, not every time it's applied)."""
+        steps = [OcrRepairStep(pattern, replacement) for pattern, replacement in repairs.items()]
+        num_regexes = len([s for s in steps if isinstance(s.pattern, re.Pattern)])
+        num_prefiltered = len([s for s in steps if isinstance(s.pattern, re.Pattern) and s.required])
+        logger.debug(f"Compiled {len(steps)} OCR repairs ({num_prefiltered} of {num_regexes} regexes have a prefilter)")
+        return cls(steps)
+
+    def repair(self, text: str) -> str:
+        for step in self.steps:
+            text = step.apply(text)
+
+        return text
+
+
+def required_literal(pattern: re.Pattern) -> str:
+    """
+    Longest run of literal characters that every match of `pattern` has to contain. Only mandatory
+    (not repeated, optional, or alternated) parts of the pattern are considered. Returns '' if there's no
+    such run at least `MIN_REQUIRED_LITERAL_LENGTH` long or if the pattern can't be analyzed.
+    """
+    if not isinstance(pattern.pattern, str):
+        return ''
+
+    try:
+        runs = _literal_runs(_parser.parse(pattern.pattern, pattern.flags))
+    except Exception as e:
+        logger.info(f"Failed to find required literal for {pattern.pattern!r}: {e}")
+        return ''
+
+    longest = max(runs, key=len, default='')
+    return longest if len(longest) >= MIN_REQUIRED_LITERAL_LENGTH else ''
+
+
+def _literal_runs(nodes) -> list[str]:
+    """Runs of consecutive `LITERAL` nodes in a parsed regex, recursing into (non case toggling) groups."""
+    runs = ['']
+
+    for op, arg in nodes:
+        if op is _constants.LITERAL:
+            runs[-1] += chr(arg)
+            continue
+
+        runs.append('')
+
+        # arg is (group number, add flags, del flags, subpattern)
+        if op is _constants.SUBPATTERN and not ((arg[1] | arg[2]) & re.IGNORECASE):
+            runs.extend(_literal_runs(arg[3]))
+            runs.append('')
+
+    return runs
@@ -0,0 +1,79 @@
+"""
+Index of every phone number mentioned anywhere in the corpus.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import NamedTuple, Sequence
+
+from epstein_files.documents.emails.emailers import ENTITY_INDEX
+from epstein_files.people.entity import Entity
+from epstein_files.util.constant.strings import PHONE_NUMBER_REGEX
+from epstein_files.util.helpers.string_helper import clean_phone_number
+from epstein_files.util.logging import logger
+
+BAD_PHONE_NUMBER_PREFIXES = ['0000', '1111', '4444444']
+US_COUNTRY_CODE = '1'
+US_PHONE_NUMBER_LENGTH = 10
+
+
+class PhoneNumberMention(NamedTuple):
+    file_id: str
+    offset: int  # char offset of the match in the document's text
+
+
+def normalize_phone_number(number: str) -> str:
+    """Strip punctuation and the leading '1' from US numbers so e.g. '+1 (212) 555-1212' becomes '2125551212'."""
+    number = clean_phone_number(number)
+
+    if len(number) == US_PHONE_NUMBER_LENGTH + 1 and number.startswith(US_COUNTRY_CODE):
+        return number[1:]
+    else:
+        return number
+
+
+@dataclass
+class PhoneNumberIndex:
+    """
+    Maps normalized phone numbers to every place they appear in the corpus. Only contains IDs and offsets
+    so it can be pickled along with the `Document` objects and loaded instead of rescanning all the text.
+
+    Attributes:
+        mentions (dict[str, list[PhoneNumberMention]]): where each number appears, keyed by normalized number
+    """
+    mentions: dict[str, list[PhoneNumberMention]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, docs: Sequence['Document']) -> 'PhoneNumberIndex':
+        """Alternate constructor that scans the text of `docs` for phone numbers."""
+        mentions = defaultdict(list)
+
+        for doc in docs:
+            for match in PHONE_NUMBER_REGEX.finditer(doc.text):
+                number = normalize_phone_number(match.group(0))
+
+                if not any(number.startswith(prefix) for prefix in BAD_PHONE_NUMBER_PREFIXES):
+                    mentions[number].append(PhoneNumberMention(doc.file_id, match.start()))
+
+        logger.warning(f"Indexed {sum(len(m) for m in mentions.values()):,} mentions of {len(mentions):,} phone numbers")
+        return cls(dict(mentions))
+
+    @property
+    def known_numbers(self) -> dict[str, Entity]:
+        """Indexed numbers that belong to a known `Entity` (see `PHONE_BOOK`)."""
+        return {number: entity for number in self.mentions if (entity := self.entity_for(number))}
+
+    def entity_for(self, number: str) -> Entity | None:
+        """The `Entity` with `number` in the `PHONE_BOOK`, if any."""
+        number = normalize_phone_number(number)
+        return ENTITY_INDEX.get_by_phone_number(number) or ENTITY_INDEX.get_by_phone_number(US_COUNTRY_CODE + number)
+
+    def file_ids_for(self, number: str) -> list[str]:
+        """IDs of the documents that mention `number` in the order they were indexed."""
+        return list(dict.fromkeys(m.file_id for m in self.mentions_of(number)))
+
+    def mentions_of(self, number: str) -> list[PhoneNumberMention]:
+        return self.mentions.get(normalize_phone_number(number), [])
+
+    def mentions_of_entity(self, entity: Entity) -> dict[str, list[PhoneNumberMention]]:
+        """Mentions of each of `entity`'s phone numbers that appear in the corpus."""
+        return {n: mentions for n in entity.phone_numbers if (mentions := self.mentions_of(n))}
@@ -0,0 +1,140 @@
+"""
+Memory-mapped blob file holding the text of every `Document` so the pickle only needs to hold offsets.
+"""
+import mmap
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Iterable, NamedTuple, cast
+from uuid import uuid4
+
+from epstein_files.util.env import args
+from epstein_files.util.logging import logger
+
+BLOB_ID_LENGTH = 32  # uuid4().hex
+TEXT_STORE_SUFFIX = '.texts'
+TEXT_ENCODING = 'utf-8'
+
+
+class TextRef(NamedTuple):
+    blob_id: str  # ID of the blob file the text was written to
+    offset: int   # byte offset of the text (after the blob ID header)
+    length: int   # length of the text in bytes
+
+
+@dataclass
+class TextStore:
+    """
+    All the texts are written into one UTF-8 blob file that starts with a random ID. The file is read with
+    `mmap` so opening it is instant, only the texts that are actually used get decoded, and processes that
+    read the same file (e.g. the different site builds) share its pages through the OS page cache.
+    Each blob gets its own file named after its ID so writing a new one never touches a blob another process
+    has mapped; old blobs are only removed by `remove_stale_blobs()` once the pickle pointing at the new one
+    has been written.
+
+    Attributes:
+        path (Path): base location of the blob files (the blob ID is inserted before the suffix)
+        _blob_id (str): ID of the blob that's currently mapped
+        _mmap (mmap.mmap, optional): the mapped blob file
+    """
+    path: Path
+    _blob_id: str = field(default='', init=False)
+    _mmap: mmap.mmap | None = field(default=None, init=False, repr=False)
+
+    def blob_path(self, blob_id: str) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{blob_id}{self.path.suffix}")
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            self._blob_id = ''
+
+    def open(self, blob_id: str) -> None:
+        """Map the blob file for `blob_id`. Raises `OSError` if it's missing or `ValueError` if it's not that blob."""
+        if blob_id == self._blob_id:
+            return
+
+        with open(self.blob_path(blob_id), 'rb') as blob_file:
+            blob_mmap = mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if (header := blob_mmap[:BLOB_ID_LENGTH].decode(TEXT_ENCODING, errors='replace')) != blob_id:
+            blob_mmap.close()
+            raise ValueError(f"'{self.blob_path(blob_id)}' has blob ID '{header}' (rebuild with --overwrite-pickle)")
+
+        self.close()
+        self._blob_id = blob_id
+        self._mmap = blob_mmap
+
+    def read(self, ref: TextRef) -> str:
+        self.open(ref.blob_id)
+        start = BLOB_ID_LENGTH + ref.offset
+        return cast(mmap.mmap, self._mmap)[start:start + ref.length].decode(TEXT_ENCODING)
+
+    def remove_stale_blobs(self, blob_id: str) -> None:
+        """
+        Delete the blob files written before the one for `blob_id` (maps that are already open stay readable).
+        Newer blobs are left alone because another process may be about to write a pickle that points at them.
+        """
+        written_at = self.blob_path(blob_id).stat().st_mtime_ns
+
+        for blob_path in [self.path, *self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}")]:
+            try:
+                if blob_path.stat().st_mtime_ns < written_at:
+                    logger.info(f"Removing stale text blob '{blob_path}'")
+                    blob_path.unlink()
+            except FileNotFoundError:
+                continue  # Already removed by another process
+
+    def write(self, texts: Iterable[str]) -> list[TextRef]:
+        """Write a new blob file containing `texts` and return where each one was written, in order."""
+        blob_id = uuid4().hex
+        refs: list[TextRef] = []
+        offset = 0
+
+        with NamedTemporaryFile('wb', dir=self.path.parent, prefix=f"{self.path.name}.", delete=False) as blob_file:
+            try:
+                blob_file.write(blob_id.encode(TEXT_ENCODING))
+
+                for text in texts:
+                    encoded = text.encode(TEXT_ENCODING)
+                    blob_file.write(encoded)
+                    refs.append(TextRef(blob_id, offset, len(encoded)))
+                    offset += len(encoded)
+            except BaseException:
+                os.unlink(blob_file.name)
+                raise
+
+        os.replace(blob_file.name, self.blob_path(blob_id))
+        logger.warning(f"Wrote {len(refs):,} texts ({offset:,} bytes) to '{self.blob_path(blob_id)}'")
+        return refs
+
+
+class StoredText:
+    """
+    Descriptor for `Document.text`. Unpickled `Document` objects only have a `_text_ref` so the text is
+    decoded from `TEXT_STORE` (and kept) the first time it's read. Setting the text discards the `_text_ref`.
+    """
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj, objtype=None) -> str:
+        if obj is None:
+            return ''  # Default value for the dataclass field
+
+        if self.name not in obj.__dict__:
+            obj.__dict__[self.name] = TEXT_STORE.read(obj._text_ref)
+
+        return obj.__dict__[self.name]
+
+    def __set__(self, obj, value: str) -> None:
+        obj.__dict__[self.name] = value
+        obj.__dict__['_text_ref'] = None
+
+
+def text_store_path(pickle_path: Path | str) -> Path:
+    return Path(pickle_path).with_suffix(TEXT_STORE_SUFFIX)
+
+
+TEXT_STORE = TextStore(text_store_path(args.pickle_path))
@@ -0,0 +1,100 @@
+"""
+Chronological index of every email and text message exchanged between each pair of people.
+"""
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import NamedTuple, Sequence
+
+from epstein_files.documents.communication import Communication
+from epstein_files.documents.emails.constants import FALLBACK_TIMESTAMP
+from epstein_files.documents.messenger_log import MessengerLog
+from epstein_files.people.names import Name
+from epstein_files.util.logging import logger
+
+ParticipantPair = tuple[str, str]
+
+
+class TimelineEvent(NamedTuple):
+    timestamp: datetime
+    file_id: str
+    message_idx: int | None = None  # Position in `MessengerLog.messages` (None for emails)
+
+
+def participant_pair(name1: str, name2: str) -> ParticipantPair:
+    """Order doesn't matter: ('A', 'B') and ('B', 'A') are the same conversation."""
+    return (name1, name2) if name1 <= name2 else (name2, name1)
+
+
+@dataclass
+class TimelineIndex:
+    """
+    Merged, time sorted stream of emails and text messages for every pair of named participants. Emails are
+    one event each, `MessengerLog`s contribute one event per text message. Like `PhoneNumberIndex` it only
+    holds IDs so it can be pickled along with the `Document` objects.
+
+    Attributes:
+        events (dict[ParticipantPair, list[TimelineEvent]]): each pair's events, oldest first
+        _timestamps (dict[ParticipantPair, list[datetime]]): timestamps of the `events` (for bisecting)
+    """
+    events: dict[ParticipantPair, list[TimelineEvent]] = field(default_factory=dict)
+    _timestamps: dict[ParticipantPair, list[datetime]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, communications: Sequence[Communication]) -> 'TimelineIndex':
+        """
+        Alternate constructor. Duplicates and anything without a timestamp are skipped, as are unknown
+        (`None`) participants because there's no way to ask for them.
+        """
+        events = defaultdict(list)
+
+        for doc in communications:
+            if doc.is_duplicate or not doc.author:
+                continue
+
+            pairs = [participant_pair(doc.author, p) for p in doc.participants if p and p != doc.author]
+
+            if isinstance(doc, MessengerLog):
+                doc_events = [
+                    TimelineEvent(timestamp, doc.file_id, i)
+                    for i in range(len(doc.messages)) if (timestamp := doc.messages.timestamp_at(i))
+                ]
+            elif (timestamp := doc.timestamp_sort_key[0]) != FALLBACK_TIMESTAMP:
+                doc_events = [TimelineEvent(timestamp, doc.file_id)]
+            else:
+                continue
+
+            for pair in pairs:
+                events[pair].extend(doc_events)
+
+        index = cls()
+
+        for pair, pair_events in events.items():
+            pair_events.sort(key=lambda event: (event.timestamp, event.file_id, event.message_idx or 0))
+            index.events[pair] = pair_events
+            index._timestamps[pair] = [event.timestamp for event in pair_events]
+
+        logger.warning(f"Indexed {sum(len(e) for e in index.events.values()):,} timeline events for {len(index.events):,} pairs")
+        return index
+
+    def between(
+        self,
+        name1: Name,
+        name2: Name,
+        start: datetime | None = None,
+        end: datetime | None = None
+    ) -> list[TimelineEvent]:
+        """Events between `name1` and `name2` from `start` to `end` (inclusive, either can be left open)."""
+        if not (name1 and name2):
+            return []
+
+        pair = participant_pair(name1, name2)
+        timestamps = self._timestamps.get(pair, [])
+        start_idx = 0 if start is None else bisect_left(timestamps, start)
+        end_idx = len(timestamps) if end is None else bisect_right(timestamps, end)
+        return self.events.get(pair, [])[start_idx:end_idx]
+
+    def counterparties(self, name: Name) -> list[Name]:
+        """Everyone `name` has at least one event with."""
+        return sorted(p2 if p1 == name else p1 for p1, p2 in self.events if name in (p1, p2))
@@ -9,10 +9,14 @@ from rich.panel import Panel
 from rich.text import Text
 
 from epstein_files.documents.config.doc_cfg import DebugDict
-from epstein_files.documents.emails.constants import DOJ_EMAIL_OCR_REPAIRS, FALLBACK_TIMESTAMP
+from epstein_files.documents.documents.categories import Uninteresting
+from epstein_files.documents.doj_files.id_ranges import IdRangeIndex
+from epstein_files.documents.doj_files.phone_log import PhoneLog
+from epstein_files.documents.emails.constants import DOJ_EMAIL_OCR_REPAIRER, FALLBACK_TIMESTAMP
 from epstein_files.documents.other_file import OtherFile
 from epstein_files.output.highlight_config import get_style_for_category
 from epstein_files.output.layout_elements.left_bar_panel import LeftBarPanel
+from epstein_files.util.constant.strings import PHONE_LOG_FILE_ID
 from epstein_files.util.logging import logger
 from epstein_files.util.helpers.data_helpers import coerce_utc_strict, prefix_keys
 from epstein_files.util.helpers.rich_helpers import RAINBOW, no_bold
@@ -27,7 +31,7 @@ SINGLE_IMAGE_NO_TEXT = 'no text found in image(s)'
 WORD_REGEX = re.compile(r"[A-Za-z]{3,}")
 
 # From EFTA00000020 to EFTA00000344 there doesn't seem to be any text
-BAD_OCR_ID_RANGES = [
+BAD_OCR_ID_RANGES = IdRangeIndex.build([
     range(20, 345),
     range(347, 431),
     range(434, 646),
@@ -38,7 +42,7 @@ BAD_OCR_ID_RANGES = [
     range(1189, 1335),
     range(1396, 1484),
     range(1735, 1888),
-]
+])
 
 OTHER_DOC_URLS = {
     '245-22.pdf': 'https://www.justice.gov/multimedia/Court%20Records/Government%20of%20the%20United%20States%20Virgin%20Islands%20v.%20JPMorgan%20Chase%20Bank,%20N.A.,%20No.%20122-cv-10904%20(S.D.N.Y.%202022)/245-22.pdf'
@@ -265,7 +269,7 @@ class DojFile(OtherFile):
     def is_bad_ocr(self) -> bool:
         if self.file_id in BAD_OCR_FILE_IDS:
             return True
-        elif any(self.file_info.efta_id in r for r in BAD_OCR_ID_RANGES) and self.length < BAD_OCR_EMPTY_LENGTH:
+        elif self.file_info.efta_id in BAD_OCR_ID_RANGES and self.length < BAD_OCR_EMPTY_LENGTH:
             return True
         else:
             return not bool(WORD_REGEX.search(self.text))
@@ -277,6 +281,11 @@ class DojFile(OtherFile):
         return len(self.text.strip().removesuffix(NO_IMAGE_SUFFIX)) < MIN_VALID_LENGTH and \
             self.text.strip() != 'No Images Produced'
 
+    @property
+    def is_phone_log(self) -> bool:
+        """True for phone bills and call logs."""
+        return self.category == Uninteresting.PHONE_BILL or self.file_id == PHONE_LOG_FILE_ID
+
     @property
     def preview_chars(self) -> str:
         """Text at start of file stripped of newlinesfor display in tables and other cramped settings."""
@@ -309,6 +318,10 @@ class DojFile(OtherFile):
         else:
             return super().extract_timestamp()
 
+    def parse_phone_log(self) -> PhoneLog:
+        """Parse the call records out of the raw text of this file (see `is_phone_log`)."""
+        return PhoneLog.parse(self.raw_text(), self.file_id)
+
     def _debug_props(self) -> DebugDict:
         props = super()._debug_props()
         props.update(prefix_keys(self._debug_prefix, self.truthy_props(DEBUG_PROPS)))
@@ -338,7 +351,7 @@ class DojFile(OtherFile):
     def _repair(self) -> None:
         """Overloads superclass method."""
         super()._repair()
-        new_text = self.repair_ocr_text(DOJ_EMAIL_OCR_REPAIRS, self.text)
+        new_text = self.repair_ocr_text(DOJ_EMAIL_OCR_REPAIRER, self.text)
         self._set_text(text=self._remove_bad_lines(new_text))
         self._remove_number_only_lines()
 
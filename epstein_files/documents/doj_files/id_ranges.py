@@ -0,0 +1,75 @@
+"""
+Sorted, non-overlapping ranges of EFTA ids (e.g. stretches of files with unusable OCR text).
+"""
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class IdRangeIndex(Generic[T]):
+    """
+    Lookups of which range (if any) an EFTA id falls in are a binary search on the range starts so adding more
+    ranges doesn't make checking each of the ~20k DOJ files any slower. Each range can carry a label (e.g. the
+    DataSet number for data set boundaries).
+
+    Attributes:
+        ranges (list[range]): the ranges, sorted by start
+        labels (list[T | None]): label of each range in `ranges`
+        _starts (list[int]): start of each range in `ranges` (for bisecting)
+    """
+    ranges: list[range] = field(default_factory=list)
+    labels: list[T | None] = field(default_factory=list)
+    _starts: list[int] = field(default_factory=list)
+
+    def add(self, id_range: range, label: T | None = None) -> None:
+        """Insert `id_range`. Raises `ValueError` if it's empty, has a step or overlaps an existing range."""
+        if id_range.step != 1 or not id_range:
+            raise ValueError(f"Invalid id range {id_range}")
+
+        i = bisect_right(self._starts, id_range.start)
+
+        if (i > 0 and self.ranges[i - 1].stop > id_range.start) or \
+                (i < len(self.ranges) and self.ranges[i].start < id_range.stop):
+            raise ValueError(f"{id_range} overlaps an existing range")
+
+        self.ranges.insert(i, id_range)
+        self.labels.insert(i, label)
+        self._starts.insert(i, id_range.start)
+
+    def find(self, efta_id: int) -> range | None:
+        """The range containing `efta_id` (None if there isn't one)."""
+        if (i := self._find_idx(efta_id)) is not None:
+            return self.ranges[i]
+
+    def label_for(self, efta_id: int) -> T | None:
+        """Label of the range containing `efta_id` (None if there isn't one)."""
+        if (i := self._find_idx(efta_id)) is not None:
+            return self.labels[i]
+
+    def _find_idx(self, efta_id: int) -> int | None:
+        i = bisect_right(self._starts, efta_id) - 1
+
+        if i >= 0 and efta_id < self.ranges[i].stop:
+            return i
+
+    def __contains__(self, efta_id: int) -> bool:
+        return self._find_idx(efta_id) is not None
+
+    def __iter__(self) -> Iterator[range]:
+        return iter(self.ranges)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    @classmethod
+    def build(cls, ranges: Iterable[range]) -> 'IdRangeIndex':
+        """Alternate constructor for unlabeled ranges, which can be passed in any order."""
+        index = cls()
+
+        for id_range in ranges:
+            index.add(id_range)
+
+        return index
@@ -0,0 +1,141 @@
+"""
+Parse the call records out of the OCR text of phone bills / call logs.
+"""
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from epstein_files.util.helpers.string_helper import clean_phone_number
+from epstein_files.util.logging import logger
+
+TEL_LINE_PATTERN = r"Telephone ([1#IiN]|It)\s*(?P<phone>\d{10})"
+BILLING_LINE_PATTERN = r"Billing (#|l?[Ii]t?) (?P<billing_number>\d{10})"
+ACCOUNT_LINE_PATTERN = fr"(?i:^{TEL_LINE_PATTERN}\s*{BILLING_LINE_PATTERN}.*$)"
+JUNK_LINE_REGEX = re.compile(r"^(Billing questions|CARRIER|EFTA|PhCnt|ACCOUNT NUM|YRMODY|Call Region|DKVerizon|\*\*For detail|Fund Surcharg|If you have any|Initial|Local Calls|Long Distance Important|Municipal|Previously Billed|Screen Cnt|(Sub )?Total|To State/Local|These charges|Case #).*|^.{,6}(Federal Access|Monthly Charge|verizon\.com)", re.IGNORECASE)
+JUNK_LINE_MAX_LENGTH = 4
+
+INTL_PHONE_PATTERN = r"\d{11,14}"
+US_PHONE_PATTERN = r"\d{3}\s*\d{3}(-|\s*)\d{4}"
+
+CALL_LINE_PATTERNS = [
+    r"^\d{6}\s+[A-Z0-9]{5}\s+(?P<phone>\d{3}\s*\d{3}\s*\d{4})\s+.*",
+    r"\d+ ?\.?\s+\d{1,2}/\d{1,2}\s+\d{1,2}:\d{2}[ap]m\s*(?P<location>[\w ]*?)\s+(?P<phone>\d{3} \d{3}-\d{4}|\d{7,})[^\d]*.*",
+    fr"^(?P<phone>{INTL_PHONE_PATTERN}|{US_PHONE_PATTERN})$",
+    fr".*(?P<phone>{US_PHONE_PATTERN}) PRI.*",
+]
+
+# Line types in order of precedence
+ACCOUNT = 'account'
+BILLING = 'billing'
+CALL = 'call'
+TELEPHONE = 'telephone'
+
+
+def _line_type_pattern(line_type: str, pattern: str) -> str:
+    """Wrap `pattern` in a group named `line_type` and prefix its named groups with `line_type` so they're unique."""
+    return f"(?P<{line_type}>{pattern.replace('(?P<', f'(?P<{line_type}_')})"
+
+
+LINE_TYPE_PATTERNS = {
+    ACCOUNT: ACCOUNT_LINE_PATTERN,
+    BILLING: BILLING_LINE_PATTERN,
+    TELEPHONE: TEL_LINE_PATTERN,
+    **{f"{CALL}{i}": pattern for i, pattern in enumerate(CALL_LINE_PATTERNS)},
+}
+
+# One regex for all line types; the outermost group that matched (i.e. `lastgroup`) is the line type.
+# Alternation is tried in order so precedence is the same as trying the individual regexes one after another.
+PHONE_LOG_LINE_REGEX = re.compile('|'.join(_line_type_pattern(k, v) for k, v in LINE_TYPE_PATTERNS.items()))
+
+
+class PhoneCall(NamedTuple):
+    source: str
+    destination: str
+    billing: str
+    location: str = ''
+
+
+@dataclass
+class PhoneLog:
+    """
+    Call records parsed from a phone log along with running counts. Each line is matched against a single
+    combined regex so it's only scanned once no matter which (if any) of the line types it turns out to be.
+
+    Attributes:
+        file_id (str): ID of the document the calls were parsed from
+        calls (list[PhoneCall]): every call found, in order
+        billing_counts (Counter[str]): number of calls by billing number
+        destination_counts (Counter[str]): number of calls by destination number
+        source_counts (Counter[str]): number of calls by source number
+        counts_by_source (dict[str, Counter[str]]): number of calls by destination number for each source number
+        junk_lines (set[str]): lines that weren't parseable
+    """
+    file_id: str = ''
+    calls: list[PhoneCall] = field(default_factory=list)
+    billing_counts: Counter[str] = field(default_factory=Counter)
+    destination_counts: Counter[str] = field(default_factory=Counter)
+    source_counts: Counter[str] = field(default_factory=Counter)
+    counts_by_source: dict[str, Counter[str]] = field(default_factory=lambda: defaultdict(Counter))
+    junk_lines: set[str] = field(default_factory=set)
+
+    @classmethod
+    def parse(cls, text: str, file_id: str = '') -> 'PhoneLog':
+        """Alternate constructor that parses the lines of `text`."""
+        phone_log = cls(file_id)
+        billing_number = source_number = ''
+
+        for line in text.split('\n'):
+            line = line.strip()
+
+            if not (m := PHONE_LOG_LINE_REGEX.match(line)):
+                phone_log._record_junk_line(line)
+                continue
+
+            line_type = m.lastgroup
+
+            if line_type in [ACCOUNT, TELEPHONE] and (phone := m.group(f"{line_type}_phone")) != source_number:
+                logger.warning(f"{file_id} new account phone number encountered: {phone}")
+                source_number = phone
+
+            if line_type in [ACCOUNT, BILLING] and (billing := m.group(f"{line_type}_billing_number")) != billing_number:
+                logger.warning(f"{file_id} new account billing number encountered: {billing}")
+                billing_number = billing
+
+            if line_type.startswith(CALL):
+                location = m.groupdict().get(f"{line_type}_location") or ''
+                phone_log.record_call(source_number, m.group(f"{line_type}_phone"), billing_number, location)
+
+        return phone_log
+
+    @property
+    def billing_numbers(self) -> list[str]:
+        return list(self.billing_counts.keys())
+
+    @property
+    def source_numbers(self) -> list[str]:
+        return list(self.counts_by_source.keys())
+
+    def record_call(self, source: str, destination: str, billing: str, location: str = '') -> PhoneCall:
+        call = PhoneCall(clean_phone_number(source), clean_phone_number(destination), clean_phone_number(billing), location)
+        logger.debug(f"Found call from '{call.source}' to '{call.destination}' billing '{call.billing}'")
+        self.calls.append(call)
+        self.billing_counts[call.billing] += 1
+        self.destination_counts[call.destination] += 1
+        self.source_counts[call.source] += 1
+        self.counts_by_source[call.source][call.destination] += 1
+
+        if len(self.calls) % 1000 == 0:
+            logger.warning(f"Found {len(self.calls)} on {len(self.counts_by_source)} source phone numbers so far...")
+
+        return call
+
+    def _record_junk_line(self, line: str) -> None:
+        if line in self.junk_lines:
+            return
+        elif JUNK_LINE_REGEX.match(line) or len(line) <= JUNK_LINE_MAX_LENGTH:
+            logger.info(f"junk line: '{line}'")
+        else:
+            logger.warning(f"junk line: '{line}'")
+
+        self.junk_lines.add(line)
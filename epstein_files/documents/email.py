@@ -16,14 +16,15 @@ from rich.text import Text
 from epstein_files.documents.communication import Communication
 from epstein_files.documents.document import EXCERPT_STYLE
 from epstein_files.documents.documents.categories import Uninteresting
+from epstein_files.documents.documents.ocr_repairer import OcrRepairer
 from epstein_files.documents.config.doc_cfg import EMAIL_TRUNCATE_TO, SHORT_TRUNCATE_TO, DebugDict, Metadata
 from epstein_files.documents.config.email_cfg import EmailCfg
 from epstein_files.documents.doj_file import DojFile
 from epstein_files.documents.emails.constants import *
 from epstein_files.documents.emails.email_parts import EmailParts
-from epstein_files.documents.emails.email_header import (EMAIL_SIMPLE_HEADER_REGEX,
-     EMAIL_SIMPLE_HEADER_LINE_BREAK_REGEX, EmailHeader)
+from epstein_files.documents.emails.email_header import EMAIL_SIMPLE_HEADER_REGEX, EmailHeader
 from epstein_files.documents.emails.emailers import IDENTIFYING_REGEXES, IDENTIFIER_FALSE_ALARMS, extract_emailer_names
+from epstein_files.documents.emails.header_blocks import EMAIL_HEADER_BLOCK_SCANNER
 from epstein_files.documents.other_file import OtherFile
 from epstein_files.output.epstein_highlighter import highlighter
 from epstein_files.output.highlight_config import HIGHLIGHTED_NAMES, get_style_for_name
@@ -210,6 +211,8 @@ OCR_REPAIRS: OcrRepair = {
     re.compile(r"SONY ?(Court|Judge|(, |/)NY)", re.IGNORECASE): r'SDNY \1',
 }
 
+OCR_REPAIRER = OcrRepairer.compile(OCR_REPAIRS)
+
 METADATA_FIELDS = [
     'attachments',
     'attachment_file_ids',
@@ -240,9 +243,13 @@ class Email(Communication):
         signature_substitution_counts (dict[str, int]): Number of times a signature was replaced with
             <...snipped...> per name
 
+        _email_parts (EmailParts, optional): cached result of splitting the text into header and body, cleared
+            whenever the text or header changes and not saved in the pickle
         _header (EmailHeader): Header data extracted from the text (from/to/sent/subject etc).
         _line_merge_arguments (list[tuple[int] | tuple[int, int]]): preconfigured list of line merges that will fix up
             files from the HOUSE_OVERSIGHT_ collection in memory while leaving the source files untouched
+        _quoted_reply_idxs (dict[int, int | None], optional): cached results of `_idx_of_nth_quoted_reply()` keyed
+            by `n`, cleared whenever the text or header changes and not saved in the pickle
         _was_split_up (bool, optional): True if this file Email was one of the big ones that was split into pieces
             and thus should generally be hidden / not shown
     """
@@ -252,10 +259,15 @@ class Email(Communication):
     is_persons_first_email: bool = False
     sent_from_device: str | None = None
     signature_substitution_counts: dict[str, int] = field(default_factory=dict)  # defaultdict breaks asdict :(
+    _email_parts: EmailParts | None = None
     _header: EmailHeader | None = None
     _line_merge_arguments: list[tuple[int] | tuple[int, int]] = field(default_factory=list)
+    _quoted_reply_idxs: dict[int, int | None] | None = None
     _was_split_up: bool = False
 
+    HEADER_CACHE_FIELDS: ClassVar[list[str]] = ['_email_parts', '_quoted_reply_idxs']  # Derived from header, reset when it changes
+    TEXT_CACHE_FIELDS: ClassVar[list[str]] = Communication.TEXT_CACHE_FIELDS + HEADER_CACHE_FIELDS
+
     # Class variable logging how many headers we prettified while printing, kind of janky
     rewritten_header_ids: ClassVar[set[str]] = set([])
 
@@ -369,7 +381,7 @@ class Email(Communication):
     @property
     def display_text(self) -> str:
         """Config overrides what text should be displayed."""
-        return str(self.email_parts)
+        return self.email_parts.text
 
     @property
     def excerpt_style(self) -> str:
@@ -386,27 +398,18 @@ class Email(Communication):
         self._header = self._header or self.extract_header()
         return self._header
 
+    @header.setter
+    def header(self, header: EmailHeader) -> None:
+        self._header = header
+        self._reset_header_caches()
+
     @property
     def email_parts(self) -> EmailParts:
-        """Separate header chars from the rest of the email text."""
-        num_header_lines = self.header.num_header_rows
-
-        if self.header.should_rewrite_header:
-            header = self.header.rewrite_header()
-            lines = []
-
-            # TODO: Emails w/configured 'actual_text' are particularly broken; need to shuffle some lines
-            if (actual_text := self._config.actual_text) is not None:
-                lines.extend([cast(str, actual_text), '\n'])
-                num_header_lines += 1
+        """Separate header chars from the rest of the email text (computed once until the text changes)."""
+        if self._email_parts is None:
+            self._email_parts = self._extract_email_parts()
 
-            lines.extend(self.lines[num_header_lines:])
-            body = _add_line_breaks('\n'.join(lines))
-        else:
-            header = '\n'.join(self.lines[0:num_header_lines])
-            body = '\n'.join(self.lines[num_header_lines:])
-
-        return EmailParts(header, body)
+        return self._email_parts
 
     @property
     def html_margin_bottom(self) -> float:
@@ -648,6 +651,13 @@ class Email(Communication):
 
         return html
 
+    def update_header(self, **fields) -> None:
+        """Change fields of the `EmailHeader` in place (resets everything cached from the header)."""
+        for field_name, value in fields.items():
+            setattr(self.header, field_name, value)
+
+        self._reset_header_caches()
+
     def _attached_docs_table(self) -> Table | None:
         if not self.attached_docs:
             return None
@@ -735,14 +745,38 @@ class Email(Communication):
 
         return text.strip()
 
+    def _extract_email_parts(self) -> EmailParts:
+        """Split the text into header and body, rewriting the header if necessary."""
+        num_header_lines = self.header.num_header_rows
+
+        if self.header.should_rewrite_header:
+            header = self.header.rewrite_header()
+            lines = []
+
+            # TODO: Emails w/configured 'actual_text' are particularly broken; need to shuffle some lines
+            if (actual_text := self._config.actual_text) is not None:
+                lines.extend([cast(str, actual_text), '\n'])
+                num_header_lines += 1
+
+            lines.extend(self.lines[num_header_lines:])
+            body = _add_line_breaks('\n'.join(lines))
+        else:
+            header = '\n'.join(self.lines[0:num_header_lines])
+            body = '\n'.join(self.lines[num_header_lines:])
+
+        return EmailParts(header, body)
+
     def _idx_of_nth_quoted_reply(self, n: int = MAX_QUOTED_REPLIES) -> int | None:
         """Get position of the nth 'On June 12th, 1985 [SOMEONE] wrote:' style line in self.text."""
-        header_offset = len(self.header.header_chars)
-        text = self.text[header_offset:]
+        self._quoted_reply_idxs = self._quoted_reply_idxs or {}
 
-        for i, match in enumerate(QUOTED_REPLY_LINE_REGEX.finditer(text)):
-            if i >= n:
-                return match.end() + header_offset - 1
+        if n not in self._quoted_reply_idxs:
+            header_offset = len(self.header.header_chars)
+            text = self.text[header_offset:]
+            match = next((m for i, m in enumerate(QUOTED_REPLY_LINE_REGEX.finditer(text)) if i >= n), None)
+            self._quoted_reply_idxs[n] = None if match is None else match.end() + header_offset - 1
+
+        return self._quoted_reply_idxs[n]
 
     def _remove_bad_lines(self) -> None:
         """Get rid of crufty lines matching `BAD_LINE_REGEX`"""
@@ -759,18 +793,18 @@ class Email(Communication):
         # Apply custom repairs for DOJ files
         if self.file_info.is_doj_file:
             new_text = DojFile._remove_bad_lines(strip_pdfalyzer_panels(self.text))
-            self._set_text(text=self.repair_ocr_text(DOJ_EMAIL_OCR_REPAIRS, new_text))
+            self._set_text(text=self.repair_ocr_text(DOJ_EMAIL_OCR_REPAIRER, new_text))
 
         if BAD_FIRST_LINE_REGEX.match(self.lines[0]):
             self._set_text(lines=self.lines[1:])
 
         self._remove_bad_lines()
         self.__bespoke_repair_house_oversight_emails()
-        self._set_text(text=self.repair_ocr_text(OCR_REPAIRS, self.text))
+        self._set_text(text=self.repair_ocr_text(OCR_REPAIRER, self.text))
 
-        if self.file_id in SINGLE_EMAIL_OCR_REPAIRS:
+        if self.file_id in SINGLE_EMAIL_OCR_REPAIRERS:
             self._debug_log('applying bespoke OCR repairs')
-            self._set_text(text=self.repair_ocr_text(SINGLE_EMAIL_OCR_REPAIRS[self.file_id], self.text))
+            self._set_text(text=self.repair_ocr_text(SINGLE_EMAIL_OCR_REPAIRERS[self.file_id], self.text))
 
         self._repair_links_and_quoted_subjects()
         self._format_newlines_and_snip_signatures()
@@ -818,6 +852,10 @@ class Email(Communication):
         self._debug_log(f"----after line repair---\n" + '\n'.join(new_lines[0:20]) + "\n---")
         self._set_text(lines=new_lines)
 
+    def _reset_header_caches(self) -> None:
+        for cache_field in self.HEADER_CACHE_FIELDS:
+            setattr(self, cache_field, None)
+
     def _sent_from_device(self) -> str | None:
         """Find any 'Sent from my iPhone' style signature line if it exist in the 'actual_text'."""
         if (sent_from_match := SENT_FROM_REGEX.search(self.actual_text)):
@@ -967,8 +1005,8 @@ class Email(Communication):
 
 
 def _add_line_breaks(email_text: str) -> str:
-    text = EMAIL_SIMPLE_HEADER_LINE_BREAK_REGEX.sub(r'\n\1\n', email_text).strip()
-    # logger.debug(f"text after EMAIL_SIMPLE_HEADER_LINE_BREAK_REGEX _add_line_breaks()\n---\n{text}\n---")
+    text = EMAIL_HEADER_BLOCK_SCANNER.add_line_breaks(email_text).strip()
+    # logger.debug(f"text after EMAIL_HEADER_BLOCK_SCANNER _add_line_breaks()\n---\n{text}\n---")
     return FORWARDED_TOO_MUCH_SPACE_REGEX.sub(r'\1\n', text)
 
 
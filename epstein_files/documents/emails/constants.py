@@ -6,6 +6,7 @@ from copy import copy
 
 from dateutil.parser import parse
 
+from epstein_files.documents.documents.ocr_repairer import OcrRepairer
 from epstein_files.people.names import *
 from epstein_files.util.constant.strings import MONTHS, WEEKDAYS, REDACTED, RUSSIAN_WEEKDAYS, OcrRepair
 from epstein_files.util.env import args
@@ -125,6 +126,8 @@ DOJ_EMAIL_OCR_REPAIRS: dict[str | re.Pattern, str] = {
     re.compile(r"^Fran:", re.MULTILINE): 'From:',
 }
 
+DOJ_EMAIL_OCR_REPAIRER = OcrRepairer.compile(DOJ_EMAIL_OCR_REPAIRS)
+
 # Device signatures ("Sent from my iPhone" regexes etc)
 SENT_FROM_DEVICE_PREFIXES = [
     r"Empower your Business",
@@ -485,6 +488,8 @@ SINGLE_EMAIL_OCR_REPAIRS: dict[str, OcrRepair] = {
     'EFTA00703417': {r"It's a first, but the buyer's\nanonymous": "It's a first, but the buyer's anonymous"},
 }
 
+SINGLE_EMAIL_OCR_REPAIRERS = {file_id: OcrRepairer.compile(repairs) for file_id, repairs in SINGLE_EMAIL_OCR_REPAIRS.items()}
+
 # Arguments to Email._merge_lines(). Note the line repair happens *after* 'Importance: High' is removed
 LINE_REPAIR_MERGES = {
     '013405': [[4]] * 2,
@@ -2,9 +2,12 @@ from dataclasses import dataclass, field
 from email import policy
 from email.message import EmailMessage
 from email.parser import BytesParser
+from pathlib import Path
+from typing import NamedTuple
 
 from epstein_files.documents.emails.email_header import EmailHeader
 from epstein_files.documents.email import Email
+from epstein_files.util.file_cache import FileCache
 from epstein_files.util.logging import logger
 from epstein_files.util.constant.strings import AUTHOR
 
@@ -21,19 +24,52 @@ HEADERS_TO_CHECK = [
 
 DEFAULT_EML_HEADERS = HEADERS_TO_CHECK + ['Date', 'From', 'Subject', 'To', 'MIME-Version', 'Content-Length']
 HEADER_FIELDS = [AUTHOR, 'sent_at', 'to', 'subject']
+BODY_PREFERENCE = ('plain', 'related', 'html')
+EML_CACHE_MAX_ENTRIES = 256
+
+
+class ParsedEml(NamedTuple):
+    message: EmailMessage   # The MIME structure
+    body: str               # Decoded text of the preferred body part
+    attachments: list[str]  # Filenames of the attachments (in the order they appear)
+
+
+def parse_eml(path: Path) -> ParsedEml:
+    with open(path, 'rb') as fp:
+        message = BytesParser(policy=policy.default).parse(fp)
+
+    body = message.get_body(BODY_PREFERENCE).get_content()
+    attachments = [part.get_filename() or '' for part in message.iter_attachments()]
+    return ParsedEml(message, body, attachments)
+
+
+# Shared by all DropsiteEmail objects
+EML_CACHE = FileCache(parse_eml, max_entries=EML_CACHE_MAX_ENTRIES)
 
 
 @dataclass
 class DropsiteEmail(Email):
-    _eml: EmailMessage = field(init=False)
+    """
+    Email loaded from an .eml file. Parsed .eml files are kept in the bounded `EML_CACHE` and never pickled;
+    only the attachment filenames are copied onto the object when the file is loaded.
+
+    Attributes:
+        eml_attachments (list[str]): filenames of the .eml's MIME attachments
+    """
+    eml_attachments: list[str] = field(default_factory=list)
+
+    @property
+    def attachments(self) -> list[str]:
+        """Overrides superclass to include the .eml's MIME attachments."""
+        return super().attachments + self.eml_attachments
 
     @property
     def eml(self) -> EmailMessage:
-        if '_eml' not in dir(self):
-            with open(self.file_path, 'rb') as fp:
-                self._eml = BytesParser(policy=policy.default).parse(fp)
+        return self.parsed_eml.message
 
-        return self._eml
+    @property
+    def parsed_eml(self) -> ParsedEml:
+        return EML_CACHE.load(self.file_path)
 
     def extract_header(self) -> EmailHeader:
         """Extract an `EmailHeader` from the OCR text."""
@@ -57,5 +93,6 @@ class DropsiteEmail(Email):
 
     def _load_file(self) -> str:
         """Remove BOM and HOUSE OVERSIGHT lines, strip whitespace."""
-        body = self.eml.get_body(('plain', 'related', 'html')).get_content()
-        return f"{self.header.rewrite_header()}\n{body}"
+        parsed_eml = self.parsed_eml
+        self.eml_attachments = parsed_eml.attachments
+        return f"{self.header.rewrite_header()}\n{parsed_eml.body}"
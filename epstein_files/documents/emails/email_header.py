@@ -1,6 +1,8 @@
 import json
 import re
-from dataclasses import asdict, dataclass, field
+from copy import copy
+from dataclasses import dataclass, field, fields
+from functools import cache
 
 from epstein_files.documents.config.doc_cfg import Metadata
 from epstein_files.documents.config.email_cfg import EmailCfg
@@ -17,17 +19,24 @@ ON_BEHALF_OF = 'on behalf of'
 TO_FIELDS = ['bcc', 'cc', 'to']
 EMAILER_FIELDS = [AUTHOR] + TO_FIELDS
 
+# Header field names whose EmailHeader property isn't just the lowercased name
+HEADER_FIELD_PROPERTIES = {
+    'bee': 'bcc',
+    'date': 'sent_at',
+    'from': AUTHOR,
+    'sent': 'sent_at',
+}
+
 DETECT_EMAIL_REGEX = re.compile(r'^(.*\n){0,2}(From|Subject):')  # IDed 140 emails out of 3777 DOJ files with just 'From:' match
 HEADER_REGEX_STR = fr"(((?:(?:{HEADER_FIELDS_PATTERN}):|on behalf of ?)(?! +(by |from my|via )).*\n){{3,}})"
 EMAIL_HEADER_FIELDS_PATTERN = join_patterns(EMAIL_HEADER_FIELD_PATTERNS)
 EMAIL_SIMPLE_HEADER_REGEX = re.compile(rf'^{HEADER_REGEX_STR}')
-EMAIL_SIMPLE_HEADER_LINE_BREAK_REGEX = re.compile(fr"(((?:(?:{EMAIL_HEADER_FIELDS_PATTERN}):|on behalf of ?)(?! +(by |from my|via )).*\n){{3,}})")
-EMAIL_PRE_FORWARD_REGEX = re.compile(r"(.{3,2000}?)" + HEADER_REGEX_STR, re.DOTALL)  # Match up to the next email header section
+HEADER_LINE_REGEX = re.compile(fr"^\s*(?:(?i:{ON_BEHALF_OF})(?P<on_behalf_of>.*)|(?P<key>[^:\n]*):(?P<value>.*))$", re.MULTILINE)
 
-CONFIGURED_ACTUAL_TEXTS = [
+CONFIGURED_ACTUAL_TEXTS = {
     cfg.actual_text for cfg in CONFIGS_BY_ID.values()
     if isinstance(cfg, EmailCfg) and cfg.actual_text is not None
-]
+}
 
 NON_HEADER_FIELDS = [
     'field_names',
@@ -70,20 +79,18 @@ class EmailHeader:
         field_names = []
         should_log_header = False
 
-        for line in [l.strip() for l in header.strip().split('\n')]:
-            if line.lower().startswith(ON_BEHALF_OF):
-                author = line.removeprefix(ON_BEHALF_OF).strip()
+        for line in HEADER_LINE_REGEX.finditer(header):
+            if line['on_behalf_of'] is not None:
+                author = line['on_behalf_of'].strip()
 
                 if len(author) > 0:
                     kw_args[AUTHOR] = author
 
                 continue
 
-            #logger.debug(f"extracting header line: '{line}'")
-            key, value = [element.strip() for element in line.split(':', 1)]
-            value = value.rstrip('_')
-            key = AUTHOR if key == 'From' else ('sent_at' if key in ['Date', 'Sent'] else key.lower().replace('-', '_'))
-            key = 'bcc' if key == 'bee' else key
+            #logger.debug(f"extracting header line: '{line[0]}'")
+            key = header_field_property(line['key'].strip())
+            value = line['value'].strip().rstrip('_')
 
             if kw_args.get(key):
                 logger.debug(f'Already have value "{kw_args[key]}" at key "{key}", not overwriting with "{value}"')
@@ -110,14 +117,13 @@ class EmailHeader:
     @property
     def all_attachments(self) -> list[str]:
         if self.attachments or self.inline_images:
-            attachments_str = join_truthy(self.attachments, self.inline_images, ';')
-            return [a.strip() for a in attachments_str.split(';')]
+            return list(split_attachments(join_truthy(self.attachments, self.inline_images, ';')))
         else:
             return []
 
     @property
     def is_empty(self) -> bool:
-        return not any(v for v in self.as_dict().values())
+        return not any(getattr(self, k) for k in EMAIL_HEADER_PROPERTIES)
 
     @property
     def is_to_redacted(self) -> bool:
@@ -135,7 +141,7 @@ class EmailHeader:
 
     def as_dict(self, truthy_only: bool = True) -> Metadata:
         """Remove housekeeping fields that don't actually come from the email."""
-        props = {k: v for k, v in asdict(self).items() if k not in NON_HEADER_FIELDS}
+        props = {k: copy(getattr(self, k)) for k in EMAIL_HEADER_PROPERTIES}
         return {k: v for k, v in props.items() if v} if truthy_only else props
 
     def repair_empty_header(self, email_lines: list[str]) -> None:
@@ -209,3 +215,20 @@ class EmailHeader:
 
     def __str__(self) -> str:
         return json.dumps(self.as_dict(truthy_only=False), sort_keys=True, indent=4)
+
+
+# Properties of `EmailHeader` that actually come from the email (cheaper than asdict() + filtering)
+EMAIL_HEADER_PROPERTIES = [f.name for f in fields(EmailHeader) if f.name not in NON_HEADER_FIELDS]
+
+
+@cache
+def header_field_property(field_name: str) -> str:
+    """Name of the `EmailHeader` property for a header field name like 'From' or 'Reply-To'."""
+    field_name = field_name.lower().replace('-', '_')
+    return HEADER_FIELD_PROPERTIES.get(field_name, field_name)
+
+
+@cache
+def split_attachments(attachments_str: str) -> tuple[str, ...]:
+    """Split a semicolon separated Attachments: field (cached because the same strings get split over and over)."""
+    return tuple(a.strip() for a in attachments_str.split(';'))
@@ -9,13 +9,22 @@ from epstein_files.output.epstein_highlighter import highlighter
 
 @dataclass
 class EmailParts:
-    """Simple container to hold the header and body strings for an email in separate variables."""
+    """
+    Simple container to hold the header and body strings for an email in separate variables.
+
+    Attributes:
+        header (str): header lines (possibly rewritten)
+        body (str): everything after the header
+        text (str): header and body joined back together, i.e. what actually gets displayed
+    """
     header: str
     body: str
+    text: str = field(init=False)
 
     def __post_init__(self):
         self.header = self.header.strip()
         self.body = self.body.strip()
+        self.text = f"{self.header}\n\n{self.body}"
 
     @property
     def header_txt(self) -> Text:
@@ -26,4 +35,4 @@ class EmailParts:
         return len(self.header)
 
     def __str__(self) -> str:
-        return f"{self.header}\n\n{self.body}"
+        return self.text
@@ -10,6 +10,7 @@ from epstein_files.documents.emails.constants import UNINTERESTING_EMAILERS
 from epstein_files.output.highlight_config import HIGHLIGHTED_ENTITIES
 from epstein_files.people.black_book import add_black_book_entities
 from epstein_files.people.entity import COMPANY_SUFFIX_REGEX, Entity, Organization
+from epstein_files.people.entity_index import EntityIndex
 from epstein_files.people.names import *
 from epstein_files.util.constant.strings import REDACTED
 from epstein_files.util.helpers.data_helpers import escape_single_quotes, flatten, groupby, uniq_sorted, without_falsey
@@ -111,12 +112,10 @@ add_black_book_entities(ENTITIES_DICT)
 ENTITY_CATEGORIES = groupby(CONFIGURED_ENTITIES, lambda entity: entity.category)
 
 
+# Every configured and black book Entity by name, alias, email address, and phone number
+ENTITY_INDEX = EntityIndex(list(ENTITIES_DICT.values()))
 # Keys are phone numbers, values are Entity objs
-PHONE_BOOK = {
-    phone_number: entity
-    for entity in ENTITIES_DICT.values()
-    for phone_number in entity.phone_numbers
-}
+PHONE_BOOK = ENTITY_INDEX.phone_book
 
 
 # Strings that usually signify an identity if present in email body
@@ -184,6 +183,8 @@ def get_entity(name: str | Entity, doc: Optional['Document'] = None) -> Entity:
         return ENTITIES_DICT[name]
     elif name in CONFIGURED_NON_ENTITIES:
         return CONFIGURED_NON_ENTITIES[name]  # Avoids spurious warnings
+    elif (entity := ENTITY_INDEX.get(name)):
+        return entity
     elif name not in UNCONFIGURED_ENTITIES_ENCOUNTERED:
         if name not in NO_WARNING_NAMES and '@' not in name:
             log = doc._warn if doc else logger.warning
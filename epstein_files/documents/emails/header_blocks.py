@@ -0,0 +1,93 @@
+"""
+Line by line scanner that finds the blocks of header fields (From:, Sent:, To:, etc.) embedded in email
+threads where replies and forwards start.
+"""
+import re
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from epstein_files.documents.emails.email_header import EMAIL_HEADER_FIELDS_PATTERN, ON_BEHALF_OF
+
+MIN_HEADER_BLOCK_LINES = 3
+NOT_A_HEADER_PATTERN = r"(?! +(by |from my|via ))"  # e.g. "Sent from my iPhone"
+
+
+class HeaderBlock(NamedTuple):
+    start: int  # Offset of the first field (which doesn't have to be at the start of its line)
+    end: int    # Offset just past the newline at the end of the block's last line
+
+
+@dataclass
+class HeaderBlockScanner:
+    """
+    Finds runs of at least `min_lines` consecutive lines that start with a header field. Only the first line
+    of a run can have the field in the middle of the line (OCR often glues a header onto the end of the
+    previous message). Gives the same results as a regex along the lines of `((field:.*\\n){3,})` but each line
+    is only looked at once instead of retrying the pattern at every offset in the text, so long and badly
+    OCR'd threads take time proportional to their length.
+
+    Attributes:
+        line_regex (re.Pattern): matches a header field at the start of a line
+        min_lines (int): minimum number of header lines in a block
+    """
+    line_regex: re.Pattern
+    min_lines: int = MIN_HEADER_BLOCK_LINES
+
+    def add_line_breaks(self, text: str) -> str:
+        """Put an empty line before and after every header block."""
+        pieces = []
+        position = 0
+
+        for block in self.find(text):
+            pieces.extend([text[position:block.start], '\n', text[block.start:block.end], '\n'])
+            position = block.end
+
+        pieces.append(text[position:])
+        return ''.join(pieces)
+
+    def find(self, text: str) -> list[HeaderBlock]:
+        blocks: list[HeaderBlock] = []
+        lines = text.split('\n')[:-1]  # The last line doesn't end with a newline so it can't be in a block
+        line_starts = [0]
+
+        for line in lines:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+
+        is_header_line = [self.line_regex.match(line) is not None for line in lines]
+        i = 0
+
+        while i <= len(lines) - self.min_lines:
+            if not all(is_header_line[i + 1:i + self.min_lines]):
+                i += 1
+                continue
+            elif is_header_line[i]:
+                start = line_starts[i]
+            elif (field_match := self.line_regex.search(lines[i])):
+                start = line_starts[i] + field_match.start()
+            else:
+                i += 1
+                continue
+
+            end_line = i + self.min_lines
+
+            while end_line < len(lines) and is_header_line[end_line]:
+                end_line += 1
+
+            blocks.append(HeaderBlock(start, line_starts[end_line]))
+            i = end_line
+
+        return blocks
+
+    def segments(self, text: str) -> list[str]:
+        """Split `text` into pieces that each start with a header block (except for any text before the first)."""
+        starts = [block.start for block in self.find(text)]
+        starts = starts if starts and starts[0] == 0 else [0] + starts
+        return [text[start:end] for start, end in zip(starts, starts[1:] + [len(text)]) if end > start]
+
+    @classmethod
+    def build(cls, field_pattern: str, min_lines: int = MIN_HEADER_BLOCK_LINES) -> 'HeaderBlockScanner':
+        """Alternate constructor that compiles a header line regex for `field_pattern`."""
+        return cls(re.compile(fr"(?:(?:{field_pattern}):|{ON_BEHALF_OF} ?){NOT_A_HEADER_PATTERN}"), min_lines)
+
+
+EMAIL_HEADER_BLOCK_SCANNER = HeaderBlockScanner.build(EMAIL_HEADER_FIELDS_PATTERN)
@@ -1,63 +1,140 @@
 import re
 from datetime import datetime
+from hashlib import md5
+from typing import Iterable, Iterator
 
 from epstein_files.documents.documents.doc_list import DocList
+from epstein_files.documents.documents.ocr_repairer import OcrRepairer
 from epstein_files.documents.email import Email
+from epstein_files.documents.emails.constants import FORWARDED_LINE_PATTERN, REPLY_REGEX
+from epstein_files.documents.emails.header_blocks import EMAIL_HEADER_BLOCK_SCANNER, MIN_HEADER_BLOCK_LINES, HeaderBlock
 from epstein_files.output.rich import console
 from epstein_files.people.names import (ADA_CLAPP, CHRISTOPHER_DILORIO, HEATHER_GRAY, JEFFREY_EPSTEIN,
      LEON_BLACK, MELANIE_SPINELLA, sort_names)
-from epstein_files.util.constant.strings import LEON_BLACK_EMAIL_ID, OcrRepair
+from epstein_files.util.constant.strings import LEON_BLACK_EMAIL_ID
+from epstein_files.util.constants import EMAIL_DUMP_IDS
 from epstein_files.util.env import args
-from epstein_files.util.helpers.data_helpers import groupby
 from epstein_files.util.logging import logger
 
 DILORIO_SPLIT = '\nFrom: Chris'
+ENDS_WITH_FORWARD_LINE_REGEX = re.compile(fr"{FORWARDED_LINE_PATTERN}\s*\Z", re.IGNORECASE)
+FORWARD_LINE_SEARCH_CHARS = 200  # Only check the end of each piece for a 'Forwarded message' line
 LEON_BLACK_EMAIL_REGEX = re.compile(r"^(From: .{,50}\nDate:|Date: ).*?(?=(From|Date|\Z))", re.DOTALL | re.MULTILINE)
 LEON_BLACK_FWD_REGEX = re.compile(r"^-+(Forwarded|Original) message-+", re.MULTILINE)
-LEON_BLACK_OCR_REPAIRS: OcrRepair = {re.compile('^ate: ', re.MULTILINE): 'Date: '}
+LEON_BLACK_OCR_REPAIRER = OcrRepairer.compile({re.compile('^ate: ', re.MULTILINE): 'Date: '})
+QUOTED_REPLY_SEPARATOR_REGEX = re.compile(r"^\s*[-_=*]{10,}\s*$")  # e.g. Outlook's line of underscores
 TO_JEFFREY_REGEX = re.compile(r"^Jeffrey-", re.MULTILINE)
 TO_LEON_REGEX = re.compile(r"^Leon,", re.MULTILINE)
 
+# A file is a dump of many emails if it has lots of header blocks and not much text per block
+MAX_CHARS_PER_DUMPED_EMAIL = 5_000
+MIN_DUMPED_EMAILS = 50
+
 
 def split_up_multi_email_files(big_emails: list[Email]) -> list[Email]:
     """
-    Some files have 100+ emails concatenated into one file so we split them up in a bespoke way.
+    Some files have 100+ emails concatenated into one file. Dilorio's and Leon Black's are split up in a
+    bespoke way, anything else is split at its header blocks by `split_up_email_dump()`.
     Has side effect of setting `_was_split_up=True` for all `big_emails` which removes them from
     `EpsteinFiles.documents` list so they can only be accessed through `EpsteinFiles._documents`.
     """
-    author_emails = groupby(big_emails, lambda e: e.author)
-    authors = sort_names([name for name in author_emails.keys()])
-    assert authors == [None, CHRISTOPHER_DILORIO], f"Unexpected author in big_emails: {authors}"
+    dilorio_emails = [e for e in big_emails if e.author == CHRISTOPHER_DILORIO]
+    leon_black_emails = [e for e in big_emails if e.file_id == LEON_BLACK_EMAIL_ID]
+    other_emails = [e for e in big_emails if not _is_bespoke_split(e)]
 
     for big_email in big_emails:
         big_email._was_split_up = True
 
     return [
-        *_split_up_dilorio_whistleblower_emails(author_emails[CHRISTOPHER_DILORIO]),
-        *_split_up_leon_black(author_emails[None]),
+        *(_split_up_dilorio_whistleblower_emails(dilorio_emails) if dilorio_emails else []),
+        *(_split_up_leon_black(leon_black_emails) if leon_black_emails else []),
+        *[email for big_email in other_emails for email in split_up_email_dump(big_email)],
     ]
 
 
+def detect_email_dump_ids(emails: list[Email]) -> set[str]:
+    """IDs of the emails that `is_email_dump()` flags (skipping the ones that are split up in a bespoke way)."""
+    return set(e.file_id for e in emails if not _is_bespoke_split(e) and is_email_dump(e))
+
+
+def find_email_dumps(emails: list[Email]) -> list[Email]:
+    """
+    The emails whose IDs are configured in `EMAIL_DUMP_IDS`. `is_email_dump()` is not run here; the test suite
+    checks `detect_email_dump_ids()` against `EMAIL_DUMP_IDS` so splitting up a new file is always a
+    deliberate config change that doesn't cost a scan of every email on every build.
+    """
+    dumps = [e for e in emails if e.file_id in EMAIL_DUMP_IDS]
+
+    if len(dumps) != len(EMAIL_DUMP_IDS):
+        missing_ids = EMAIL_DUMP_IDS - set(e.file_id for e in dumps)
+        logger.debug(f"EMAIL_DUMP_IDS not found among emails: {sorted(missing_ids)}")
+
+    return dumps
+
+
+def is_email_dump(email: Email) -> bool:
+    """
+    True if `email` looks like lots of emails concatenated together (judging by the density of headers).
+    Header blocks of quoted replies and forwards (e.g. after an 'Original message' line) don't count so
+    that long genuine reply threads aren't mistaken for dumps.
+    """
+    if email.num_lines < MIN_DUMPED_EMAILS * MIN_HEADER_BLOCK_LINES:
+        return False  # Not enough lines for enough header blocks, no need to scan
+
+    blocks = EMAIL_HEADER_BLOCK_SCANNER.find(email.text)
+    num_blocks = len([block for block in blocks if not _is_quoted_reply(email.text, block)])
+    return num_blocks >= MIN_DUMPED_EMAILS and email.length / num_blocks <= MAX_CHARS_PER_DUMPED_EMAIL
+
+
+def split_up_email_dump(big_email: Email) -> list[Email]:
+    """
+    Split `big_email` at every header block (except ones right after a 'Forwarded message' line). The pieces
+    are sliced out of the text one at a time and identical pieces are dropped by comparing content hashes.
+    """
+    starts = [block.start for block in EMAIL_HEADER_BLOCK_SCANNER.find(big_email.text)]
+    starts = starts if starts and starts[0] == 0 else [0] + starts
+    emails: list[Email] = []
+    content_hashes: set[str] = set()
+    num_dupes = num_skipped = 0
+    logger.warning(f"Splitting {big_email} into {len(starts)} pieces at its header blocks...")
+
+    for i, text in enumerate(_merge_forwards(_iter_pieces(big_email.text, starts)), 1):
+        content_hash = md5(text.encode()).hexdigest()
+
+        if content_hash in content_hashes:
+            num_dupes += 1
+            continue
+
+        content_hashes.add(content_hash)
+        email = Email(big_email.file_path.parent.joinpath(_new_file_stem(big_email, i)), text=text)
+
+        if not email.actual_text or email.timestamp is None:
+            email._warn(f"skipping sub email with no body or no timestamp...")
+            num_skipped += 1
+            continue
+
+        emails.append(email)
+
+    logger.warning(f"Created {len(emails)} Emails from {big_email}, skipped {num_dupes} dupes and {num_skipped} empty sub emails")
+    return emails
+
+
 def _split_up_dilorio_whistleblower_emails(dilorio_emails: list[Email]) -> list[Email]:
     """Dilorio is some kind of finance whistleblower. his emails are not Epstein related but very interesting."""
     sub_emails = []
     skipped = []
 
     for big_email in dilorio_emails:
-        texts = [
-            (f"{DILORIO_SPLIT}{t}" if i > 0 else t).strip()
-            for i, t in enumerate(big_email.text.split(DILORIO_SPLIT))
-        ]
-
-        logger.warning(f"Parsing {big_email} into {len(texts)} sub emails...")
+        split_idxs = _find_all(big_email.text, DILORIO_SPLIT)
+        logger.warning(f"Parsing {big_email} into {len(split_idxs) + 1} sub emails...")
 
-        for i, text in enumerate(texts, 1):
+        for i, text in enumerate(_iter_pieces(big_email.text, [0] + split_idxs), 1):
             new_file_stem = _new_file_stem(big_email, i)
             email = Email(big_email.file_path.parent.joinpath(new_file_stem), text=text)
             email.extracted_author = big_email.author
             email.extracted_recipients = [] if email.extracted_recipients == ['Rnignc Lapnai PP'] else email.extracted_recipients
             email.extracted_recipients = email.extracted_recipients or ['SEC']
-            email.header.to = email.header.to or ['SEC']  # avoids email being considered as having unknown recipient
+            email.update_header(to=email.header.to or ['SEC'])  # avoids email being considered as having unknown recipient
 
             if not email.actual_text or email.lines[-1].startswith('Subject:'):
                 email._warn(f"skipping empty {email.author} email...")
@@ -74,7 +151,7 @@ def _split_up_leon_black(big_emails: list[Email]) -> list[Email]:
     assert len(big_emails) == 1, f"have {len(big_emails)} Leon Black emails, should have 1"
     big_email = big_emails[0]
     assert big_email.file_id == LEON_BLACK_EMAIL_ID, f"wrong Leon Black email {big_email.file_id}"
-    big_text = big_email.repair_ocr_text(LEON_BLACK_OCR_REPAIRS, big_email.text)
+    big_text = big_email.repair_ocr_text(LEON_BLACK_OCR_REPAIRER, big_email.text)
     emails: list[Email] = []
     skipped = []
     fwded_email_text = ''
@@ -124,6 +201,48 @@ def _split_up_leon_black(big_emails: list[Email]) -> list[Email]:
     return _uniquify_by_timestamp(emails, [big_email], LEON_BLACK, len(skipped))
 
 
+def _find_all(text: str, substring: str) -> list[int]:
+    """Offsets of every occurrence of `substring` in `text`."""
+    idxs = []
+
+    while (idx := text.find(substring, idxs[-1] + 1 if idxs else 0)) >= 0:
+        idxs.append(idx)
+
+    return idxs
+
+
+def _is_bespoke_split(email: Email) -> bool:
+    return email.author == CHRISTOPHER_DILORIO or email.file_id == LEON_BLACK_EMAIL_ID
+
+
+def _is_quoted_reply(text: str, block: HeaderBlock) -> bool:
+    """True if the last line before `block` is a reply / forward line or a separator like Outlook's underscores."""
+    preceding_text = text[max(0, block.start - FORWARD_LINE_SEARCH_CHARS):block.start].rstrip()
+    last_line = preceding_text[preceding_text.rfind('\n') + 1:]
+    return bool(REPLY_REGEX.search(last_line) or QUOTED_REPLY_SEPARATOR_REGEX.match(last_line))
+
+
+def _iter_pieces(text: str, starts: list[int]) -> Iterator[str]:
+    """Yield the stripped text between consecutive `starts` one at a time instead of building a list of copies."""
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        yield text[start:end].strip()
+
+
+def _merge_forwards(texts: Iterable[str]) -> Iterator[str]:
+    """Glue pieces that end with a 'Forwarded message' line onto the forwarded email that comes after them."""
+    fwded_email_text = ''
+
+    for text in texts:
+        if ENDS_WITH_FORWARD_LINE_REGEX.search(text[-FORWARD_LINE_SEARCH_CHARS:]):
+            fwded_email_text += text + '\n'
+        elif text or fwded_email_text:
+            yield fwded_email_text + text
+            fwded_email_text = ''
+
+    if fwded_email_text:
+        yield fwded_email_text.strip()
+
+
 def _new_file_stem(email: Email, i: int) -> str:
     return email.file_info.file_stem + f'_{i}.txt'
 
@@ -0,0 +1,152 @@
+"""
+Column oriented storage for the `TextMessage` objects in a `MessengerLog`.
+"""
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator, cast
+
+from dateutil import tz
+
+from epstein_files.documents.emails.constants import FALLBACK_TIMESTAMP
+from epstein_files.documents.imessage.text_message import TextMessage
+from epstein_files.people.names import Name
+
+FALLBACK_EPOCH = FALLBACK_TIMESTAMP.timestamp()
+MAX_TEXT_SEARCHES = 10  # Give up looking for a message's text in the log after this many false matches
+NO_TEXT_START = -1
+
+epoch_to_datetime = lambda epoch: datetime.fromtimestamp(epoch, tz.UTC)
+
+
+@dataclass
+class MessageColumns(Sequence[TextMessage]):
+    """
+    A log's text messages stored as one column per `TextMessage` field instead of one object per message.
+    Authors are ids into a table of distinct names, timestamps are parsed once into epoch seconds and texts
+    are offsets into the text of the `document` they were parsed from. Indexing or iterating builds
+    lightweight `TextMessage` views on demand that don't have to re-parse their timestamps.
+
+    Attributes:
+        message_cls (type[TextMessage]): class of the views (`TextMessagePdf` parses timestamps differently)
+        names (list[Name]): distinct `author` and `author_str` values, pointed to by the id columns
+        author_ids (array): index into `names` of each message's `author`
+        author_str_ids (array): index into `names` of each message's `author_str`
+        confirmed (array): each message's `is_id_confirmed` as 0 or 1
+        timestamps (array): each message's timestamp in epoch seconds (`FALLBACK_EPOCH` if unparseable)
+        text_starts (array): where each message's text starts in `document.text` (`NO_TEXT_START` if the
+            text is in `other_texts`)
+        text_lengths (array): length of each message's text
+        other_texts (dict[int, str]): texts that aren't a slice of `document.text` (e.g. links, which have
+            their whitespace rewritten), keyed by message index
+        timestamp_strs (str): all the unparsed timestamp strings joined together
+        timestamp_str_offsets (array): where each message's timestamp string starts in `timestamp_strs`
+        document (Document, optional): document whose `text` the `text_starts` point into
+    """
+    message_cls: type[TextMessage] = TextMessage
+    names: list[Name] = field(default_factory=list)
+    author_ids: array = field(default_factory=lambda: array('I'))
+    author_str_ids: array = field(default_factory=lambda: array('I'))
+    confirmed: array = field(default_factory=lambda: array('b'))
+    timestamps: array = field(default_factory=lambda: array('d'))
+    text_starts: array = field(default_factory=lambda: array('q'))
+    text_lengths: array = field(default_factory=lambda: array('I'))
+    other_texts: dict[int, str] = field(default_factory=dict)
+    timestamp_strs: str = ''
+    timestamp_str_offsets: array = field(default_factory=lambda: array('I', [0]))
+    document: 'Document | None' = field(default=None, compare=False, repr=False)
+
+    def text_at(self, i: int) -> str:
+        if (start := self.text_starts[i]) == NO_TEXT_START:
+            return self.other_texts[i]
+
+        # TextMessage.__post_init__() turns the newlines in (non link) messages into spaces
+        return cast('Document', self.document).text[start:start + self.text_lengths[i]].replace('\n', ' ')
+
+    def timestamp_at(self, i: int) -> datetime | None:
+        """Parsed timestamp of the i-th message (None if it couldn't be parsed)."""
+        epoch = self.timestamps[i]
+        return None if epoch == FALLBACK_EPOCH else epoch_to_datetime(epoch)
+
+    def __getitem__(self, i: int | slice) -> TextMessage | list[TextMessage]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        elif i < 0:
+            i += len(self)
+
+        if not 0 <= i < len(self):
+            raise IndexError(f"message index {i} out of range")
+
+        return self.message_cls.view(
+            author=self.names[self.author_ids[i]],
+            author_str=self.names[self.author_str_ids[i]],
+            is_id_confirmed=bool(self.confirmed[i]),
+            text=self.text_at(i),
+            timestamp_str=self.timestamp_strs[self.timestamp_str_offsets[i]:self.timestamp_str_offsets[i + 1]],
+            timestamp=self.timestamp_at(i),
+        )
+
+    def __iter__(self) -> Iterator[TextMessage]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self) -> int:
+        return len(self.author_ids)
+
+    @classmethod
+    def build(cls, messages: list[TextMessage], document: 'Document | None' = None) -> 'MessageColumns':
+        """
+        Alternate constructor. Parses every message's timestamp once. If `document` is given each message's
+        text is looked for in `document.text` (in order) so only its offsets have to be stored.
+        """
+        columns = cls(type(messages[0]) if messages else TextMessage, document=document)
+        source = document.text if document else ''
+        name_ids: dict[Name, int] = {}
+        timestamp_strs: list[str] = []
+        position = 0
+
+        def name_id(name: Name) -> int:
+            if name not in name_ids:
+                name_ids[name] = len(columns.names)
+                columns.names.append(name)
+
+            return name_ids[name]
+
+        for i, message in enumerate(messages):
+            columns.author_ids.append(name_id(message.author))
+            columns.author_str_ids.append(name_id(message.author_str))
+            columns.confirmed.append(int(message.is_id_confirmed))
+            columns.timestamps.append(message.timestamp_sort_key.timestamp())
+            columns.text_lengths.append(len(message.text))
+            timestamp_strs.append(message.timestamp_str)
+            columns.timestamp_str_offsets.append(columns.timestamp_str_offsets[-1] + len(message.timestamp_str))
+
+            if message.is_link() or (start := _find_text(source, message.text, position)) is None:
+                columns.text_starts.append(NO_TEXT_START)
+                columns.other_texts[i] = message.text
+            else:
+                columns.text_starts.append(start)
+                position = start + len(message.text)
+
+        columns.timestamp_strs = ''.join(timestamp_strs)
+        return columns
+
+
+def _find_text(source: str, text: str, position: int) -> int | None:
+    """Offset of the first slice of `source` after `position` that's `text` once newlines become spaces."""
+    if not source:
+        return None
+
+    # The text before the first space can't contain a converted newline so it's in `source` verbatim
+    prefix = text.split(' ', 1)[0]
+
+    for _i in range(MAX_TEXT_SEARCHES):
+        if (start := source.find(prefix, position)) < 0:
+            return None
+        elif source[start:start + len(text)].replace('\n', ' ') == text:
+            return start
+
+        position = start + 1
+
+    return None
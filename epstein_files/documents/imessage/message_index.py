@@ -0,0 +1,123 @@
+"""
+Index of the text messages in a group of `MessengerLog` objects by author.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Sequence
+
+from epstein_files.documents.imessage.message_columns import FALLBACK_EPOCH, MessageColumns, epoch_to_datetime
+from epstein_files.documents.imessage.text_message import TextMessage
+from epstein_files.people.names import Name
+
+
+@dataclass
+class MessageIndex:
+    """
+    Text messages grouped by author and sorted by timestamp. Only positions are stored: each message is a
+    (log, message) pair of indexes into `columns` and `TextMessage` views are only built when they're asked
+    for. Lookups by time are binary searches on the timestamps `MessageColumns` already parsed.
+
+    Attributes:
+        counts (Counter[Name]): number of messages sent by each author (including unparseable timestamps)
+        columns (list[MessageColumns]): the messages of each indexed log
+        _column_idxs (dict[Name, array]): index into `columns` of each of an author's messages, oldest first
+        _message_idxs (dict[Name, array]): index of each of an author's messages in its `MessageColumns`
+        _timestamps (dict[Name, array]): epoch timestamps of an author's messages (for bisecting)
+    """
+    counts: Counter[Name] = field(default_factory=Counter)
+    columns: list[MessageColumns] = field(default_factory=list)
+    _column_idxs: dict[Name, array] = field(default_factory=dict)
+    _message_idxs: dict[Name, array] = field(default_factory=dict)
+    _timestamps: dict[Name, array] = field(default_factory=dict)
+
+    @property
+    def authors(self) -> list[Name]:
+        return list(self.counts.keys())
+
+    def first_message_at(self, author: Name) -> datetime | None:
+        """Earliest valid timestamp of a message sent by `author` (None if there aren't any)."""
+        return epoch_to_datetime(timestamps[0]) if (timestamps := self._timestamps.get(author)) else None
+
+    def for_subset(self, logs: Sequence['MessengerLog']) -> 'MessageIndex':
+        """Index of only the messages in `logs` (which must have been indexed) without re-sorting anything."""
+        column_idxs = {id(message_columns): i for i, message_columns in enumerate(self.columns)}
+
+        if (missing_ids := [log.file_id for log in logs if id(log.messages) not in column_idxs]):
+            raise ValueError(f"Logs {missing_ids} aren't in this MessageIndex")
+
+        kept_idxs = [column_idxs[id(log.messages)] for log in logs]
+
+        if sorted(kept_idxs) == list(range(len(self.columns))):
+            return self
+
+        new_idxs = {old_idx: new_idx for new_idx, old_idx in enumerate(kept_idxs)}
+        index = type(self)(columns=[self.columns[i] for i in kept_idxs])
+
+        for message_columns in index.columns:
+            index.counts.update(message_columns.names[author_id] for author_id in message_columns.author_ids)
+
+        for author, author_column_idxs in self._column_idxs.items():
+            kept = [i for i, column_idx in enumerate(author_column_idxs) if column_idx in new_idxs]
+
+            if kept:
+                index._timestamps[author] = array('d', [self._timestamps[author][i] for i in kept])
+                index._column_idxs[author] = array('I', [new_idxs[author_column_idxs[i]] for i in kept])
+                index._message_idxs[author] = array('I', [self._message_idxs[author][i] for i in kept])
+
+        return index
+
+    def last_message_at(self, author: Name) -> datetime | None:
+        """Latest valid timestamp of a message sent by `author` (None if there aren't any)."""
+        return epoch_to_datetime(timestamps[-1]) if (timestamps := self._timestamps.get(author)) else None
+
+    def messages_between(self, author: Name, start: datetime, end: datetime) -> list[TextMessage]:
+        """Messages sent by `author` between `start` and `end` (inclusive)."""
+        timestamps = self._timestamps.get(author, [])
+        start_idx = bisect_left(timestamps, start.timestamp())
+        return self._views(author, start_idx, bisect_right(timestamps, end.timestamp()))
+
+    def sorted_messages_by(self, author: Name) -> list[TextMessage]:
+        """Messages sent by `author` with valid timestamps, oldest first."""
+        return self._views(author, 0, len(self._timestamps.get(author, [])))
+
+    def _views(self, author: Name, start_idx: int, end_idx: int) -> list[TextMessage]:
+        """`TextMessage` views of the `start_idx`-th through (`end_idx` - 1)-th of `author`'s messages."""
+        if author not in self._column_idxs:
+            return []
+
+        column_idxs = self._column_idxs[author]
+        message_idxs = self._message_idxs[author]
+        return [self.columns[column_idxs[i]][message_idxs[i]] for i in range(start_idx, end_idx)]
+
+    @classmethod
+    def build(cls, messages: Iterable[TextMessage]) -> 'MessageIndex':
+        """Alternate constructor for loose messages. Messages with the same timestamp keep their order."""
+        return cls.for_columns([MessageColumns.build(list(messages))])
+
+    @classmethod
+    def for_columns(cls, columns: Sequence[MessageColumns]) -> 'MessageIndex':
+        index = cls(columns=list(columns))
+        timestamped = defaultdict(list)
+
+        for column_idx, message_columns in enumerate(index.columns):
+            authors = [message_columns.names[author_id] for author_id in message_columns.author_ids]
+            index.counts.update(authors)
+
+            for message_idx, (author, epoch) in enumerate(zip(authors, message_columns.timestamps)):
+                if epoch != FALLBACK_EPOCH:
+                    timestamped[author].append((epoch, column_idx, message_idx))
+
+        for author, positions in timestamped.items():
+            positions.sort(key=lambda position: position[0])
+            index._timestamps[author] = array('d', [epoch for epoch, _column_idx, _message_idx in positions])
+            index._column_idxs[author] = array('I', [column_idx for _epoch, column_idx, _message_idx in positions])
+            index._message_idxs[author] = array('I', [message_idx for _epoch, _column_idx, message_idx in positions])
+
+        return index
+
+    @classmethod
+    def for_logs(cls, logs: Sequence['MessengerLog']) -> 'MessageIndex':
+        return cls.for_columns([log.messages for log in logs])
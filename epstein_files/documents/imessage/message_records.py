@@ -0,0 +1,52 @@
+"""
+Tokenizer for the 'Sender:' / 'Time:' / 'Message:' records in iMessage log text files.
+"""
+import re
+from typing import NamedTuple
+
+MESSAGE_FIELD = 'Message:'
+NEXT_SENDER = '\nSender'
+SENDER_FIELD = 'Sender:'
+TIME_FIELD = '\nTime:'
+TIME_SUFFIX_REGEX = re.compile(r' [AP]M')
+
+
+class MessageRecord(NamedTuple):
+    sender: str     # Everything between 'Sender:' and the next line starting with 'Time:'
+    timestamp: str  # Everything after 'Time:' up to and including the first ' AM' or ' PM'
+    text: str       # Everything after the next 'Message:' up to the next line starting with 'Sender'
+
+
+def tokenize_messages(text: str) -> list[MessageRecord]:
+    """
+    Split iMessage log text into records with one forward scan. Gives the same results as
+    `MSG_REGEX.finditer()` but every search picks up where the last one left off so there's no backtracking.
+    """
+    records: list[MessageRecord] = []
+    position = 0
+
+    while (sender_idx := text.find(SENDER_FIELD, position)) >= 0:
+        sender_start = sender_idx + len(SENDER_FIELD)
+
+        if (time_idx := text.find(TIME_FIELD, sender_start)) < 0:
+            break
+
+        time_start = time_idx + len(TIME_FIELD)
+
+        if not (time_suffix := TIME_SUFFIX_REGEX.search(text, time_start)):
+            break
+        elif (message_idx := text.find(MESSAGE_FIELD, time_suffix.end())) < 0:
+            break
+
+        message_start = message_idx + len(MESSAGE_FIELD)
+
+        if (position := text.find(NEXT_SENDER, message_start)) < 0:
+            position = len(text)
+
+        records.append(MessageRecord(
+            text[sender_start:time_idx],
+            text[time_start:time_suffix.end()],
+            text[message_start:position].rstrip(),
+        ))
+
+    return records
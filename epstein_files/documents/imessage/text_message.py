@@ -1,4 +1,5 @@
 import re
+import sys
 from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Self
@@ -12,7 +13,7 @@ from epstein_files.output.epstein_highlighter import highlighter
 from epstein_files.output.highlight_config import get_style_for_name
 from epstein_files.output.rich import TEXT_LINK
 from epstein_files.people.names import (ANTHONY_SCARAMUCCI, JEFFREY_EPSTEIN, STEVE_BANNON, UNKNOWN, Name,
-     extract_last_name)
+     extract_last_name, intern_name)
 from epstein_files.util.constant.strings import TIMESTAMP_DIM
 from epstein_files.util.helpers.data_helpers import AMERICAN_DATE_FORMAT, coerce_utc_strict
 from epstein_files.util.logging import logger
@@ -28,14 +29,25 @@ DISPLAY_LAST_NAME_ONLY = [
 ]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TextMessage:
-    """Class representing a single iMessage text message."""
+    """
+    Class representing a single iMessage text message. Slotted because there's a lot of them.
+
+    Attributes:
+        author (Name): who sent the message
+        author_str (str): how to display the author
+        is_id_confirmed (bool): False if the author is a guess
+        text (str): the message
+        timestamp_str (str): the timestamp as it appears in the log
+        _timestamp (datetime, optional): parsed `timestamp_str` (set by `MessageColumns` when it makes views)
+    """
     author: Name
     author_str: str = ''
     is_id_confirmed: bool = False
     text: str
     timestamp_str: str
+    _timestamp: datetime | None = field(default=None, init=False)
 
     def __post_init__(self):
         self.author = JEFFREY_EPSTEIN if self.author in EPSTEIN_TEXTERS else self.author
@@ -50,6 +62,9 @@ class TextMessage:
         if not self.is_id_confirmed and self.author is not None and self.author != JEFFREY_EPSTEIN:
             self.author_str += UNCERTAIN_SUFFIX
 
+        self.author = intern_name(self.author)
+        self.author_str = sys.intern(self.author_str)
+
         if self.is_link():
             self.text = self.text.replace('\n', '').replace(' ', '_')
         else:
@@ -66,7 +81,7 @@ class TextMessage:
         return self.text.startswith('http')
 
     def parse_timestamp(self) -> datetime:
-        return coerce_utc_strict(datetime.strptime(self.timestamp_str, AMERICAN_DATE_FORMAT))
+        return self._timestamp or self._parse_timestamp_str()
 
     def timestamp_txt(self) -> Text:
         from epstein_files.util.env import site_config
@@ -79,6 +94,9 @@ class TextMessage:
 
         return Text(f"[{timestamp_str}]", style=TIMESTAMP_DIM)
 
+    def _parse_timestamp_str(self) -> datetime:
+        return coerce_utc_strict(datetime.strptime(self.timestamp_str, AMERICAN_DATE_FORMAT))
+
     def _message(self) -> Text:
         if self.is_link():
             try:
@@ -109,7 +127,9 @@ class TextMessage:
             key = _field.name
             value = getattr(self, key)
 
-            if key == 'author_str' and self.author and self.author_str.startswith(value):
+            if key.startswith('_'):
+                continue
+            elif key == 'author_str' and self.author and self.author_str.startswith(value):
                 continue
             elif isinstance(value, str):
                 add_prop(key, f'"{value}"')
@@ -117,3 +137,23 @@ class TextMessage:
                 add_prop(key, value)
 
         return f"{type(self).__name__}(" + ', '.join(props) + f')'
+
+    @classmethod
+    def view(
+        cls,
+        author: Name,
+        author_str: str,
+        is_id_confirmed: bool,
+        text: str,
+        timestamp_str: str,
+        timestamp: datetime | None
+    ) -> Self:
+        """Alternate constructor for values that were already cleaned up by `__post_init__()` once."""
+        message = object.__new__(cls)
+        message.author = author
+        message.author_str = author_str
+        message.is_id_confirmed = is_id_confirmed
+        message.text = text
+        message.timestamp_str = timestamp_str
+        message._timestamp = timestamp
+        return message
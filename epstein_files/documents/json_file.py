@@ -1,5 +1,6 @@
 import json
 from dataclasses import dataclass
+from pathlib import Path
 from typing import ClassVar
 
 from rich.text import Text
@@ -7,6 +8,7 @@ from rich.text import Text
 from epstein_files.documents.other_file import Metadata, OtherFile
 from epstein_files.output.rich import INFO_STYLE
 from epstein_files.util.constant.strings import JSON
+from epstein_files.util.file_cache import FileCache
 
 DESCRIPTION = "JSON data containing preview info for links sent in a messaging app like iMessage"
 
@@ -20,6 +22,15 @@ TEXT_FIELDS = [
 ]
 
 
+def load_json(path: Path) -> object:
+    with open(path, encoding='utf-8-sig') as f:
+        return json.load(f)
+
+
+# Shared by all JsonFile objects
+JSON_DATA_CACHE = FileCache(load_json)
+
+
 @dataclass
 class JsonFile(OtherFile):
     """File containing JSON data."""
@@ -49,8 +60,8 @@ class JsonFile(OtherFile):
         return Text(DESCRIPTION, style=INFO_STYLE)
 
     def json_data(self) -> object:
-        with open(self.file_path, encoding='utf-8-sig') as f:
-            return json.load(f)
+        """Parsed contents of the file (parsed once per process unless the file changes)."""
+        return JSON_DATA_CACHE.load(self.file_path)
 
     def json_str(self) -> str:
         return json.dumps(self.json_data(), indent=4)
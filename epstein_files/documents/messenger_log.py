@@ -1,7 +1,7 @@
 import re
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import ClassVar
 
 from rich.console import Console, ConsoleOptions, NewLine, RenderResult
 from rich.table import Table
@@ -9,7 +9,9 @@ from rich.text import Text
 
 from epstein_files.documents.communication import Communication
 from epstein_files.documents.config.doc_cfg import Metadata
-from epstein_files.documents.emails.constants import FALLBACK_TIMESTAMP
+from epstein_files.documents.imessage.message_columns import MessageColumns
+from epstein_files.documents.imessage.message_index import MessageIndex
+from epstein_files.documents.imessage.message_records import MessageRecord, tokenize_messages
 from epstein_files.documents.imessage.text_message import TextMessage
 from epstein_files.output.epstein_highlighter import highlighter
 from epstein_files.output.layout_elements.base_panel import BasePanel
@@ -21,7 +23,7 @@ from epstein_files.people.interesting_people import PERSONS_OF_INTEREST
 from epstein_files.people.names import JEFFREY_EPSTEIN, Name
 from epstein_files.util.constant.strings import AUTHOR, TIMESTAMP_STYLE
 from epstein_files.util.env import site_config
-from epstein_files.util.helpers.data_helpers import coerce_utc_strict, days_between, days_between_str, flatten, sort_dict
+from epstein_files.util.helpers.data_helpers import coerce_utc_strict, days_between, days_between_str, sort_dict
 from epstein_files.util.helpers.string_helper import iso_timestamp
 from epstein_files.util.logging import logger
 
@@ -40,9 +42,20 @@ END_DATES = {
 class MessengerLog(Communication):
     """
     Class representing one iMessage log file (one conversation between Epstein and some counterparty).
+
+    Attributes:
+        messages (MessageColumns): the text messages in this log
+        phone_number (str, optional): unredacted phone number of the counterparty (if found)
+        _message_index (MessageIndex, optional): cached index of `messages` by author
+        _parsed_messages (MessageColumns, optional): cached result of parsing the text, shared by
+            `extract_timestamp()` and `extract_messages()` so the text is only parsed once
     """
-    messages: list[TextMessage] = field(default_factory=list)
+    messages: MessageColumns = field(default_factory=MessageColumns)
     phone_number: str | None = None
+    _message_index: MessageIndex | None = None
+    _parsed_messages: MessageColumns | None = None
+
+    TEXT_CACHE_FIELDS: ClassVar[list[str]] = Communication.TEXT_CACHE_FIELDS + ['_message_index', '_parsed_messages']
 
     def __post_init__(self):
         super().__post_init__()
@@ -66,6 +79,13 @@ class MessengerLog(Communication):
         elif self.author is None or self.author in PERSONS_OF_INTEREST:
             return True
 
+    @property
+    def message_index(self) -> MessageIndex:
+        if self._message_index is None:
+            self._message_index = MessageIndex.for_columns([self.messages])
+
+        return self._message_index
+
     @property
     def metadata(self) -> Metadata:
         metadata = super().metadata
@@ -94,16 +114,18 @@ class MessengerLog(Communication):
 
         return txt.append(')')
 
-    def extract_messages(self) -> list[TextMessage]:
-        return [self._build_message(match) for match in MSG_REGEX.finditer(self.text)]
+    def extract_messages(self) -> MessageColumns:
+        """Messages parsed from the text (parsed once until the text changes)."""
+        if self._parsed_messages is None:
+            self._parsed_messages = MessageColumns.build(self._parse_messages(), self)
+
+        return self._parsed_messages
 
     def extract_recipients(self) -> list[Name]:
         return [JEFFREY_EPSTEIN]
 
     def extract_timestamp(self) -> datetime:
-        for match in MSG_REGEX.finditer(self.text):
-            message = self._build_message(match)
-
+        for message in self.extract_messages():
             try:
                 return message.parse_timestamp()
             except ValueError as e:
@@ -133,19 +155,23 @@ class MessengerLog(Communication):
             subheaders=self.subheaders,
         )
 
-    def first_message_at(self, name: Name) -> datetime:
-        return self.messages_by(name)[0].parse_timestamp()
+    def first_message_at(self, name: Name) -> datetime | None:
+        return self.message_index.first_message_at(name)
 
-    def last_message_at(self, name: Name) -> datetime:
-        return self.messages_by(name)[-1].parse_timestamp()
+    def last_message_at(self, name: Name) -> datetime | None:
+        return self.message_index.last_message_at(name)
 
     def messages_by(self, name: Name) -> list[TextMessage]:
         """Return all messages by 'name'."""
         return [m for m in self.messages if m.author == name]
 
-    def _build_message(self, match: re.Match) -> TextMessage:
-        """Turn a regex match into a `TextMessage`."""
-        author_str = REDACTED_AUTHOR_REGEX.sub('', match.group(1).strip())
+    def sorted_messages_by(self, name: Name) -> list[TextMessage]:
+        """Return the messages by 'name' that have valid timestamps in chronological order."""
+        return self.message_index.sorted_messages_by(name)
+
+    def _build_message(self, record: MessageRecord) -> TextMessage:
+        """Turn a `MessageRecord` into a `TextMessage`."""
+        author_str = REDACTED_AUTHOR_REGEX.sub('', record.sender.strip())
         is_phone_number = author_str.startswith('+')
 
         if is_phone_number:
@@ -157,10 +183,13 @@ class MessengerLog(Communication):
             author=self.author if (is_phone_number or not author_str) else author_str,
             author_str=author_str if is_phone_number else '',  # Preserve phone numbers
             is_id_confirmed=not self._config.author_uncertain,
-            text=match.group(4).strip(),
-            timestamp_str=match.group(2).strip(),
+            text=record.text.strip(),
+            timestamp_str=record.timestamp.strip(),
         )
 
+    def _parse_messages(self) -> list[TextMessage]:
+        return [self._build_message(record) for record in tokenize_messages(self.text)]
+
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
         yield self.rich_header()
         yield NewLine()
@@ -171,28 +200,24 @@ class MessengerLog(Communication):
         yield NewLine()
 
     @classmethod
-    def count_authors(cls, imessage_logs: list['MessengerLog']) -> dict[Name, int]:
-        """Count up how many texts were sent by each author."""
-        sender_counts: dict[Name, int] = defaultdict(int)
-
-        for message_log in imessage_logs:
-            for message in message_log.messages:
-                sender_counts[message.author] += 1
-
-        return sender_counts
+    def count_authors(
+        cls,
+        imessage_logs: list['MessengerLog'],
+        message_index: MessageIndex | None = None
+    ) -> dict[Name, int]:
+        """Count up how many texts were sent by each author ('message_index' should have all 'imessage_logs')."""
+        return cls._message_index_for(imessage_logs, message_index).counts
 
     @classmethod
     def default_category(cls) -> str:
         return 'text'
 
     @classmethod
-    def summary_table(cls, log_files: list['MessengerLog']) -> Table:
-        """Build a table summarizing the text messages in 'imessage_logs'."""
-        author_counts = cls.count_authors(log_files)
-        messages = flatten([log.messages for log in log_files])
-        messages = [m for m in messages if m.timestamp_sort_key != FALLBACK_TIMESTAMP]
-        messages = sorted(messages, key=lambda tm: tm.timestamp_sort_key)
-        msg_count = sum([len(log.messages) for log in log_files])
+    def summary_table(cls, log_files: list['MessengerLog'], message_index: MessageIndex | None = None) -> Table:
+        """Build a table summarizing the text messages in 'log_files' ('message_index' should have all of them)."""
+        message_index = cls._message_index_for(log_files, message_index)
+        author_counts = message_index.counts
+        msg_count = sum(author_counts.values())
 
         footer = f"deanonymized {msg_count - author_counts[None]:,} of {msg_count:,} text messages in"
         counts_table = build_table("Text Message Counts By Author", caption=f"({footer} {len(log_files)} files)")
@@ -206,17 +231,21 @@ class MessengerLog(Communication):
         for name, count in sort_dict(author_counts):
             logger.info(f'Found {count} logs for {name}')
             logs = log_files if name == JEFFREY_EPSTEIN else [log for log in log_files if log.author == name]
-            name_messages = [m for m in messages if m.author == name]
-            first_at = name_messages[0].timestamp_sort_key
-            last_at = name_messages[-1].timestamp_sort_key
+            first_at = message_index.first_message_at(name)
+            last_at = message_index.last_message_at(name)
 
             counts_table.add_row(
                 styled_name(name),
                 str(len(logs) or 1),
                 f"{count:,}",
-                iso_timestamp(first_at),
-                iso_timestamp(last_at),
-                str(days_between(first_at, last_at)),
+                iso_timestamp(first_at) if first_at else '',
+                iso_timestamp(last_at) if last_at else '',
+                str(days_between(first_at, last_at)) if first_at and last_at else '',
             )
 
         return counts_table
+
+    @classmethod
+    def _message_index_for(cls, logs: list['MessengerLog'], message_index: MessageIndex | None) -> MessageIndex:
+        """Narrow down an existing `MessageIndex` to 'logs' if there is one, otherwise build one."""
+        return message_index.for_subset(logs) if message_index else MessageIndex.for_logs(logs)
@@ -71,7 +71,11 @@ IMESSAGE_PDF_IDS = [
 class MessengerLogPdf(MessengerLog):
     """Class for unstructured iMessage logs in some PDFs."""
 
-    def extract_messages(self) -> list[TextMessage]:
+    def extract_timestamp(self) -> datetime:
+        return self.extract_messages()[0].parse_timestamp()
+
+    def _parse_messages(self) -> list[TextMessage]:
+        """Overrides superclass to parse the very different format of the PDF logs."""
         msgs: list[TextMessagePdf] = []
 
         if args.raw:
@@ -146,11 +150,8 @@ class MessengerLogPdf(MessengerLog):
 
         return msgs
 
-    def extract_timestamp(self) -> datetime:
-        return self.extract_messages()[0].parse_timestamp()
-
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TextMessagePdf(TextMessage):
-    def parse_timestamp(self) -> datetime:
+    def _parse_timestamp_str(self) -> datetime:
         return coerce_utc(parse(self.timestamp_str))
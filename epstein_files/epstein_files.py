@@ -1,5 +1,6 @@
 import gzip
 import json
+import os
 import pickle
 import re
 import sys
@@ -8,26 +9,31 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from os import environ
 from pathlib import Path
-from typing import Sequence, Type, cast
+from tempfile import NamedTemporaryFile
+from typing import ClassVar, Sequence, Type, cast
 
 from rich.table import Table
 from rich.text import Text
 from yaralyzer.util.helpers.interaction_helper import ask_to_proceed
 
-from epstein_files.documents.config.doc_cfg import Metadata
 from epstein_files.documents.config.email_cfg import EmailCfg
 from epstein_files.documents.config.manual_config import create_configs
 from epstein_files.documents.config.pic_cfg import PIC_CFGS, PicCfg
 from epstein_files.documents.document import Document, DocType
 from epstein_files.documents.documents.categories import Interesting
+from epstein_files.documents.documents.attachment_index import AttachmentIndex
 from epstein_files.documents.documents.doc_list import DocList
+from epstein_files.documents.documents.phone_number_index import PhoneNumberIndex
+from epstein_files.documents.documents.timeline_index import TimelineIndex
+from epstein_files.documents.imessage.message_index import MessageIndex
 from epstein_files.documents.documents.search_result import SearchResult
+from epstein_files.documents.documents.text_store import TEXT_STORE
 from epstein_files.documents.doj_file import DojFile
 from epstein_files.documents.email import EMAILERS_TO_ALWAYS_TRUNCATE, Email
 from epstein_files.documents.emails.constants import UNINTERESTING_EMAILERS
 from epstein_files.documents.emails.dropsite_email import DropsiteEmail
 from epstein_files.documents.emails.emailers import CONFIGURED_NON_ENTITIES, ENTITIES_DICT
-from epstein_files.documents.emails.multi_email_files import split_up_multi_email_files
+from epstein_files.documents.emails.multi_email_files import find_email_dumps, split_up_multi_email_files
 from epstein_files.documents.json_file import JsonFile
 from epstein_files.documents.messenger_log import MSG_REGEX, MessengerLog
 from epstein_files.documents.messenger_log_pdf import IMESSAGE_PDF_IDS, MessengerLogPdf
@@ -58,16 +64,32 @@ class EpsteinFiles(DocList):
     Attributes:
         file_paths (list[Path]): paths to Epstein related text documents
         documents (list[Document]): all parsed Documents except the emails with was_split_up flag
+        _attachment_index (AttachmentIndex): which emails carry which attachments
+        _message_index (MessageIndex): every text message in the iMessage logs by author, oldest first
+        _phone_number_index (PhoneNumberIndex): where every phone number appears in the corpus
+        _pickle_version (int): `PICKLE_VERSION` at the time this object was pickled
+        _text_blob_id (str): ID of the `TEXT_STORE` blob holding the documents' texts
+        _timeline_index (TimelineIndex): every email and text message between each pair of people, oldest first
         _uninteresting_ccs (list[Name]): names of tangential people who were just CCed once or similar
     """
     file_paths: list[Path] = field(init=False)
     # Derived fields
+    _attachment_index: AttachmentIndex = field(default_factory=AttachmentIndex)
     _empty_file_ids: set[str] = field(default_factory=set)
+    _message_index: MessageIndex = field(default_factory=MessageIndex)
     _people: list[Person] = field(default_factory=list)
+    _phone_number_index: PhoneNumberIndex = field(default_factory=PhoneNumberIndex)
+    _pickle_version: int = 0
+    _text_blob_id: str = ''
+    _timeline_index: TimelineIndex = field(default_factory=TimelineIndex)
     _uninteresting_ccs: list[Name] = field(default_factory=list)
 
+    # Bump when a change to the document classes means old pickles won't load correctly (e.g. adding slots)
+    PICKLE_VERSION: ClassVar[int] = 5
+
     def __post_init__(self):
         """Iterate through files and build appropriate objects."""
+        self._pickle_version = self.PICKLE_VERSION
         self.file_paths = sorted(all_txt_paths(), reverse=True)
         self._documents = self._load_file_paths(self.file_paths)
         self._documents += self._split_up_big_emails()
@@ -81,12 +103,32 @@ class EpsteinFiles(DocList):
 
         if args.pickle_path.exists() and not args.overwrite_pickle:
             with gzip.open(args.pickle_path, 'rb') as file:
-                epstein_files = pickle.load(file)
+                try:
+                    epstein_files = pickle.load(file)
+                except (AttributeError, EOFError, TypeError, pickle.UnpicklingError) as e:
+                    # Old pickles of classes that have since been slotted blow up inside pickle.load()
+                    logger.warning(f"Failed to load '{args.pickle_path}' ({type(e).__name__}: {e}), rebuilding...")
+                    return cls._build_new(timer)
+
                 timer_msg = f"Loaded {len(epstein_files.documents):,} documents from '{args.pickle_path}'"
                 timer.print_at_checkpoint(f"{timer_msg} ({file_size_str(args.pickle_path)})")
 
+            if epstein_files._pickle_version != cls.PICKLE_VERSION:
+                logger.warning(f"Pickle version {epstein_files._pickle_version} is out of date (current is {cls.PICKLE_VERSION})")
+                return cls._build_new(timer)
+
+            try:
+                # Map the texts now so a missing or mismatched blob means a rebuild instead of a crash mid-build
+                if epstein_files._text_blob_id:
+                    TEXT_STORE.open(epstein_files._text_blob_id)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to open texts for '{args.pickle_path}' ({type(e).__name__}: {e}), rebuilding...")
+                return cls._build_new(timer)
+
             if args.load_new:
                 epstein_files.load_new_files()
+            elif args.reclassify:
+                epstein_files.reclassify_documents()
             elif args.reload_doj:
                 epstein_files.reload_doj_files()
             elif epstein_files.has_new_pic_cfgs:
@@ -95,11 +137,15 @@ class EpsteinFiles(DocList):
 
             return epstein_files
 
-        logger.warning(f"Building new cache file, this will take a few minutes...")
-        epstein_files = EpsteinFiles()
-        num_synthetic_cfgs = len([c for c in CONFIGS_BY_ID.values() if c.is_synthetic])
-        timer.print_at_checkpoint(f'Processed {len(epstein_files.file_paths):,} files, {num_synthetic_cfgs} synthetic configs')
-        return epstein_files
+        return cls._build_new(timer)
+
+    @property
+    def attachment_index(self) -> AttachmentIndex:
+        """Built when the data is finalized; pickles from before it existed get one built on first use."""
+        if not getattr(self, '_attachment_index', None):
+            self._attachment_index = AttachmentIndex.build(self.emails)
+
+        return self._attachment_index
 
     @property
     def counterparties_dict(self) -> dict[Name, list[Name]]:
@@ -121,14 +167,38 @@ class EpsteinFiles(DocList):
         pic_ids = set([d.file_id for d in self.pictures])
         return len(pic_ids.intersection(self.file_ids)) != len(pic_ids)
 
+    @property
+    def message_index(self) -> MessageIndex:
+        """Built when the data is finalized; pickles from before it existed get one built on first use."""
+        if not getattr(self, '_message_index', None):
+            self._message_index = MessageIndex.for_logs(self.imessage_logs)
+
+        return self._message_index
+
     @property
     def people(self) -> list[Person]:
         return self._people
 
+    @property
+    def phone_number_index(self) -> PhoneNumberIndex:
+        """Built when the data is finalized; pickles from before it existed get one built on first use."""
+        if not getattr(self, '_phone_number_index', None):
+            self._phone_number_index = PhoneNumberIndex.build(self.documents)
+
+        return self._phone_number_index
+
     @property
     def pictures(self) -> list[Picture]:
         return [p for p in self.documents if isinstance(p, Picture)]
 
+    @property
+    def timeline_index(self) -> TimelineIndex:
+        """Built when the data is finalized; pickles from before it existed get one built on first use."""
+        if not getattr(self, '_timeline_index', None):
+            self._timeline_index = TimelineIndex.build(self.communications)
+
+        return self._timeline_index
+
     @property
     def uninteresting_emailers(self) -> list[Name]:
         """Emailers whom we don't want to print a separate section for because they're just CCed."""
@@ -258,18 +328,10 @@ class EpsteinFiles(DocList):
         return [log for log in self.imessage_logs if name == log.author]
 
     def json_metadata(self) -> str:
-        """Create a JSON string containing metadata for all the files."""
-        def _sorted_metadata(docs: Sequence[Document]) -> list[Metadata]:
-            return [json_safe(d.metadata) for d in DocList.sort_by_id(docs)]
-
+        """Create a JSON string containing metadata for all the files (see `output/json_metadata.py` to stream it)."""
         metadata = {
-            'files': {
-                Email.__name__: _sorted_metadata(self.emails),
-                JsonFile.__name__: _sorted_metadata(self.json_files),
-                MessengerLog.__name__: _sorted_metadata(self.imessage_logs),
-                OtherFile.__name__: _sorted_metadata(self.non_json_other_files),
-            },
-            'people': {name: bio.plain for name, bio in PEOPLE_BIOS.items()},
+            'files': {k: [json_safe(d.metadata) for d in docs] for k, docs in self.metadata_docs().items()},
+            'people': self.people_bios_metadata(),
         }
 
         return json.dumps(metadata, indent=4, sort_keys=True)
@@ -287,6 +349,15 @@ class EpsteinFiles(DocList):
 
         self._finalize_data_and_write_to_disk(new_docs)
 
+    def metadata_docs(self) -> dict[str, Sequence[Document]]:
+        """`Document`s whose metadata is exported, sorted by ID and keyed by type name."""
+        return {
+            Email.__name__: DocList.sort_by_id(self.emails),
+            JsonFile.__name__: DocList.sort_by_id(self.json_files),
+            MessengerLog.__name__: DocList.sort_by_id(self.imessage_logs),
+            OtherFile.__name__: DocList.sort_by_id(self.non_json_other_files),
+        }
+
     def other_files_for(self, name: Name) -> list[OtherFile]:
         """Get files with author `name` or that are marked `show_with_name`."""
         if name is None:
@@ -305,6 +376,9 @@ class EpsteinFiles(DocList):
         table.add_row('Other', *DocList.file_summary_row(self.non_json_other_files))
         return table
 
+    def people_bios_metadata(self) -> dict[str, str]:
+        return {name: bio.plain for name, bio in PEOPLE_BIOS.items()}
+
     def person_objs(self, names: list[Name]) -> list[Person]:
         """Construct Person objects for a list of names."""
         return [
@@ -316,6 +390,22 @@ class EpsteinFiles(DocList):
             for name in names
         ]
 
+    def reclassify_documents(self) -> None:
+        """Reload any documents that would become a different `Document` subclass with the current configs."""
+        misclassified = [
+            doc for doc in self._documents
+            if not (isinstance(doc, Picture) or doc.file_info.is_local_extract_file) and type(doc) is not document_cls(doc)
+        ]
+
+        if not misclassified:
+            logger.warning(f"All {len(self._documents):,} documents are already the right type, doing nothing.")
+            return
+
+        for doc in misclassified:
+            doc._warn(f"Reclassifying {type(doc).__name__} as {document_cls(doc).__name__}")
+
+        self.repair_ids([doc.file_id for doc in misclassified])
+
     def reload_doj_files(self) -> None:
         """Reload only the DOJ PDF extracts (keep HOUSE_OVERSIGHT stuff unchanged)."""
         def doj_file_counts_str():
@@ -360,6 +450,15 @@ class EpsteinFiles(DocList):
 
         self._finalize_new_docs_if_approved(repaired_docs)
 
+    @classmethod
+    def _build_new(cls, timer: Timer) -> 'EpsteinFiles':
+        """Parse all the files from scratch (and write a new pickle file)."""
+        logger.warning(f"Building new cache file, this will take a few minutes...")
+        epstein_files = cls()
+        num_synthetic_cfgs = len([c for c in CONFIGS_BY_ID.values() if c.is_synthetic])
+        timer.print_at_checkpoint(f'Processed {len(epstein_files.file_paths):,} files, {num_synthetic_cfgs} synthetic configs')
+        return epstein_files
+
     def _copy_duplicate_doc_properties(self) -> None:
         """Ensure dupe docs have the properties of the docs they duplicate to capture any repairs, config etc."""
         for doc in self.documents:
@@ -396,6 +495,10 @@ class EpsteinFiles(DocList):
         self._find_email_attachments_and_set_is_first_for_user()
         self._documents = type(self).sort_by_timestamp(self._documents)
         self.docs_by_id  # Trigger cache
+        self._attachment_index = AttachmentIndex.build(self.emails)
+        self._message_index = MessageIndex.for_logs(self.imessage_logs)
+        self._phone_number_index = PhoneNumberIndex.build(self.documents)
+        self._timeline_index = TimelineIndex.build(self.communications)
         self._save_to_disk()
 
     def _find_email_attachments_and_set_is_first_for_user(self) -> None:
@@ -462,6 +565,7 @@ class EpsteinFiles(DocList):
                 continue
 
             docs.append(document_cls(document)(file_path))  # TODO (??): needs to reload DropsiteEmail
+            docs[-1]._looks_like_email = document._looks_like_email  # Keep the classification, don't rescan
             logger.info(str(docs[-1]))
             doc_timer.warn_if_slower_than(f"Slow file: {docs[-1]} processed")
 
@@ -478,10 +582,28 @@ class EpsteinFiles(DocList):
         ]
 
     def _save_to_disk(self) -> None:
-        """Write a pickled version of this `EpsteinFiles` object with all documents etc."""
-        with gzip.open(args.pickle_path, 'wb') as file:
-            pickle.dump(self, file)
-            logger.warning(f"Pickled data to '{args.pickle_path}' ({file_size_str(args.pickle_path)})...")
+        """Write a pickled version of this `EpsteinFiles` object with all documents etc. (texts go in `TEXT_STORE`)."""
+        text_refs = TEXT_STORE.write(doc.text for doc in self._documents)
+
+        for doc, text_ref in zip(self._documents, text_refs):
+            doc._text_ref = text_ref
+
+        self._text_blob_id = text_refs[0].blob_id if text_refs else ''
+
+        # Write to a temp file and swap it in so readers never see a half written pickle
+        with NamedTemporaryFile(dir=args.pickle_path.parent, prefix=f"{args.pickle_path.name}.", delete=False) as tmp_file:
+            try:
+                with gzip.open(tmp_file, 'wb') as file:
+                    pickle.dump(self, file)
+            except BaseException:
+                os.unlink(tmp_file.name)
+                raise
+
+        os.replace(tmp_file.name, args.pickle_path)
+        logger.warning(f"Pickled data to '{args.pickle_path}' ({file_size_str(args.pickle_path)})...")
+
+        if self._text_blob_id:
+            TEXT_STORE.remove_stale_blobs(self._text_blob_id)
 
     def _set_uninteresting_ccs(self) -> None:
         """Extract the recipients of emails configured has having uninteresting CCs or BCCs."""
@@ -500,10 +622,11 @@ class EpsteinFiles(DocList):
         """Find the big emails that we want to split up into smaller emails."""
         big_emails = [e for e in self._documents if isinstance(e, Email) and e._was_split_up]
 
-        big_emails = big_emails or [
+        big_emails = big_emails or DocList.uniquify_by_id([
             *self.emails_by(CHRISTOPHER_DILORIO),
-            *[self.get_id(LEON_BLACK_EMAIL_ID, required_type=Email)]
-        ]
+            *[self.get_id(LEON_BLACK_EMAIL_ID, required_type=Email)],
+            *find_email_dumps(self.emails),
+        ])
 
         new_emails = split_up_multi_email_files(big_emails)
         logger.warning(f"Split up {len(big_emails)} into {len(new_emails)} smaller emails...")
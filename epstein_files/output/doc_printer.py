@@ -26,6 +26,7 @@ from epstein_files.output.layout_elements.list_panel import ListPanel
 from epstein_files.output.html.builder import (console_buffer_to_html, render_at_obj_width, panel_to_div,
      render_to_html, text_to_div, write_templated_html)
 from epstein_files.output.html.elements import div_class, tag
+from epstein_files.output.html.precompress import precompress
 from epstein_files.output.html.positioned_rich import PositionedRich, to_em, unpack_dimensions, vertical_spacer
 from epstein_files.output.layout_elements.demi_table import build_demi_table
 from epstein_files.output.rich import CATEGORY_BG_STYLES, console, section_subtitle_panel
@@ -319,7 +320,12 @@ class DocPrinter(DocList):
                 write_html(write_to)
 
         html_path = write_templated_html(self.html_elements, output_path)
-        return Site.move_custom_html_into_place(write_to, args.category) or html_path
+
+        if (deployed_path := Site.move_custom_html_into_place(write_to, args.category)):
+            precompress(deployed_path)
+            return deployed_path
+        else:
+            return html_path
 
     def _align_biographical_panel(self, panel: Panel) -> Align:
         return Align(Padding(panel, site_config.character_bio_padding), 'right')
@@ -3,6 +3,7 @@ Configuration of keyword color highlighting which also contains regexes used to
 email sendersa and recipients in email headers.
 """
 import re
+from dataclasses import dataclass, field
 from typing import Sequence
 
 from rich.console import Console
@@ -288,30 +289,56 @@ HIGHLIGHT_GROUPS: Sequence[HighlightGroup] = [
 HIGHLIGHTED_ENTITIES = flatten([hn.entities for hn in HIGHLIGHTED_NAMES])
 
 
+@dataclass
+class NameResolver:
+    """
+    Memoizes which of `highlight_groups` (first regex match wins) and which `Entity` a name resolves to
+    so the same few thousand author and recipient names don't trigger a sweep of every regex each time.
+
+    Args:
+        highlight_groups (Sequence[HighlightGroup]): groups to check, in order of precedence
+        _entities (dict[str, Entity | None]): cached `Entity` lookups
+        _groups (dict[str, HighlightGroup | None]): cached `HighlightGroup` lookups
+    """
+    highlight_groups: Sequence[HighlightGroup]
+    _entities: dict[str, Entity | None] = field(default_factory=dict)
+    _groups: dict[str, HighlightGroup | None] = field(default_factory=dict)
+
+    def entity(self, name: str) -> Entity | None:
+        if name not in self._entities:
+            self._entities[name] = self._find_entity(name)
+
+        return self._entities[name]
+
+    def group(self, name: str) -> HighlightGroup | None:
+        if name not in self._groups:
+            self._groups[name] = next((hg for hg in self.highlight_groups if hg.regex.search(name)), None)
+
+        return self._groups[name]
+
+    def style(self, name: str, default_style: str = DEFAULT_NAME_STYLE) -> str:
+        return group.style if (group := self.group(name)) else default_style
+
+    def _find_entity(self, name: str) -> Entity | None:
+        if (group := self.group(name)) and isinstance(group, HighlightedNames):
+            return group.entity_index.search(name)
+
+        return None
+
+
+NAME_RESOLVER = NameResolver(HIGHLIGHT_GROUPS)
+
+
 def entities_in_category(category: str) -> list[Entity]:
     return flatten([hn.entities for hn in HIGHLIGHTED_NAMES if category in [hn.category, hn.label]])
 
 
 def get_entity(name: str) -> Entity | None:
-    if (group := get_highlight_group_for_name(name)) and isinstance(group, HighlightedNames):
-        if (entity := group.entities_by_name.get(name)):
-            return entity
-        else:  # Scan by regex
-            for entity in group.entities:
-                if entity.highlight_regex.search(name):
-                    entity._debug_log(f"found by pattern match for '{name}', not perfect match")
-                    return entity
-
-    return None
+    return NAME_RESOLVER.entity(name)
 
 
 def get_highlight_group_for_name(name: str | None) -> HighlightGroup | None:
-    if not name:
-        return None
-
-    for highlight_group in HIGHLIGHT_GROUPS:
-        if highlight_group.regex.search(name):
-            return highlight_group
+    return NAME_RESOLVER.group(name) if name else None
 
 
 def get_style_for_category(category: str) -> str | None:
@@ -328,8 +355,7 @@ def get_style_for_category(category: str) -> str | None:
 
 
 def get_style_for_name(name: str | None, default_style: str = DEFAULT_NAME_STYLE, allow_bold: bool = True) -> str:
-    highlight_group = get_highlight_group_for_name(name or UNKNOWN)
-    style = highlight_group.style if highlight_group else default_style
+    style = NAME_RESOLVER.style(name or UNKNOWN, default_style)
     style = style if allow_bold else style.replace('bold', '').strip()
     # logger.debug(f"get_style_for_name('{name}', '{default_style}', '{allow_bold}') yielded '{style}'")
     return style
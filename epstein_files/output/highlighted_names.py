@@ -8,6 +8,7 @@ from abc import ABC
 from dataclasses import dataclass, field
 
 from epstein_files.people.entity import Entity
+from epstein_files.people.entity_index import EntityIndex
 from epstein_files.people.names import Name, constantize_name
 from epstein_files.util.constant.strings import REGEX_STYLE_PREFIX
 from epstein_files.util.env import args
@@ -98,11 +99,13 @@ class HighlightedNames(HighlightPatterns):
         category (str): optional string to use as an override for `self.label` in some contexts
         entities (list[Entity]): optional `Entity` objects that will provide highlight regexes
         entities_by_name (dict[Name, Entity]): lookup dictionary for `Entity` objects
+        entity_index (EntityIndex): lookup for `Entity` objects by any known spelling
         flags (re.RegexFlag, optional): flags to use when compiling regexes
     """
     category: str = ''
     entities: list[Entity] = field(default_factory=list)
     entities_by_name: dict[Name, Entity] = field(init=False)
+    entity_index: EntityIndex = field(init=False)
     flags: re.RegexFlag = re.IGNORECASE
 
     def __post_init__(self):
@@ -119,6 +122,7 @@ class HighlightedNames(HighlightPatterns):
         self._pattern = fr"\b(({with_contacts_pattern})s?)\b"
         self.regex = self.compile_patterns(self._pattern)
         self.entities_by_name = build_name_lookup(self.entities)
+        self.entity_index = EntityIndex(self.entities)
 
         for entity in self.entities:
             entity.category = self.category_str
@@ -2,9 +2,7 @@
 slightly more abstract / higher level functions for turning rich objs to HTML
 """
 from copy import deepcopy
-from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
 
 from rich.align import Align
 from rich.console import Console, RenderableType
@@ -14,11 +12,12 @@ from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
-from epstein_files.output.html.elements import (HTML_RENDER_CONSOLE, PRE_CONSOLE_TEMPLATE, SPLITTER,
-     WIDTH_PROPS, HtmlListTag, build_html_list, div_class, from_em, strip_outer_tag, _html_elements_to_str)
+from epstein_files.output.html.elements import (HTML_CONSOLE_KWARGS, HTML_RENDER_CONSOLE, WIDTH_PROPS, HtmlListTag,
+     build_html_list, div_class, from_em, strip_outer_tag, _html_elements_to_str)
 from epstein_files.output.html.positioned_rich import *
+from epstein_files.output.html.renderer_pool import RendererPool, buffered_segments, segments_to_html
 from epstein_files.output.html.rich_style import RichStyle
-from epstein_files.output.rich import console
+from epstein_files.output.rich import RICH_THEME, THEME_STYLES, console
 from epstein_files.util.constant.html import CUSTOM_HTML_TEMPLATE, HTML_TERMINAL_THEME
 from epstein_files.util.env import args
 from epstein_files.util.helpers.data_helpers import add_constant, listify
@@ -42,11 +41,12 @@ OUTER_PANEL_DIV_PADDING_CSS = dimensions_to_padding_css(
     )
 )
 
-DEFAULT_HTML_RENDERER_KWARGS = {
-    'code_format': PRE_CONSOLE_TEMPLATE,
-    'inline_styles': True,
-    'theme': HTML_TERMINAL_THEME,
-}
+# Width keyed consoles for rendering fragments, HTML_RENDER_CONSOLE is only used for its width and measure()
+HTML_RENDERER_POOL = RendererPool(HTML_CONSOLE_KWARGS, HTML_TERMINAL_THEME, inline_styles=args.inline_styles)
+
+# Register the theme's styles first so highlighted names get the same CSS class names on every page
+for _style_name in THEME_STYLES:
+    RichStyle.css_class_for(RICH_THEME.styles[_style_name].get_html_style(HTML_TERMINAL_THEME))
 
 # These are the props for the outer panel
 PANEL_BASE_PROPS = {
@@ -62,11 +62,10 @@ PANEL_BORDER_PROPS = {
 }
 
 
-# TODO: refactor this into RichStyle
 def border_css_props(style: str | Style | None) -> dict[str, str]:
     """CSS props to make an HTML div with border-color set to `style` arg as a standard CSS RGB string."""
 
-    if style and (html_style := RichStyle(style)).foreground_color_hex:
+    if style and (html_style := RichStyle.get(style)).foreground_color_hex:
         return {
             "border-color": html_style.foreground_color_hex,
             **PANEL_BORDER_PROPS
@@ -76,11 +75,9 @@ def border_css_props(style: str | Style | None) -> dict[str, str]:
 
 
 def console_buffer_to_html(_console: Console, clear: bool = True) -> str:
-    """
-    Export the current `console` write buffer to an HTML string.
-    SPLITTER is used to strip off cruft that rich export_html() creates because it prints to variables we don't want.
-    """
-    return _console.export_html(clear=clear, **DEFAULT_HTML_RENDERER_KWARGS).split(SPLITTER)[0]
+    """Export the current `console` record buffer to an HTML string (same format as `render_to_html()`)."""
+    segments = buffered_segments(_console, record_buffer=True, clear=clear)
+    return segments_to_html(segments, HTML_TERMINAL_THEME, args.inline_styles)
 
 
 def one_row_table_html(table: Table, css_props: OptionalCssProps = None) -> str:
@@ -101,13 +98,13 @@ def one_row_table_html(table: Table, css_props: OptionalCssProps = None) -> str:
             raise ValueError(f"invalid header type {type(col1.header).__name__} {col1.header}")
 
         header_props = {
-            'border-bottom-color': RichStyle(table.border_style).foreground_color_hex,
+            'border-bottom-color': RichStyle.get(table.border_style).foreground_color_hex,
             'text-align': header.justify or 'left',
-            **(RichStyle(table.header_style).to_css if table.header_style else {}),
         }
 
+        header_class = join_truthy('document_panel_header', RichStyle.get(table.header_style).css_class)
         header_span = render_to_html(Text('', style=col1.header_style or '').append(header))
-        header_div = div_class(header_span, 'document_panel_header', header_props)
+        header_div = div_class(header_span, header_class, header_props)
 
     body_txt = Text('', style=col1.style).append(col1._cells[0])
     # body_div_css = {**PANEL_BASE_PROPS}
@@ -141,16 +138,14 @@ def panel_to_div(panel: Panel, css_props: OptionalCssProps) -> str:
     css_props = css_props if css_props is not None else BOTTOM_MARGIN_PROPS                            # TODO: Default bottom margin seems wrong
     border_style = panel.border_style if panel.style == 'none' or not panel.style else panel.style     # TODO: what's up with the string 'none'??
     inner_div_padding_dims = add_constant(unpack_dimensions(panel.padding or 0), MAKEUP_PADDING)
-    html_style = RichStyle(panel.style)
+    style_class = RichStyle.get(panel.style).css_class
 
     inner_div_css = {
-        **html_style.to_css,
         **border_css_props(border_style),
         **dimensions_to_padding_css(inner_div_padding_dims),
     }
 
     outer_div_css = {
-        **html_style.to_css,
         **PANEL_BASE_PROPS,
         **css_props,
     }
@@ -161,8 +156,8 @@ def panel_to_div(panel: Panel, css_props: OptionalCssProps) -> str:
             inner_div_css[prop] = to_em(panel.width - MAKEUP_PADDING)
 
     logger.debug(f"panel_to_div(): panel.style='{panel.style}', panel.border_style='{panel.border_style}'\n\n   inner_div_css props: {inner_div_css}\n\n    outer_div_css: {outer_div_css}\n")
-    inner_div = div_class(render_at_css_width(panel.renderable), 'panel inner_panel', inner_div_css)
-    return div_class(inner_div, 'panel outer_panel', outer_div_css)
+    inner_div = div_class(render_at_css_width(panel.renderable), join_truthy('panel inner_panel', style_class), inner_div_css)
+    return div_class(inner_div, join_truthy('panel outer_panel', style_class), outer_div_css)
 
 
 def render_at_console_width(obj: RenderableType) -> str:
@@ -185,14 +180,12 @@ def render_at_css_width(obj: RenderableType, props: OptionalCssProps = None) ->
 
 def render_at_obj_width(obj: RenderableType) -> str:
     """Render `obj` to a <pre> block with same width as `obj`."""
-    with _obj_width_renderer(obj) as _renderer:
-        return render_to_html(obj, _renderer)
+    return render_at_width(obj, HTML_RENDER_CONSOLE.measure(obj).minimum)
 
 
 def render_at_width(obj: RenderableType, width: int) -> str:
-    """render `obj` to HTML but temporarily change the console width."""
-    with tmp_console(width) as _renderer:
-        return render_to_html(obj, _renderer)
+    """render `obj` to HTML with a pooled console of `width`."""
+    return HTML_RENDERER_POOL.render_html(obj, width)
 
 
 def render_max_width(obj: RenderableType) -> str:
@@ -200,26 +193,25 @@ def render_max_width(obj: RenderableType) -> str:
     return render_at_width(obj, MAX_RENDER_WIDTH)
 
 
-def render_to_html(obj: RenderableType, renderer_console: Console | None = None) -> str:
-    """Convert rich renderable to HTML <pre> str by printing it then calling `console.export_html()`."""
-    renderer_console = renderer_console or HTML_RENDER_CONSOLE
-    renderer_console.print(obj, end='')
-    return console_buffer_to_html(renderer_console)
+def render_to_html(obj: RenderableType, width: int | None = None) -> str:
+    """Convert rich renderable to HTML <pre> str at `width` (defaults to `HTML_RENDER_CONSOLE` width)."""
+    return render_at_width(obj, width or HTML_RENDER_CONSOLE.width)
 
 
 def table_to_html(table: Table, css_props: OptionalCssProps = None) -> str:
     """Convert a rich `Table` to an HTML table that looks the same."""
     css_props = css_props or {}
     col_styles = [col.style or '' for col in table.columns]
-    border_style = RichStyle(table.border_style or DEFAULT_HTML_TABLE_BORDER_STYLE)
+    border_style = RichStyle.get(table.border_style or DEFAULT_HTML_TABLE_BORDER_STYLE)
     border_color_css = {'border-color': border_style.foreground_color_hex, 'border-style': 'solid'}
-    header_css_props = RichStyle(table.header_style).to_css if table.header_style else {}
+    header_class = join_truthy('columnheader', RichStyle.get(table.header_style).css_class)
 
     # TODO: seems like we could just use border_color_css?
-    if not table.show_lines:
-        header_css_props['border-bottom-color'] = border_style.foreground_color_hex
-        header_css_props['border-bottom-width'] = to_px(1)
-        header_css_props['border-bottom-style'] = 'solid'
+    header_border_props = {} if table.show_lines else {
+        'border-bottom-color': border_style.foreground_color_hex,
+        'border-bottom-width': to_px(1),
+        'border-bottom-style': 'solid',
+    }
 
     row_props = {'border-bottom-width': '1px', **border_color_css} if table.show_lines else {}
 
@@ -234,9 +226,9 @@ def table_to_html(table: Table, css_props: OptionalCssProps = None) -> str:
             {
                 'max-width': to_em(col.max_width or col.width),
                 'text-align': ((col.header.justify or '') if isinstance(col.header, Text) else '') or col.justify,
-                **header_css_props
+                **header_border_props
             },
-            'columnheader'
+            header_class
         )
         for col in table.columns
     ]
@@ -259,7 +251,7 @@ def table_to_html(table: Table, css_props: OptionalCssProps = None) -> str:
     # table.caption is the text at the bottom under the table, the footer kinda
     if table.caption:
         caption = table.caption if isinstance(table.caption, Text) else Text(table.caption)
-        caption_style = RichStyle(table.caption_style or '')
+        caption_style = RichStyle.get(table.caption_style or '')
 
         caption_html = text_to_div(
             caption,
@@ -308,23 +300,11 @@ def text_to_list(textish: list[str] | list[Text], list_type: HtmlListTag = 'ul',
     return build_html_list(html_elements, list_type, **kwargs)
 
 
-@contextmanager
-def tmp_console(tmp_width: int) -> Generator[Console, None, None]:
-    """safely use a rich console with temporary width for rendering rich -> HTML."""
-    old_console_width = HTML_RENDER_CONSOLE.width
-    HTML_RENDER_CONSOLE.width = tmp_width
-
-    try:
-        yield HTML_RENDER_CONSOLE
-    finally:
-        HTML_RENDER_CONSOLE.width = old_console_width
-
-
 def write_templated_html(elements: list[str] | str, output_path: Path) -> Path:
     """Render a collection of HTML elements to an HTML file. Returns file that was written."""
     html = str(CUSTOM_HTML_TEMPLATE).format(
         code='\n\n'.join(listify(elements)),
-        stylesheet=CSS,
+        stylesheet=join_truthy(CSS, RichStyle.stylesheet(), '\n'),
         background=HTML_TERMINAL_THEME.background_color.hex,
         foreground=HTML_TERMINAL_THEME.foreground_color.hex,
     )
@@ -334,13 +314,6 @@ def write_templated_html(elements: list[str] | str, output_path: Path) -> Path:
     return output_path
 
 
-@contextmanager
-def _obj_width_renderer(obj: RenderableType) -> Generator[Console, None, None]:
-    """temporarily set html_renderer.width to this object's width to constrain rich output."""
-    with tmp_console(HTML_RENDER_CONSOLE.measure(obj).minimum) as _tmp_console:
-        yield _tmp_console
-
-
 def _table_cell(contents: RenderableType, props: OptionalCssProps = None, extra_class: str = '') -> str:
     cell_html = render_at_css_width(contents, props)
     return div_class(cell_html, join_truthy(extra_class, 'column'), props, role='cell')
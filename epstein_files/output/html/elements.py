@@ -33,7 +33,7 @@ CODE_TAG_CSS = {'font-family': 'inherit'}
 FONT_CSS_PROPS = {'font-family': FONT_FAMILY}
 WIDTH_PROPS = ['max-width', 'width']
 
-# Used by the per object rich -> html renders, e.g print_renderable, panel_to_div, etc.
+# Default width + measure() for the per object rich -> html renders (actual rendering uses HTML_RENDERER_POOL)
 HTML_RENDER_CONSOLE = Console(**HTML_CONSOLE_KWARGS)
 
 
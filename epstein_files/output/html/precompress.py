@@ -0,0 +1,130 @@
+"""
+Write precompressed .gz (and .br if the `brotli` package is installed) siblings of build artifacts so
+static hosts can serve them without compressing on the fly.
+"""
+import gzip
+import hashlib
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+
+from epstein_files.util.env import args
+from epstein_files.util.helpers.file_helper import file_size_str, log_file_write
+from epstein_files.util.logging import logger
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BROTLI_EXTENSION = 'br'
+GZIP_EXTENSION = 'gz'
+MANIFEST_FILENAME = '.precompressed.json'
+MAX_WORKERS = 4
+
+compressed_path = lambda path, extension: Path(f"{path}.{extension}")
+
+
+@dataclass
+class Precompressor:
+    """
+    Compresses files on a thread pool (zlib and brotli release the GIL) so compression can overlap with
+    whatever rendering is still going on. A manifest of content hashes in each output dir is used to skip
+    recompressing files whose contents and compression levels haven't changed since the last build.
+
+    Args:
+        brotli_level (int): brotli quality (0-11)
+        gzip_level (int): gzip compression level (1-9)
+        _executor (ThreadPoolExecutor): worker pool
+        _futures (list[Future]): jobs that have been submitted but not waited on
+        _lock (Lock): guards reading and writing the manifests
+        _warned_no_brotli (bool): True once the missing `brotli` package has been logged
+    """
+    brotli_level: int = 11
+    gzip_level: int = 9
+    _executor: ThreadPoolExecutor = field(default_factory=lambda: ThreadPoolExecutor(MAX_WORKERS))
+    _futures: list[Future] = field(default_factory=list)
+    _lock: Lock = field(default_factory=Lock)
+    _warned_no_brotli: bool = False
+
+    @property
+    def extensions(self) -> list[str]:
+        return [GZIP_EXTENSION] + ([BROTLI_EXTENSION] if brotli else [])
+
+    def submit(self, path: Path) -> Future:
+        """Queue `path` for compression."""
+        if not (brotli or self._warned_no_brotli):
+            logger.warning(f"brotli package not installed, only writing .{GZIP_EXTENSION} files")
+            self._warned_no_brotli = True
+
+        future = self._executor.submit(self.compress, Path(path))
+        self._futures.append(future)
+        return future
+
+    def compress(self, path: Path) -> list[Path]:
+        """Write compressed siblings of `path` unless they're already up to date. Returns paths written."""
+        data = path.read_bytes()
+        fingerprint = self._fingerprint(data)
+        siblings = [compressed_path(path, ext) for ext in self.extensions]
+
+        with self._lock:
+            is_unchanged = self._read_manifest(path.parent).get(path.name) == fingerprint
+
+        if is_unchanged and all(p.exists() for p in siblings):
+            logger.debug(f"'{path}' unchanged since last build, not recompressing")
+            return []
+
+        for sibling in siblings:
+            if sibling.suffix == f".{GZIP_EXTENSION}":
+                sibling.write_bytes(gzip.compress(data, compresslevel=self.gzip_level, mtime=0))
+            else:
+                sibling.write_bytes(brotli.compress(data, quality=self.brotli_level))
+
+            log_file_write(sibling)
+
+        with self._lock:
+            manifest = self._read_manifest(path.parent)
+            manifest[path.name] = fingerprint
+            path.parent.joinpath(MANIFEST_FILENAME).write_text(json.dumps(manifest, indent=4, sort_keys=True))
+
+        return siblings
+
+    def wait(self) -> list[Path]:
+        """Block until all submitted jobs are done. Returns all the paths that were written."""
+        written = [p for future in self._futures for p in future.result()]
+        self._futures = []
+        return written
+
+    def _fingerprint(self, data: bytes) -> str:
+        """Hash of the contents plus the settings so changing a compression level forces a rebuild."""
+        levels = f"gz{self.gzip_level}" + (f"br{self.brotli_level}" if brotli else '')
+        return f"{hashlib.sha256(data).hexdigest()}:{levels}"
+
+    def _read_manifest(self, dir: Path) -> dict[str, str]:
+        manifest_path = dir.joinpath(MANIFEST_FILENAME)
+        return json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+
+PRECOMPRESSOR = Precompressor(brotli_level=args.brotli_level, gzip_level=args.gzip_level)
+
+
+def compressed_sizes_str(path: Path) -> str:
+    """e.g. 'gz: 1.2 MB, br: 0.9 MB' for whichever compressed siblings of `path` exist."""
+    return ', '.join(
+        f"{ext}: {file_size_str(sibling, 1)}"
+        for ext in [GZIP_EXTENSION, BROTLI_EXTENSION]
+        if (sibling := compressed_path(path, ext)).exists()
+    )
+
+
+def precompress(path: Path) -> None:
+    """Queue `path` for compression if `--precompress` was passed."""
+    if args.precompress:
+        PRECOMPRESSOR.submit(path)
+
+
+def wait_for_precompression() -> None:
+    if args.precompress and (written := PRECOMPRESSOR.wait()):
+        logger.warning(f"Wrote {len(written)} precompressed files")
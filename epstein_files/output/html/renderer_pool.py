@@ -0,0 +1,118 @@
+"""
+Pool of rich `Console` objects used to render rich objs to HTML fragments.
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from html import escape
+from threading import Lock
+from typing import Any, Generator, Iterable
+
+from rich.console import Console, RenderableType
+from rich.segment import Segment
+from rich.terminal_theme import TerminalTheme
+
+from epstein_files.output.html.elements import PRE_CONSOLE_TEMPLATE_PREFIX
+from epstein_files.output.html.rich_style import RichStyle
+from epstein_files.util.logging import logger
+
+
+@dataclass
+class RendererPool:
+    """
+    Thread safe pool of `Console` objects keyed by width. Each `Console` is checked out by one thread at a
+    time so fragments can be rendered concurrently without mutating the width of a shared `Console`.
+
+    Args:
+        console_kwargs (dict[str, Any]): kwargs used to instantiate new `Console` objects
+        theme (TerminalTheme): theme used to convert rich styles to CSS
+        inline_styles (bool): if False <span> tags get shared CSS class names instead of style="" attributes
+        _idle (dict[int, list[Console]]): `Console` objects not currently checked out, keyed by width
+        _lock (Lock): guards `_idle`
+    """
+    console_kwargs: dict[str, Any]
+    theme: TerminalTheme
+    inline_styles: bool = True
+    _idle: dict[int, list[Console]] = field(default_factory=lambda: defaultdict(list))
+    _lock: Lock = field(default_factory=Lock)
+
+    @contextmanager
+    def renderer(self, width: int) -> Generator[Console, None, None]:
+        """Check out a `Console` of `width` for the duration of the context."""
+        with self._lock:
+            idle = self._idle[width]
+            _console = idle.pop() if idle else None
+
+        if _console is None:
+            logger.debug(f"RendererPool creating new Console with width={width}")
+            _console = Console(**{**self.console_kwargs, 'record': False, 'width': width})
+
+        try:
+            yield _console
+        finally:
+            with self._lock:
+                self._idle[width].append(_console)
+
+    def render_html(self, obj: RenderableType, width: int) -> str:
+        """Render `obj` to an HTML <pre> block without going through `Console.export_html()`."""
+        with self.renderer(width) as _console:
+            return segments_to_html(render_segments(_console, obj), self.theme, self.inline_styles)
+
+
+def buffered_segments(_console: Console, record_buffer: bool = False, clear: bool = True) -> list[Segment]:
+    """
+    Copy (and optionally clear) the `Segment`s in `_console`'s thread local render buffer or, if `record_buffer`
+    is True, its record buffer. This is the only place that touches rich's private `Console._buffer`,
+    `Console._record_buffer` and `Console._record_buffer_lock` attributes (checked against rich 14.2.0).
+    """
+    if record_buffer:
+        with _console._record_buffer_lock:
+            segments = _console._record_buffer[:]
+
+            if clear:
+                del _console._record_buffer[:]
+    else:
+        segments = _console._buffer[:]
+
+        if clear:
+            del _console._buffer[:]
+
+    return segments
+
+
+def render_segments(_console: Console, obj: RenderableType) -> list[Segment]:
+    """
+    Print `obj` with `end=''` and collect the `Segment`s from the console's (thread local) buffer instead
+    of letting them be written to the console's file and record buffer.
+    """
+    with _console:
+        _console.print(obj, end='')
+        return buffered_segments(_console)
+
+
+def segments_to_html(segments: Iterable[Segment], theme: TerminalTheme, inline_styles: bool = True) -> str:
+    """
+    Same output as `Console.export_html(inline_styles=True, code_format=PRE_CONSOLE_TEMPLATE)` minus the junk.
+    If `inline_styles` is False spans use the `RichStyle` registry's shared CSS classes (see `RichStyle.stylesheet()`).
+    """
+    fragments: list[str] = []
+
+    for text, style, _ in Segment.filter_control(Segment.simplify(segments)):
+        text = escape(text)
+
+        if style:
+            rule = style.get_html_style(theme)
+
+            if style.link:
+                text = f'<a href="{style.link}">{text}</a>'
+
+            if not rule:
+                pass
+            elif inline_styles:
+                text = f'<span style="{rule}">{text}</span>'
+            else:
+                text = f'<span class="{RichStyle.css_class_for(rule)}">{text}</span>'
+
+        fragments.append(text)
+
+    return PRE_CONSOLE_TEMPLATE_PREFIX.format(code=''.join(fragments))
@@ -1,4 +1,7 @@
 from dataclasses import dataclass, field
+from functools import cached_property
+from threading import Lock
+from typing import ClassVar, Self
 
 from rich.errors import StyleSyntaxError
 from rich.style import Style
@@ -11,15 +14,26 @@ BOLD = Style(bold=True)
 DIM = Style(dim=True)
 NOT_BOLD = Style(bold=False)
 DEFAULT_THEME = Theme()
+CSS_CLASS_PREFIX = 'rs'
+
+StyleArg = Style | str | None
 
 
 @dataclass
 class RichStyle:
-    """Converts rich `Style` objects and style strings to HTML RGB codes."""
+    """
+    Converts rich `Style` objects and style strings to HTML RGB codes.
+    Use `RichStyle.get()` to get an interned instance whose parsed style, hex colors, and CSS are computed once.
+    """
 
-    _style: Style | str | None
+    _style: StyleArg
     style: Style = field(init=False)
 
+    # Class variables
+    _css_classes: ClassVar[dict[str, str]] = {}  # Inline CSS string => shared CSS class name
+    _interned: ClassVar[dict[StyleArg, 'RichStyle']] = {}
+    _lock: ClassVar[Lock] = Lock()
+
     def __post_init__(self):
         if isinstance(self._style, Style):
             self.style = self._style
@@ -36,7 +50,7 @@ class RichStyle:
                 from epstein_files.output.rich import RICH_THEME
                 self.style = RICH_THEME.styles[self._style]
 
-    @property
+    @cached_property
     def background_color_hex(self) -> str:
         if self.style.reverse:
             if self.style.color:
@@ -57,7 +71,12 @@ class RichStyle:
     def dim(self) -> Style:
         return Style.combine([self.style, DIM])
 
-    @property
+    @cached_property
+    def css_class(self) -> str:
+        """Shared CSS class name with the same props as `to_css` (empty string if there are no props)."""
+        return self.css_class_for(self.inline_css)
+
+    @cached_property
     def foreground_color_hex(self) -> str:
         if self.style.reverse:
             if self.style.bgcolor:
@@ -74,9 +93,18 @@ class RichStyle:
         """self.style but not bold."""
         return Style.combine([self.style, NOT_BOLD])
 
+    @cached_property
+    def inline_css(self) -> str:
+        """`to_css` as a string suitable for a style="" attribute or a stylesheet rule."""
+        return '; '.join(f"{k}: {v}" for k, v in sorted(self._css_props.items()))
+
     @property
     def to_css(self) -> dict[str, str]:
-        """Create CSS properties for this style."""
+        """Create CSS properties for this style (a copy that callers are free to modify)."""
+        return dict(self._css_props)
+
+    @cached_property
+    def _css_props(self) -> dict[str, str]:
         props = {}
 
         if self.background_color_hex:
@@ -93,5 +121,39 @@ class RichStyle:
 
         return props
 
+    @classmethod
+    def css_class_for(cls, css: str) -> str:
+        """Shared CSS class name for a string of CSS declarations (empty string if `css` is empty)."""
+        if not (css := cls.normalize_css(css)):
+            return ''
+        elif (css_class := cls._css_classes.get(css)):
+            return css_class
+
+        with cls._lock:
+            return cls._css_classes.setdefault(css, f"{CSS_CLASS_PREFIX}{len(cls._css_classes) + 1}")
+
+    @classmethod
+    def get(cls, style: StyleArg) -> Self:
+        """Interned `RichStyle` for `style` (the style is only parsed the first time it's requested)."""
+        if (rich_style := cls._interned.get(style)) is None:
+            rich_style = cls(style)
+
+            with cls._lock:
+                rich_style = cls._interned.setdefault(style, rich_style)
+
+        return rich_style
+
+    @classmethod
+    def normalize_css(cls, css: str) -> str:
+        """Sort and rejoin CSS declarations so the same props in any order or spacing (e.g. ours vs. rich's) match."""
+        declarations = (declaration.split(':', 1) for declaration in css.split(';') if ':' in declaration)
+        return '; '.join(sorted(f"{k.strip()}: {v.strip()}" for k, v in declarations))
+
+    @classmethod
+    def stylesheet(cls) -> str:
+        """CSS rules for every class name handed out by `css_class`."""
+        with cls._lock:
+            return '\n'.join(f".{css_class} {{ {css}; }}" for css, css_class in cls._css_classes.items())
+
     def __str__(self) -> str:
         return f"{type(self).__name__}(style={self.style}, _style={self._style})"
@@ -0,0 +1,115 @@
+"""
+Stream the `--json-metadata` export to disk one `Document` at a time instead of building the whole thing in memory.
+"""
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterable, Sequence
+
+from epstein_files.documents.config.doc_cfg import Metadata
+from epstein_files.documents.document import Document
+from epstein_files.util.helpers.data_helpers import json_safe
+
+FILES = 'files'
+INDENT = 4
+NDJSON_EXTENSION = '.ndjson'
+PEOPLE = 'people'
+
+
+@dataclass
+class JsonMetadataWriter:
+    """
+    Writes the same nested JSON as `EpsteinFiles.json_metadata()` (byte for byte) or one record per line (NDJSON),
+    optionally sharded into one file per document type (e.g. `metadata.Email.json`) plus one for the bios.
+    Each record is serialized as it's produced so memory use doesn't grow with the size of the corpus.
+
+    Args:
+        output_path (Path): where to write (the base name if sharding)
+        ndjson (bool): write newline delimited JSON instead of the nested layout
+        shard (bool): write one file per document type instead of a single file
+    """
+    output_path: Path
+    ndjson: bool = False
+    shard: bool = False
+
+    def shard_path(self, section: str) -> Path:
+        """e.g. 'metadata.Email.json' or 'metadata.people.ndjson'."""
+        return self.output_path.with_name(f"{self.output_path.stem}.{section}{self.output_path.suffix}")
+
+    def write(self, docs_by_type: dict[str, Sequence[Document]], bios: dict[str, str]) -> list[Path]:
+        """Write the metadata for `docs_by_type` and `bios`. Returns the paths written."""
+        if self.ndjson:
+            self.output_path = self.output_path.with_suffix(NDJSON_EXTENSION)
+
+        if self.shard:
+            paths = [self._write_section(k, metadata_records(docs)) for k, docs in docs_by_type.items()]
+            return paths + [self._write_section(PEOPLE, bios)]
+
+        with open(self.output_path, 'wt') as f:
+            if self.ndjson:
+                for docs in docs_by_type.values():
+                    _write_lines(f, metadata_records(docs))
+
+                _write_lines(f, bio_records(bios))
+            else:
+                f.write('{\n' + _indent(1) + f'"{FILES}": {{\n')
+
+                for i, (doc_type, docs) in enumerate(sorted(docs_by_type.items())):
+                    f.write((',\n' if i else '') + _indent(2) + f"{json.dumps(doc_type)}: ")
+                    _write_json_list(f, metadata_records(docs), 2)
+
+                f.write('\n' + _indent(1) + '},\n')
+                f.write(_indent(1) + f'"{PEOPLE}": ' + _dumps(bios, 1) + '\n}')
+
+        return [self.output_path]
+
+    def _write_section(self, section: str, records: dict[str, str] | Iterable[Metadata]) -> Path:
+        output_path = self.shard_path(section)
+
+        with open(output_path, 'wt') as f:
+            if isinstance(records, dict):
+                if self.ndjson:
+                    _write_lines(f, bio_records(records))
+                else:
+                    f.write(_dumps(records))
+            elif self.ndjson:
+                _write_lines(f, records)
+            else:
+                _write_json_list(f, records)
+
+        return output_path
+
+
+def bio_records(bios: dict[str, str]) -> Iterable[Metadata]:
+    """One NDJSON record per person."""
+    return ({'name': name, 'bio': bio, 'type': 'Person'} for name, bio in sorted(bios.items()))
+
+
+def metadata_records(docs: Sequence[Document]) -> Iterable[Metadata]:
+    """Lazily build the JSON safe `metadata` for each of `docs`."""
+    return (json_safe(doc.metadata) for doc in docs)
+
+
+def _dumps(obj: object, level: int = 0) -> str:
+    """`json.dumps()` with the indentation it would have `level` levels deep in a bigger object."""
+    return json.dumps(obj, indent=INDENT, sort_keys=True).replace('\n', '\n' + _indent(level))
+
+
+def _indent(level: int) -> str:
+    return ' ' * INDENT * level
+
+
+def _write_json_list(f: IO[str], records: Iterable[Metadata], level: int = 0) -> None:
+    """Write `records` as a JSON array, serializing one element at a time."""
+    is_empty = True
+
+    for record in records:
+        f.write(('[\n' if is_empty else ',\n') + _indent(level + 1) + _dumps(record, level + 1))
+        is_empty = False
+
+    f.write('[]' if is_empty else '\n' + _indent(level) + ']')
+
+
+def _write_lines(f: IO[str], records: Iterable[Metadata]) -> None:
+    for record in records:
+        f.write(json.dumps(record, sort_keys=True) + '\n')
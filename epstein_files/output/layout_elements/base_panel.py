@@ -15,6 +15,7 @@ from epstein_files.output.html.positioned_rich import (CssProps, PositionedRich,
      dimensions_to_padding_css, margin_horizontal_css)
 from epstein_files.util.env import site_config
 from epstein_files.util.helpers.data_helpers import without_falsey
+from epstein_files.util.helpers.string_helper import join_truthy
 from epstein_files.util.logging import logger
 
 
@@ -31,9 +32,14 @@ class BasePanel:
     title: Text | None = None
     title_justify: JustifyMethod = 'right'
 
+    @property
+    def color_class(self) -> str:
+        """Shared CSS class with this panel's colors."""
+        return RichStyle.get(self.style).css_class if self.style else ''
+
     @property
     def color_css(self) -> CssProps:
-        return RichStyle(self.style).to_css if self.style else {}
+        return RichStyle.get(self.style).to_css if self.style else {}
 
     @property
     def padding_css(self) -> CssProps:
@@ -65,12 +71,11 @@ class BasePanel:
                 **self._base_div_css(margins),
                 **PANEL_BASE_PROPS,
                 **border_css_props(self.border_style),
-                **self.color_css,
                 **self.padding_css,
                 **(margin_horizontal_css(self.indent) if self.indent else {}),
                 **(css or {}),
             },
-            class_name=f"category_{css_category}" if css_category else ''
+            class_name=join_truthy(f"category_{css_category}" if css_category else '', self.color_class)
         )
 
     def _base_div_css(self, margins: list[int | float] | None = None) -> CssProps:
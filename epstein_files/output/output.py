@@ -18,6 +18,8 @@ from epstein_files.documents.other_file import FIRST_FEW_LINES, OtherFile
 from epstein_files.epstein_files import EpsteinFiles
 from epstein_files.output.doc_printer import DocPrinter
 from epstein_files.output.html.html_dir import HtmlDir
+from epstein_files.output.html.precompress import compressed_sizes_str, precompress
+from epstein_files.output.json_metadata import JsonMetadataWriter
 from epstein_files.output.layout_elements.layout import Layout
 from epstein_files.output.epstein_highlighter import highlighter
 from epstein_files.output.rich import *
@@ -207,11 +209,11 @@ def print_json_files(epstein_files: EpsteinFiles) -> None:
 def print_json_metadata(epstein_files: EpsteinFiles) -> None:
     """Print all our `DocCfg` and derived info about authorship etc."""
     if args.build:
-        output_path = Site.html_output_path(Site.JSON_METADATA)
+        writer = JsonMetadataWriter(Site.html_output_path(Site.JSON_METADATA), args.ndjson, args.shard_metadata)
 
-        with open(output_path, 'wt') as f:
-            f.write(epstein_files.json_metadata())
+        for output_path in writer.write(epstein_files.metadata_docs(), epstein_files.people_bios_metadata()):
             log_file_write(output_path)
+            precompress(output_path)
     else:
         console.print_json(epstein_files.json_metadata(), indent=4, sort_keys=True)
 
@@ -287,7 +289,7 @@ def print_signatures_and_emojis(epstein_files: EpsteinFiles, printer: DocPrinter
 def print_stats(epstein_files: EpsteinFiles) -> None:
     """Used to generate fixture data for `pytest`."""
     console.print('\n\n\n', Panel('JSON Stats Dump', expand=True, style='reverse bold'), '\n')
-    print_json(MessengerLog.count_authors(epstein_files.imessage_logs), f"MessengerLog Sender Counts", skip_falsey=True)
+    print_json(epstein_files.message_index.counts, f"MessengerLog Sender Counts", skip_falsey=True)
     print_json(epstein_files.email_author_counts(), f"Email Author Counts", skip_falsey=True)
     print_json(epstein_files.email_recipient_counts(), f"Email Recipient Counts", skip_falsey=True)
     print_json(epstein_files.email_signature_substitution_counts(), "Email signature_substitution_countss", skip_falsey=True)
@@ -314,7 +316,7 @@ def print_text_msgs_section(epstein_files: EpsteinFiles, printer: DocPrinter) ->
         return
 
     if not args.names:
-        printer.print(_section_summary_table(MessengerLog.summary_table(imessage_logs)))
+        printer.print(_section_summary_table(MessengerLog.summary_table(imessage_logs, epstein_files.message_index)))
 
     printer.print_documents(imessage_logs)
 
@@ -323,8 +325,9 @@ def show_urls() -> None:
     """Print the various URLs generated by this code."""
     try:
         urls = {
-            k: Text('[', 'grey30').append(file_size_str(Site.html_output_path(k), 1), 'cyan').append('] ') + \
-                Text(v, ARCHIVE_LINK_COLOR)
+            k: Text('[', 'grey30').append(file_size_str(Site.html_output_path(k), 1), 'cyan') + \
+                _compressed_sizes_txt(Site.html_output_path(k)) + \
+                Text('] ', 'grey30') + Text(v, ARCHIVE_LINK_COLOR)
             for k, v in Site.all_urls().items()
         }
     except FileNotFoundError:
@@ -357,10 +360,20 @@ def write_html(output_path: Path | Site | None, **kwargs) -> Path | None:
             **kwargs
         )
 
+        precompress(output_path)
+
     log_file_write(output_path)
     return output_path
 
 
+def _compressed_sizes_txt(path: Path) -> Text:
+    """Sizes of precompressed versions of `path` (if there are any)."""
+    if (sizes_str := compressed_sizes_str(path)):
+        return Text(' (', 'grey30').append(sizes_str, 'dark_cyan').append(')', 'grey30')
+    else:
+        return Text('')
+
+
 def _section_summary_table(table: Table) -> Align:
     return Align(Padding(table, (1, 0, 1, 0)), 'center')
 
@@ -14,7 +14,7 @@ from rich.text import Text
 
 from epstein_files.documents.documents.categories import Interesting
 from epstein_files.util.constant.strings import (AUX_SITE_LINK_STYLE, CHRONOLOGICAL,
-     DOJ_2026_TRANCHE, EPSTEIN_FILES_NOV_2025)
+     DOJ_2026_TRANCHE, EPSTEIN_FILES_NOV_2025, PHONE_LOG_FILE_ID)
 from epstein_files.output.html.html_dir import DEFAULT_HTML_DIR, HtmlDir
 from epstein_files.output.layout_elements.site_directory import SiteDirectory
 from epstein_files.util.external_link import ExternalLink, link_text_obj, parenthesize
@@ -38,7 +38,6 @@ CATEGORY_PREFIX = 'for_category_'
 CUSTOM_HTML_PREFIX = 'real_html_'
 NAMES_PREFIX = 'only_names_'
 MOBILE_SUFFIX = '_mobile'
-PHONE_LOG_FILE_ID = 'EFTA01242527'
 
 # Site directory
 SITE_GLOSSARY_MSG = f"The following views of the underlying selection of Epstein Files are available:"
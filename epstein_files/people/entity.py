@@ -77,7 +77,7 @@ class Entity(LoggingEntity):
 
     # NOTE: category is usually set by a `HighlightedNames` that holds this `Entity`
     category: str = ''
-    _style: RichStyle = field(default_factory=lambda: RichStyle(None))
+    _style: RichStyle = field(default_factory=lambda: RichStyle.get(None))
     _urls: list[str] = field(init=False)
     # jmail_url: str
 
@@ -215,7 +215,7 @@ class Entity(LoggingEntity):
 
     @style.setter
     def style(self, val: str | Style | None):
-        self._style = RichStyle(val)
+        self._style = RichStyle.get(val)
 
     @property
     def wikipedia_url(self) -> str:
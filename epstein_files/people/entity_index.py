@@ -0,0 +1,162 @@
+import re
+from dataclasses import dataclass, field
+from itertools import product
+from re import _constants, _parser  # type: ignore[attr-defined]
+from typing import Iterable
+
+from epstein_files.people.entity import Entity
+from epstein_files.util.helpers.string_helper import clean_phone_number
+from epstein_files.util.logging import logger
+
+MAX_PATTERN_SPELLINGS = 128
+SEPARATORS_REGEX = re.compile(r"[-_.\s]+")
+
+# Case insensitive and treats runs of the separators emailer patterns allow between names as one space
+fold_separators = lambda name: SEPARATORS_REGEX.sub(' ', name).casefold()
+spelling_key = lambda name: fold_separators(name).strip()
+
+
+class UnenumerablePattern(ValueError):
+    pass
+
+
+@dataclass
+class EntityIndex:
+    """
+    Resolves names, aliases, email addresses, emailer pattern variants and phone numbers to `Entity` objects
+    with dict lookups instead of running every `Entity`'s regex. Configured `emailer_pattern`s that match a
+    small finite set of strings (e.g. "Sam(uel)? Leff") are expanded into those strings up front. Spellings
+    only a regex can match are added to the index the first time `search()` finds them.
+
+    Attributes:
+        entities (list[Entity]): entities to index (if two share a spelling the first one wins)
+        phone_book (dict[str, Entity]): `Entity` objects keyed by cleaned up phone number
+        _by_spelling (dict[str, Entity]): `Entity` objects keyed by `spelling_key()`
+    """
+    entities: list[Entity]
+    phone_book: dict[str, Entity] = field(default_factory=dict)
+    _by_spelling: dict[str, Entity] = field(default_factory=dict)
+
+    def __post_init__(self):
+        # Names take precedence over aliases etc. of other entities, which take precedence over pattern variants
+        for entity in self.entities:
+            self._by_spelling.setdefault(spelling_key(entity.name), entity)
+
+        for entity in self.entities:
+            self._add_spellings(entity, entity.aliases + entity.email_addresses)
+
+            for phone_number in entity.phone_numbers:
+                self.phone_book[phone_number] = entity
+
+        # Patterns generated from plain names are left to search() to keep building the index cheap
+        for entity in self.entities:
+            if entity.emailer_pattern:
+                self._add_spellings(entity, pattern_spellings(entity.pattern))
+
+    def get(self, name: str) -> Entity | None:
+        """Find the `Entity` for any indexed spelling of a name or phone number."""
+        if (entity := self._by_spelling.get(spelling_key(name))):
+            return entity
+        elif clean_phone_number(name).isdigit():
+            return self.get_by_phone_number(name)
+
+        return None
+
+    def get_by_phone_number(self, phone_number: str) -> Entity | None:
+        return self.phone_book.get(clean_phone_number(phone_number))
+
+    def search(self, name: str) -> Entity | None:
+        """Like `get()` but falls back to (and remembers the result of) a scan of the entities' regexes."""
+        if (entity := self.get(name)):
+            return entity
+
+        for entity in self.entities:
+            if entity.highlight_regex.search(name):
+                entity._debug_log(f"found by pattern match for '{name}', not perfect match")
+                self._add_spellings(entity, [name])
+                return entity
+
+        return None
+
+    def _add_spellings(self, entity: Entity, spellings: Iterable[str]) -> None:
+        for spelling in spellings:
+            self._by_spelling.setdefault(spelling_key(spelling), entity)
+
+
+def pattern_spellings(pattern: str) -> list[str]:
+    """
+    The distinct `spelling_key()`s of the strings `pattern` can match if there's at most `MAX_PATTERN_SPELLINGS`
+    of them. Returns [] for open ended patterns (e.g. "Jeff.*").
+    """
+    try:
+        spellings = _spellings(_parser.parse(pattern, re.IGNORECASE))
+    except UnenumerablePattern:
+        return []
+    except re.error as e:
+        logger.warning(f"Failed to parse pattern {pattern!r}: {e}")
+        return []
+
+    return sorted(set(spelling_key(s) for s in spellings) - {''})
+
+
+def _spellings(nodes) -> set[str]:
+    """All the strings a parsed regex can match. Raises `UnenumerablePattern` if there's too many."""
+    spellings = {''}
+
+    for op, arg in nodes:
+        if op is _constants.AT:
+            continue  # Anchors and word boundaries don't add characters
+        elif op is _constants.LITERAL:
+            node_spellings = {fold_separators(chr(arg))}
+        elif op is _constants.IN:
+            node_spellings = _char_class_spellings(arg)
+        elif op is _constants.BRANCH:
+            node_spellings = set().union(*[_spellings(branch) for branch in arg[1]])
+        elif op is _constants.SUBPATTERN:
+            node_spellings = _spellings(arg[3])  # arg is (group number, add flags, del flags, subpattern)
+        elif op in (_constants.MAX_REPEAT, _constants.MIN_REPEAT):
+            node_spellings = _repeat_spellings(*arg)
+        else:
+            raise UnenumerablePattern(f"Can't enumerate {op}")
+
+        spellings = {prefix + suffix for prefix, suffix in product(spellings, node_spellings)}
+
+        if len(spellings) > MAX_PATTERN_SPELLINGS:
+            raise UnenumerablePattern(f"More than {MAX_PATTERN_SPELLINGS} spellings")
+
+    return spellings
+
+
+def _char_class_spellings(items) -> set[str]:
+    chars = set()
+
+    for op, arg in items:
+        if op is _constants.LITERAL:
+            chars.add(chr(arg))
+        elif op is _constants.RANGE and arg[1] - arg[0] < MAX_PATTERN_SPELLINGS:
+            chars.update(chr(c) for c in range(arg[0], arg[1] + 1))
+        elif op is _constants.CATEGORY and arg is _constants.CATEGORY_SPACE:
+            chars.add(' ')
+        else:
+            raise UnenumerablePattern(f"Can't enumerate character class item {op}")
+
+    return {fold_separators(c) for c in chars}
+
+
+def _repeat_spellings(min_count: int, max_count: int, subpattern) -> set[str]:
+    sub_spellings = _spellings(subpattern)
+
+    # Unbounded repeats (e.g. the "[-_.\s]*" between first and last names) only get their shortest non-empty
+    # spellings, which covers separators because fold_separators() collapses runs of them.
+    if max_count == _constants.MAXREPEAT:
+        max_count = max(min_count, 1)
+
+    spellings = set()
+
+    for count in range(min_count, max_count + 1):
+        spellings.update(''.join(p) for p in product(sub_spellings, repeat=count))
+
+        if len(spellings) > MAX_PATTERN_SPELLINGS:
+            raise UnenumerablePattern(f"More than {MAX_PATTERN_SPELLINGS} spellings")
+
+    return spellings
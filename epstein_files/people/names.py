@@ -1,4 +1,5 @@
 import re
+import sys
 from typing import Sequence, TypeVar
 
 from epstein_files.util.constant.strings import PALM_BEACH, QUESTION_MARKS, VIRGIN_ISLANDS
@@ -579,5 +580,14 @@ def extract_last_name(name: str) -> str:
         return first_last_names[-1]
 
 
+def intern_name(name: Name) -> Name:
+    """Names are repeated across thousands of documents so share one copy of each string."""
+    return None if name is None else sys.intern(name)
+
+
+def intern_names(names: Sequence[Name]) -> list[Name]:
+    return [intern_name(name) for name in names]
+
+
 def sort_names(names: Sequence[Name]) -> list[Name]:
     return sorted(names, key=lambda name: name or UNKNOWN)
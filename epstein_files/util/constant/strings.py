@@ -54,6 +54,7 @@ VICTIM_LAWYER = 'victim lawyer'
 
 # File IDs
 LEON_BLACK_EMAIL_ID = '023208'
+PHONE_LOG_FILE_ID = 'EFTA01242527'
 
 # Misc
 APPEARS_IN = 'appears in'
@@ -98,6 +98,9 @@ FLIGHT_LOG_CFGS = [
 MOST_INTERESTING_EMAIL_IDS = [
 ]
 
+# Concatenated email dumps that get split up at their header blocks (see `multi_email_files.find_email_dumps()`)
+EMAIL_DUMP_IDS: set[str] = set()
+
 # These emails will be suppressed in the curated views
 UNINTERESTING_EMAIL_IDS = [
     # Alan Dlugash
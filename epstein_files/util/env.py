@@ -59,10 +59,14 @@ output.add_argument('--all-emailers', '-ae', action='store_true', help='all the
 output.add_argument('--all-emails-chrono', '-aec', action='store_true', help='all emails in chronological order')
 output.add_argument('--all-other-files', '-ao', action='store_true', help='all the non-email, non-text msg files instead of just the interesting ones')
 output.add_argument('--all-texts', '-at', action='store_true', help='all the text messages instead of just the interesting ones')
+output.add_argument('--brotli-level', type=int, default=11, help='brotli quality for --precompress (requires the brotli package)')
 output.add_argument('--emailers-info', '-ei', action='store_true', help='write a .png of the eeailers info table')
+output.add_argument('--gzip-level', type=int, default=9, help='gzip compression level for --precompress')
+output.add_argument('--inline-styles', action='store_true', help='inline CSS on every <span> instead of using shared CSS classes')
 output.add_argument('--json-files', action='store_true', help='pretty print all the raw JSON data files in the collection and exit')
 output.add_argument('--json-metadata', '-jm', action='store_true', help='dump JSON metadata for all files and exit')
 output.add_argument('--mobile', '-mob', action='store_true', help='build a mobile version of the site')
+output.add_argument('--ndjson', action='store_true', help='write --json-metadata as newline delimited JSON (one record per line)')
 output.add_argument('--output-curated', '-curated', action='store_true', help="curated files of all types")
 output.add_argument('--output-most-interesting', '-top10', action='store_true', help='only the highest scoring documents')
 output.add_argument('--output-bios', '-bios', action='store_true', help='output one line biographies + links for all Contacts')
@@ -74,6 +78,8 @@ output.add_argument('--output-notes', '-on', action='store_true', help='output l
 output.add_argument('--output-other', '-oo', action='store_true', help='generate other files section')
 output.add_argument('--output-texts', '-ot', action='store_true', help='generate text messages section')
 output.add_argument('--output-word-count', '-ow', action='store_true', help='generate table of most frequently used words')
+output.add_argument('--precompress', action='store_true', help='also write .gz and .br versions of the files that are built')
+output.add_argument('--shard-metadata', action='store_true', help='write --json-metadata to one file per document type')
 output.add_argument('--sort-alphabetical', action='store_true', help='sort tables alphabetically intead of by count')
 output.add_argument(SUPPRESS_OUTPUT, action='store_true', help='no output to terminal (use with --build)')
 output.add_argument('--uninteresting', action='store_true', help='only output uninteresting other files')
@@ -102,6 +108,7 @@ debug.add_argument('--load-new', '-ln', action='store_true', help='load any new
 debug.add_argument('--max-records', '-mr', type=int, help='maximum number of records to print')
 debug.add_argument('--only-no-config', '-onc', action='store_true', help="only show files with no config")
 debug.add_argument('--no-doublespace', '-nd', action='store_true', help='no auto doublespacing')
+debug.add_argument('--reclassify', action='store_true', help='reload any files whose type has changed due to config changes')
 debug.add_argument('--reload-doj', '-rd', action='store_true', help='reload only the DOJ files, not HOUSE_OVERSIGHT')
 debug.add_argument('--repair', '-r', action='store_true', help='reload file IDs specified in the positional args')
 debug.add_argument('--show-urls', '-urls', action='store_true', help='show the site URLs generated by this code')
@@ -216,7 +223,7 @@ if args.open_both:
     args.open_pdf = True
     args.open_txt = True
 
-if args.repair or args.load_new:
+if args.repair or args.load_new or args.reclassify:
     args.constantize = True
 
 if args.side_panel_notes and args.mobile:
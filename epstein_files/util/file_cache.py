@@ -0,0 +1,41 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class FileCache(Generic[T]):
+    """
+    Results of parsing files keyed by file path. Entries are only reused if the file's mtime hasn't changed.
+    If `max_entries` is set the least recently used entry is evicted once there are more than that many.
+    The same parsed objects are returned every time so callers should not modify them.
+
+    Attributes:
+        parse (Callable[[Path], T]): reads and parses a file
+        max_entries (int, optional): maximum number of parsed files to keep (None means no limit)
+        _entries (OrderedDict[Path, tuple[int, T]]): mtime (in nanoseconds) and parse result for each path,
+            least recently used first
+    """
+    parse: Callable[[Path], T]
+    max_entries: int | None = None
+    _entries: OrderedDict[Path, tuple[int, T]] = field(default_factory=OrderedDict)
+
+    def load(self, path: Path) -> T:
+        mtime = path.stat().st_mtime_ns
+        cached = self._entries.get(path)
+
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, self.parse(path))
+            self._entries[path] = cached
+
+            if self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        self._entries.move_to_end(path)
+        return cached[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,6 +2,7 @@ import re
 import shutil
 from contextlib import contextmanager
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 from subprocess import check_output, run
 from typing import Generator
@@ -71,9 +72,11 @@ def coerce_file_path(filename_or_id: int | str) -> Path:
     filename = coerce_file_name(filename_or_id)
 
     if isinstance(filename_or_id, str) and is_doj_file(filename_or_id):
-        for txt_file in DOJ_TXTS_20260130_DIR.glob('**/*.txt'):
-            if txt_file.name == filename:
-                return txt_file
+        if filename not in doj_txt_paths_by_name():
+            doj_txt_paths_by_name.cache_clear()  # Rescan in case the file was added after the first lookup
+
+        if (txt_file := doj_txt_paths_by_name().get(filename)):
+            return txt_file
 
         raise FileNotFoundError(f"'{filename_or_id}' looks like a DOJ file ID but no file named {filename} in '{DOJ_TXTS_20260130_DIR}'!")
     else:
@@ -122,6 +125,12 @@ def diff_files(file1: str | Path, file2: str | Path, print_to_console: bool = Tr
     return diff_result
 
 
+@cache
+def doj_txt_paths_by_name() -> dict[str, Path]:
+    """Map of file name to path for every DOJ .txt file (all the DataSet dirs are only scanned once)."""
+    return {txt_file.name: txt_file for txt_file in doj_txt_paths()}
+
+
 def extract_efta_id(file_id: str) -> int:
     return int(file_id.removeprefix(EFTA_PREFIX))
 
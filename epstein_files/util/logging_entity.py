@@ -8,6 +8,7 @@ class LoggingEntity(ABC):
     """
     Classes that implement `_identifier()` or overload `_log_prefix()` can call self._log(), self._warn(), etc.
     """
+    __slots__ = ()  # So slotted subclasses don't get a __dict__ anyway
 
     @property
     def _class_name(self) -> str:
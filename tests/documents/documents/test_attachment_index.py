@@ -0,0 +1,25 @@
+from epstein_files.documents.documents.attachment_index import AttachmentIndex, normalize_attachment_name
+from epstein_files.documents.email import Email
+
+
+def _email(tmp_path, file_id: str, attachments: str) -> Email:
+    email_path = tmp_path.joinpath(f"HOUSE_OVERSIGHT_{file_id}.txt")
+    email_path.write_text(f"From: Jeffrey Epstein\nSent: 1/2/2015 10:00 AM\nTo: Ghislaine Maxwell\nAttachments: {attachments}\nSubject: docs\n\nsee attached")
+    return Email(email_path)
+
+
+def test_normalize_attachment_name():
+    assert normalize_attachment_name(' "Flight  Logs.PDF" ') == 'flight logs.pdf'
+
+
+def test_attachment_index(tmp_path):
+    pdf_email = _email(tmp_path, '999990', 'Flight Logs.pdf; budget.xlsx')
+    pdfs_email = _email(tmp_path, '999989', 'flight  logs.PDF;notes.pdf; image001.jpg')
+    assert pdf_email.attachments == ['Flight Logs.pdf', 'budget.xlsx']
+
+    index = AttachmentIndex.build([pdf_email, pdfs_email])
+    assert index.email_ids_with('FLIGHT LOGS.pdf') == [pdf_email.file_id, pdfs_email.file_id]
+    assert index.email_ids_with('missing.doc') == []
+    assert index.email_ids_with_extension('.PDF') == [pdf_email.file_id, pdfs_email.file_id]
+    assert index.email_ids_with_extension('jpg', 'xlsx') == [pdfs_email.file_id, pdf_email.file_id]
+    assert index.spreadsheet_email_ids == [pdf_email.file_id]
@@ -0,0 +1,34 @@
+import re
+
+from epstein_files.documents.documents.ocr_repairer import OcrRepairer, required_literal
+from epstein_files.documents.email import OCR_REPAIRER, OCR_REPAIRS
+
+
+def test_required_literal():
+    assert required_literal(re.compile(r"\bBamaby\b")) == 'Bamaby'
+    assert required_literal(re.compile(r"^Subject[.•]{,2} ")) == 'Subject'
+    assert required_literal(re.compile(r"(Sent|Subject) from my (iPhone)")) == ' from my '
+    assert required_literal(re.compile(r"(^|\s)[<=][AC]\d+")) == ''
+    assert required_literal(re.compile(r"(?i:abc)def")) == 'def'
+
+
+def test_ignorecase_prefilter():
+    repairer = OcrRepairer.compile({re.compile(r"jeffrey", re.IGNORECASE): 'Jeffrey'})
+    assert repairer.steps[0].could_match('JEFFREY E.')
+    assert not repairer.steps[0].could_match('Jeff E.')
+    assert repairer.repair('JEFFREY E.') == 'Jeffrey E.'
+
+
+def test_repairs_applied_in_order():
+    repairs = {'Jefrey': 'Jeffrey', re.compile(r"Jeffrey E\."): 'Jeffrey Epstein', 'Epstein Epstein': 'Epstein'}
+    assert OcrRepairer.compile(repairs).repair('Jefrey E. Epstein') == 'Jeffrey Epstein'
+
+
+def test_compiled_repairs():
+    text = 'From: Jeffrey Epstein\nSent from my IPhone\nwrote:\n»\n»\nSubject: meeting'
+    expected = text
+
+    for pattern, replacement in OCR_REPAIRS.items():
+        expected = pattern.sub(replacement, expected) if isinstance(pattern, re.Pattern) else expected.replace(pattern, replacement)
+
+    assert OCR_REPAIRER.repair(text) == expected
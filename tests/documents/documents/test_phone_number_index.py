@@ -0,0 +1,26 @@
+from types import SimpleNamespace
+
+from epstein_files.documents.documents.phone_number_index import PhoneNumberIndex, normalize_phone_number
+from epstein_files.documents.emails.emailers import ENTITIES_DICT
+from epstein_files.people.names import JAY_LEFKOWITZ
+
+DOCS = [
+    SimpleNamespace(file_id='EFTA00000001', text='Call Jay at (917) 617-2278 or +1 212 555 1212'),
+    SimpleNamespace(file_id='EFTA00000002', text='917.617.2278\nfax: 0000 000 0000'),
+]
+
+
+def test_normalize_phone_number():
+    assert normalize_phone_number('+1 (917) 617-2278') == '9176172278'
+    assert normalize_phone_number('+33 6 48 51 97 51') == '33648519751'
+
+
+def test_phone_number_index():
+    index = PhoneNumberIndex.build(DOCS)
+    assert index.file_ids_for('917-617-2278') == ['EFTA00000001', 'EFTA00000002']
+    assert index.mentions_of('9176172278')[0].offset == DOCS[0].text.index('917')
+    assert index.file_ids_for('2125551212') == ['EFTA00000001']
+    assert not any(n.startswith('0000') for n in index.mentions)
+    assert index.entity_for('19176172278') is ENTITIES_DICT[JAY_LEFKOWITZ]
+    assert index.known_numbers == {'9176172278': ENTITIES_DICT[JAY_LEFKOWITZ]}
+    assert list(index.mentions_of_entity(ENTITIES_DICT[JAY_LEFKOWITZ])) == ['9176172278']
@@ -0,0 +1,53 @@
+import os
+import pickle
+
+import pytest
+
+from epstein_files.documents.document import Document
+from epstein_files.documents.documents import text_store
+from epstein_files.documents.documents.text_store import TextStore
+
+
+def test_text_store(tmp_path):
+    store = TextStore(tmp_path.joinpath('test.texts'))
+    refs = store.write(['first', 'Ελληνικά', ''])
+    assert [store.read(ref) for ref in refs] == ['first', 'Ελληνικά', '']
+
+    # A new blob gets its own file so refs to the old one keep working until it's removed
+    new_refs = store.write(['second'])
+    assert new_refs[0].blob_id != refs[0].blob_id
+    assert store.read(new_refs[0]) == 'second'
+    assert store.read(refs[0]) == 'first'
+
+    os.utime(store.blob_path(refs[0].blob_id), ns=(0, 0))
+    store.remove_stale_blobs(new_refs[0].blob_id)
+    assert sorted(tmp_path.iterdir()) == [store.blob_path(new_refs[0].blob_id)]
+
+    with pytest.raises(FileNotFoundError):
+        TextStore(store.path).read(refs[0])
+
+
+def test_text_store_blob_id_mismatch(tmp_path):
+    store = TextStore(tmp_path.joinpath('test.texts'))
+    ref = store.write(['first'])[0]
+    store.blob_path(ref.blob_id).write_bytes(b'0' * 40)
+
+    with pytest.raises(ValueError):
+        TextStore(store.path).open(ref.blob_id)
+
+
+def test_document_text_ref(monkeypatch, tmp_path):
+    store = TextStore(tmp_path.joinpath('test.texts'))
+    monkeypatch.setattr(text_store, 'TEXT_STORE', store)
+    doc_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999996.txt')
+    doc_path.write_text('some text')
+    doc = Document(doc_path)
+    doc._text_ref = store.write([doc.text])[0]
+
+    unpickled = pickle.loads(pickle.dumps(doc))
+    assert 'text' not in unpickled.__dict__
+    assert unpickled.text == 'some text'
+
+    unpickled._set_text(text='new text')
+    assert unpickled._text_ref is None
+    assert pickle.loads(pickle.dumps(unpickled)).text == 'new text'
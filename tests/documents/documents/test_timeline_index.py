@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from dateutil import tz
+
+from epstein_files.documents.documents.timeline_index import TimelineEvent, TimelineIndex
+from epstein_files.documents.email import Email
+from epstein_files.documents.messenger_log import MessengerLog
+from epstein_files.people.names import GHISLAINE_MAXWELL, JEFFREY_EPSTEIN
+
+
+def test_timeline_index(tmp_path):
+    email_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999994.txt')
+    email_path.write_text('From: Ghislaine Maxwell\nSent: 10/12/2015 12:00 PM\nTo: Jeffrey Epstein\nSubject: hi\n\nlunch?')
+    log_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999993.txt')
+    log_path.write_text('Sender:\nTime: 10/12/15 9:15:01 AM\nMessage: hi\n\nSender: e:\nTime: 10/13/15 9:20:44 PM\nMessage: yes')
+    email = Email(email_path)
+    messenger_log = MessengerLog(log_path)
+    messenger_log.extracted_author = GHISLAINE_MAXWELL
+
+    index = TimelineIndex.build([messenger_log, email])
+    assert index.between(JEFFREY_EPSTEIN, GHISLAINE_MAXWELL) == [
+        TimelineEvent(datetime(2015, 10, 12, 9, 15, 1, tzinfo=tz.UTC), messenger_log.file_id, 0),
+        TimelineEvent(email.timestamp, email.file_id),
+        TimelineEvent(datetime(2015, 10, 13, 21, 20, 44, tzinfo=tz.UTC), messenger_log.file_id, 1),
+    ]
+
+    start = datetime(2015, 10, 12, 10, tzinfo=tz.UTC)
+    assert [e.file_id for e in index.between(GHISLAINE_MAXWELL, JEFFREY_EPSTEIN, start=start)] == [email.file_id, messenger_log.file_id]
+    assert index.between(GHISLAINE_MAXWELL, JEFFREY_EPSTEIN, end=datetime(2015, 1, 1, tzinfo=tz.UTC)) == []
+    assert index.between(GHISLAINE_MAXWELL, None) == []
+    assert index.counterparties(JEFFREY_EPSTEIN) == [GHISLAINE_MAXWELL]
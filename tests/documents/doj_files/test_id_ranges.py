@@ -0,0 +1,31 @@
+import pytest
+
+from epstein_files.documents.doj_file import BAD_OCR_ID_RANGES
+from epstein_files.documents.doj_files.id_ranges import IdRangeIndex
+
+
+def test_id_range_index():
+    index = IdRangeIndex.build([range(50, 60), range(10, 20), range(30, 40)])
+    assert list(index) == [range(10, 20), range(30, 40), range(50, 60)]
+    assert index.find(10) == range(10, 20)
+    assert index.find(39) == range(30, 40)
+    assert index.find(40) is None
+    assert index.find(5) is None
+    assert 59 in index
+    assert 60 not in index
+
+    index.add(range(20, 30), 'data set 2')
+    assert index.label_for(25) == 'data set 2'
+    assert index.label_for(15) is None
+    assert len(index) == 4
+
+    for bad_range in [range(35, 45), range(5, 11), range(0, 100), range(70, 70), range(70, 80, 2)]:
+        with pytest.raises(ValueError):
+            index.add(bad_range)
+
+
+def test_bad_ocr_id_ranges():
+    assert BAD_OCR_ID_RANGES.find(20) == range(20, 345)
+    assert 345 not in BAD_OCR_ID_RANGES
+    assert 1887 in BAD_OCR_ID_RANGES
+    assert 1888 not in BAD_OCR_ID_RANGES
@@ -0,0 +1,32 @@
+from epstein_files.documents.doj_files.phone_log import PhoneCall, PhoneLog
+
+PHONE_LOG_TEXT = """
+Telephone # 2125551212 Billing # 2125550000 Case #12
+000123  AB12C  917 617 2278  NEW YORK
+1. 3/12 10:30am NEW YORK NY  212 555-0101 xyz
+19175551234
+Total Calls
+Billing # 2125559999
+Telephone It 6465550000
+foo 212 555 1111 PRI yes
+917 617-2278
+"""
+
+
+def test_phone_log():
+    phone_log = PhoneLog.parse(PHONE_LOG_TEXT, 'EFTA01242527')
+
+    assert phone_log.calls == [
+        PhoneCall('2125551212', '9176172278', '2125550000'),
+        PhoneCall('2125551212', '2125550101', '2125550000', 'NEW YORK NY'),
+        PhoneCall('2125551212', '19175551234', '2125550000'),
+        PhoneCall('6465550000', '2125551111', '2125559999'),
+        PhoneCall('6465550000', '9176172278', '2125559999'),
+    ]
+
+    assert phone_log.source_numbers == ['2125551212', '6465550000']
+    assert phone_log.billing_numbers == ['2125550000', '2125559999']
+    assert phone_log.destination_counts['9176172278'] == 2
+    assert phone_log.source_counts['2125551212'] == 3
+    assert phone_log.counts_by_source['6465550000'] == {'2125551111': 1, '9176172278': 1}
+    assert phone_log.junk_lines == {'', 'Total Calls'}
@@ -0,0 +1,39 @@
+import pickle
+import re
+from email.message import EmailMessage
+
+from epstein_files.documents.emails.dropsite_email import DropsiteEmail, parse_eml
+from epstein_files.util.helpers import file_helper
+
+
+def _write_eml(path, body: str) -> None:
+    message = EmailMessage()
+    message['From'] = 'Jeffrey Epstein <jeevacation@gmail.com>'
+    message['To'] = 'Ghislaine Maxwell'
+    message['Subject'] = 'photos'
+    message['Date'] = 'Mon, 2 Jan 2012 10:00:00 -0500'
+    message.set_content(body)
+    message.add_attachment(b'%PDF-1.4', maintype='application', subtype='pdf', filename='itinerary.pdf')
+    path.write_bytes(message.as_bytes())
+
+
+def test_parse_eml(tmp_path):
+    eml_path = tmp_path.joinpath('test.eml')
+    _write_eml(eml_path, 'see attached')
+    parsed = parse_eml(eml_path)
+    assert parsed.body.strip() == 'see attached'
+    assert parsed.attachments == ['itinerary.pdf']
+    assert parsed.message['subject'] == 'photos'
+
+
+def test_dropsite_email_attachments(monkeypatch, tmp_path):
+    monkeypatch.setattr(file_helper, 'DROPSITE_FILE_NAME_REGEX', re.compile(fr"{tmp_path}.* (\d\d\d\d-\d\d-\d\d \d+)\.eml"))
+    eml_path = tmp_path.joinpath('Jeffrey Epstein 2012-01-02 1234.eml')
+    _write_eml(eml_path, 'see attached')
+    email = DropsiteEmail(eml_path)
+    assert email.eml_attachments == ['itinerary.pdf']
+
+    # Attachments survive pickling without the .eml file
+    eml_path.unlink()
+    assert pickle.loads(pickle.dumps(email)).attachments == email.attachments
+    assert 'itinerary.pdf' in email.attachments
@@ -13,6 +13,16 @@ Sent:
 To:
 Subject: Illmatic"""
 
+FULL_HEADER = """From: Nas
+on behalf of Jeffrey Epstein
+Sent: 4/19/1994 9:00 AM
+To: AZ; ; Large Professor
+Bee:
+From: Q-Tip
+Inline-Images: track1.jpg___
+Subject: Illmatic
+"""
+
 
 def test_is_empty():
     assert EmailHeader(field_names=[]).is_empty
@@ -20,6 +30,23 @@ def test_is_empty():
     assert not EmailHeader.from_header_lines(NON_EMPTY_HEADER).is_empty
 
 
+def test_from_header_lines():
+    header = EmailHeader.from_header_lines(FULL_HEADER)
+    assert header.field_names == ['author', 'sent_at', 'to', 'bcc', 'inline_images', 'subject']
+    assert header.author == 'Jeffrey Epstein'
+    assert header.sent_at == '4/19/1994 9:00 AM'
+    assert header.to == ['AZ', 'Large Professor']
+    assert header.bcc is None
+    assert header.all_attachments == ['track1.jpg']
+    assert header.as_dict() == {
+        'author': 'Jeffrey Epstein',
+        'sent_at': '4/19/1994 9:00 AM',
+        'subject': 'Illmatic',
+        'inline_images': 'track1.jpg',
+        'to': ['AZ', 'Large Professor'],
+    }
+
+
 def test_is_to_redacted(get_email, console):
     assert get_email('030889').header.is_to_redacted is False
     assert get_email('EFTA02230132').header.is_to_redacted is True
@@ -0,0 +1,35 @@
+import re
+
+from epstein_files.documents.emails.email_header import EMAIL_HEADER_FIELDS_PATTERN
+from epstein_files.documents.emails.header_blocks import EMAIL_HEADER_BLOCK_SCANNER, HeaderBlock
+
+# The regex the scanner replaced
+HEADER_LINE_BREAK_REGEX = re.compile(fr"(((?:(?:{EMAIL_HEADER_FIELDS_PATTERN}):|on behalf of ?)(?! +(by |from my|via )).*\n){{3,}})")
+
+THREAD = """see you there From: Jeffrey Epstein
+Sent: Monday
+To: Ghislaine
+Subject: dinner
+ok
+Sent: from my iPhone
+From: Ghislaine
+Sent: Sunday
+To: Jeffrey
+not a block
+Von: a
+Gesendet: b
+"""
+
+
+def test_find():
+    blocks = EMAIL_HEADER_BLOCK_SCANNER.find(THREAD)
+    assert blocks == [HeaderBlock(14, 79), HeaderBlock(103, 144)]
+    assert THREAD[blocks[0].start:blocks[0].end].startswith('From: Jeffrey')
+    assert THREAD[blocks[1].start:blocks[1].end] == 'From: Ghislaine\nSent: Sunday\nTo: Jeffrey\n'
+    assert EMAIL_HEADER_BLOCK_SCANNER.segments(THREAD)[0] == 'see you there '
+    assert ''.join(EMAIL_HEADER_BLOCK_SCANNER.segments(THREAD)) == THREAD
+
+
+def test_add_line_breaks():
+    for text in [THREAD, THREAD.rstrip(), 'on behalf of x\nFrom: y\nTo: z', 'on behalf of x\nFrom: y\nTo: z\n', '']:
+        assert EMAIL_HEADER_BLOCK_SCANNER.add_line_breaks(text) == HEADER_LINE_BREAK_REGEX.sub(r'\n\1\n', text)
@@ -0,0 +1,65 @@
+from epstein_files.documents.email import Email
+from epstein_files.documents.emails import multi_email_files
+from epstein_files.documents.emails.multi_email_files import (detect_email_dump_ids, find_email_dumps, is_email_dump,
+     split_up_email_dump)
+
+FIRST_EMAIL = """From: Jeffrey Epstein
+Sent: 1/2/2015 10:00 AM
+To: Ghislaine Maxwell
+Subject: lunch
+
+see you at noon
+"""
+
+FORWARDED_EMAIL = """From: Ghislaine Maxwell
+Sent: 1/3/2015 11:00 AM
+To: Jeffrey Epstein
+Subject: Fwd: dinner
+
+take a look
+---------- Forwarded message ----------
+From: Someone Else
+Sent: 1/1/2015 9:00 AM
+To: Ghislaine Maxwell
+Subject: dinner
+
+are you free?
+"""
+
+
+def test_split_up_email_dump(tmp_path):
+    dump_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999992.txt')
+    dump_path.write_text(FIRST_EMAIL + FORWARDED_EMAIL + FIRST_EMAIL)
+    big_email = Email(dump_path)
+    emails = split_up_email_dump(big_email)
+
+    assert [e.file_id for e in emails] == ['999992_1', '999992_2']  # The repeat of the first email is dropped
+    assert [e.subject for e in emails] == ['lunch', 'Fwd: dinner']
+    assert emails[0].text == FIRST_EMAIL.strip()
+    assert emails[1].text.endswith('are you free?')  # Forwarded email stays with the email forwarding it
+
+
+def test_is_email_dump(monkeypatch, tmp_path):
+    dump_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999991.txt')
+    dump_path.write_text(FIRST_EMAIL * 3)
+    assert not is_email_dump(Email(dump_path))
+    monkeypatch.setattr(multi_email_files, 'MIN_DUMPED_EMAILS', 3)
+    assert is_email_dump(Email(dump_path))
+
+
+def test_quoted_replies_are_not_dumps(monkeypatch, tmp_path):
+    monkeypatch.setattr(multi_email_files, 'MIN_DUMPED_EMAILS', 3)
+    thread_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999993.txt')
+    thread_path.write_text(FIRST_EMAIL + '\n-----Original Message-----\n' + FIRST_EMAIL + '\n' + '_' * 32 + '\n' + FIRST_EMAIL)
+    assert not is_email_dump(Email(thread_path))
+
+
+def test_find_email_dumps(monkeypatch, tmp_path):
+    monkeypatch.setattr(multi_email_files, 'MIN_DUMPED_EMAILS', 3)
+    dump_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999991.txt')
+    dump_path.write_text(FIRST_EMAIL * 3)
+    dump = Email(dump_path)
+    assert detect_email_dump_ids([dump]) == {dump.file_id}
+    assert find_email_dumps([dump]) == []  # Detected but not configured
+    monkeypatch.setattr(multi_email_files, 'EMAIL_DUMP_IDS', {dump.file_id})
+    assert find_email_dumps([dump]) == [dump]
@@ -0,0 +1,62 @@
+import pickle
+from datetime import datetime
+
+from dateutil import tz
+
+from epstein_files.documents.documents import text_store
+from epstein_files.documents.documents.text_store import TextStore
+from epstein_files.documents.emails.constants import FALLBACK_TIMESTAMP
+from epstein_files.documents.imessage.message_columns import MessageColumns
+from epstein_files.documents.imessage.text_message import TextMessage
+from epstein_files.documents.messenger_log import MessengerLog
+from epstein_files.documents.messenger_log_pdf import TextMessagePdf
+from epstein_files.people.names import JEFFREY_EPSTEIN
+
+from .test_message_records import LOG_TEXT
+
+
+def test_message_columns():
+    messages = [
+        TextMessage(author='e:', text='are you around?', timestamp_str='10/12/15 9:15:01 AM'),
+        TextMessage(author=None, text='http://example.com/a b', timestamp_str='10/12/15 9:20:44 PM'),
+        TextMessage(author='Anil Ambani', is_id_confirmed=True, text='Ελληνικά\nok', timestamp_str='garbled'),
+    ]
+
+    columns = MessageColumns.build(messages)
+    assert len(columns) == 3
+    assert list(columns) == messages
+    assert columns[-1] == messages[-1]
+    assert columns[:2] == messages[:2]
+    assert [m.author_str for m in columns] == [m.author_str for m in messages]
+    assert [m.is_id_confirmed for m in columns] == [False, False, True]
+    assert columns.names.count(JEFFREY_EPSTEIN) == 1
+    assert [m.timestamp_sort_key for m in columns] == [m.timestamp_sort_key for m in messages]
+    assert columns[0].parse_timestamp() == datetime(2015, 10, 12, 9, 15, 1, tzinfo=tz.UTC)
+    assert columns[2].timestamp_sort_key == FALLBACK_TIMESTAMP
+    assert pickle.loads(pickle.dumps(columns)) == columns
+
+
+def test_message_columns_view_class():
+    columns = MessageColumns.build([TextMessagePdf(author=None, text='hi', timestamp_str='2018-10-01 12:00:00')])
+    assert isinstance(columns[0], TextMessagePdf)
+    assert columns[0].parse_timestamp() == datetime(2018, 10, 1, 12, tzinfo=tz.UTC)
+    assert list(MessageColumns()) == []
+
+
+def test_message_texts_point_into_log(monkeypatch, tmp_path):
+    store = TextStore(tmp_path.joinpath('test.texts'))
+    monkeypatch.setattr(text_store, 'TEXT_STORE', store)
+    log_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999994.txt')
+    log_path.write_text(LOG_TEXT + 'Sender: e:\nTime: 10/12/15 9:22:00 PM\nMessage: http://example.com/a b\n')
+    messenger_log = MessengerLog(log_path)
+    columns = messenger_log.messages
+    texts = ['are you around?', 'yes call me', '', 'http://example.com/a_b']
+    assert [m.text for m in columns] == texts
+    assert list(columns.text_starts[:2]) == [messenger_log.text.index(t) for t in ['are you', 'yes\ncall']]
+    assert columns.other_texts == {3: texts[3]}  # Links have their whitespace rewritten so aren't slices
+
+    # Only the offsets are pickled; the texts come from the log's text in the store
+    messenger_log._text_ref = store.write([messenger_log.text])[0]
+    pickled = pickle.dumps(messenger_log)
+    assert b'call me' not in pickled
+    assert [m.text for m in pickle.loads(pickled).messages] == texts
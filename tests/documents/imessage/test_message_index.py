@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from epstein_files.documents.imessage.message_index import MessageIndex
+from epstein_files.documents.messenger_log import MessengerLog
+from epstein_files.documents.imessage.text_message import TextMessage
+from epstein_files.people.names import JEFFREY_EPSTEIN
+
+from .test_message_records import LOG_TEXT
+
+
+def _text(author: str, timestamp_str: str, text: str = 'hi') -> TextMessage:
+    return TextMessage(author=author, text=text, timestamp_str=timestamp_str)
+
+
+def test_message_index():
+    messages = [
+        _text('Anil Ambani', '10/12/15 9:15:01 PM', 'third'),
+        _text('Anil Ambani', '10/12/15 9:15:01 AM', 'first'),
+        _text(JEFFREY_EPSTEIN, '10/12/15 9:16:00 AM'),
+        _text('Anil Ambani', 'garbled OCR'),
+        _text('Anil Ambani', '10/12/15 9:15:01 AM', 'second'),
+    ]
+
+    index = MessageIndex.build(messages)
+    assert index.counts == {'Anil Ambani': 4, JEFFREY_EPSTEIN: 1}
+    assert index.counts['Nobody'] == 0
+    assert [m.text for m in index.sorted_messages_by('Anil Ambani')] == ['first', 'second', 'third']
+    assert index.sorted_messages_by('Nobody') == []
+    assert index.first_message_at('Anil Ambani') == datetime(2015, 10, 12, 9, 15, 1, tzinfo=timezone.utc)
+    assert index.last_message_at('Anil Ambani') == datetime(2015, 10, 12, 21, 15, 1, tzinfo=timezone.utc)
+    assert index.first_message_at('Nobody') is None
+    assert index.last_message_at('Nobody') is None
+
+    start = datetime(2015, 10, 12, 9, 15, 1, tzinfo=timezone.utc)
+    end = datetime(2015, 10, 12, 12, tzinfo=timezone.utc)
+    assert [m.text for m in index.messages_between('Anil Ambani', start, end)] == ['first', 'second']
+    assert index.messages_between('Nobody', start, end) == []
+
+
+def test_message_index_for_logs(tmp_path):
+    logs = []
+
+    for i, log_text in enumerate([LOG_TEXT, LOG_TEXT.replace('10/12/15', '10/13/15')]):
+        log_path = tmp_path.joinpath(f"HOUSE_OVERSIGHT_99998{i}.txt")
+        log_path.write_text(log_text)
+        logs.append(MessengerLog(log_path))
+
+    index = MessageIndex.for_logs(logs)
+    assert index.counts[JEFFREY_EPSTEIN] == 2
+    assert [m.text for m in index.sorted_messages_by(JEFFREY_EPSTEIN)] == ['are you around?', 'are you around?']
+    assert index.last_message_at(JEFFREY_EPSTEIN) == datetime(2015, 10, 13, 9, 15, 1, tzinfo=timezone.utc)
+
+    # Narrowing down an index doesn't re-sort and keeps the views pointing at the right logs
+    assert index.for_subset(logs) is index
+    subset = index.for_subset(logs[1:])
+    assert subset.counts[JEFFREY_EPSTEIN] == 1
+    assert subset.first_message_at(JEFFREY_EPSTEIN) == datetime(2015, 10, 13, 9, 15, 1, tzinfo=timezone.utc)
+    assert MessengerLog.count_authors(logs[1:], index) == MessengerLog.count_authors(logs[1:])
+
+    with pytest.raises(ValueError):
+        subset.for_subset(logs[:1])
@@ -0,0 +1,37 @@
+from epstein_files.documents.imessage.message_records import MessageRecord, tokenize_messages
+from epstein_files.documents.messenger_log import MSG_REGEX, MessengerLog
+
+LOG_TEXT = """Sender: e:jeeitunes@gmail.com
+Time: 10/12/15 9:15:01 AM
+Message: are you around?
+
+Sender:
+Time: 10/12/15 9:20:44 PM
+Message: yes
+call me
+
+Sender: +16465551212
+Time: 10/12/15 9:21:00 PM (something)
+Message:
+"""
+
+
+def test_tokenize_messages():
+    assert tokenize_messages(LOG_TEXT) == [
+        MessageRecord(' e:jeeitunes@gmail.com', ' 10/12/15 9:15:01 AM', ' are you around?'),
+        MessageRecord('', ' 10/12/15 9:20:44 PM', ' yes\ncall me'),
+        MessageRecord(' +16465551212', ' 10/12/15 9:21:00 PM', ''),
+    ]
+
+    for text in [LOG_TEXT, LOG_TEXT.replace(' PM', ''), 'Sender: x\nTime: 1 AM Message: y\nSenders', '']:
+        assert tokenize_messages(text) == [MessageRecord(m[1], m[2], m[4]) for m in MSG_REGEX.finditer(text)]
+
+
+def test_messages_parsed_once(tmp_path):
+    log_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999995.txt')
+    log_path.write_text(LOG_TEXT)
+    messenger_log = MessengerLog(log_path)
+    assert messenger_log.extract_messages() is messenger_log.messages
+    assert len(messenger_log.messages) == 3
+    assert messenger_log.phone_number == '+16465551212'
+    assert messenger_log.timestamp_without_seconds == '2015-10-12 09:15'
@@ -1,5 +1,8 @@
+import pickle
 from datetime import datetime
 
+from epstein_files.documents.document import Document
+
 from epstein_files.people.names import *
 from epstein_files.util.helpers.data_helpers import coerce_utc_strict
 
@@ -69,3 +72,34 @@ def test_entities(get_doj_file):
 def test_is_doj_file(doj_file, messenger_log):
     assert doj_file.file_info.is_doj_file is True
     assert messenger_log.file_info.is_doj_file is False
+
+
+def test_looks_like_email(tmp_path):
+    doc_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999998.txt')
+    doc_path.write_text('\nFronn: Jeffrey Epstein\nTo: Ghislaine Maxwell\n\nsee you soon')
+    doc = Document(doc_path)
+    assert doc._looks_like_email is None
+    assert doc.is_email is True
+    assert pickle.loads(pickle.dumps(doc))._looks_like_email is True
+
+    # Classification is remembered even if the text changes
+    doc._set_text(text='see you soon')
+    assert doc.is_email is True
+
+
+def test_lines_not_pickled(tmp_path):
+    doc_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999997.txt')
+    doc_path.write_text('  line one  \nline two\n')
+    doc = Document(doc_path)
+    assert doc.lines == ['line one', 'line two']
+    assert doc.num_lines == 2
+    assert not hasattr(doc.file_info, '__dict__')
+
+    unpickled = pickle.loads(pickle.dumps(doc))
+    assert unpickled._lines is None
+    assert unpickled.lines == doc.lines
+    assert unpickled.file_info == doc.file_info
+
+    doc._set_text(lines=doc.lines[1:])
+    assert doc._lines is None
+    assert doc.lines == ['line two']
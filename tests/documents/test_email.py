@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from epstein_files.documents.email import JUNK_EMAILERS, Email
@@ -50,6 +52,32 @@ def test_broken_header_repair(get_email):
     assert broken_email.header.num_header_rows == 5
 
 
+def test_email_parts_cache(tmp_path):
+    email_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999999.txt')
+    email_path.write_text('From: Jeffrey Epstein\nSent: 1/2/2015 10:00 AM\nTo: Ghislaine Maxwell\nSubject: hi\n\nsee you soon\n\nOn Jan 1, 2015, at 9:00 AM, Ghislaine wrote:\n> ok')
+    email = Email(email_path)
+    assert email.email_parts is email.email_parts
+    assert email.display_text.endswith('> ok')
+    assert email.text[:email._idx_of_nth_quoted_reply(0)].endswith('Ghislaine wrote:')
+    assert email._idx_of_nth_quoted_reply(1) is None
+
+    email._set_text(text=email.text + '\n> bye')
+    assert email._email_parts is None and email._quoted_reply_idxs is None
+    assert email.display_text.endswith('> bye')
+
+    email_parts = email.email_parts
+    email.update_header(to=['Leon Black'])
+    assert email._email_parts is None and email._quoted_reply_idxs is None
+    assert email.email_parts is not email_parts
+
+    email.header = email.extract_header()
+    assert email._email_parts is None
+
+    unpickled = pickle.loads(pickle.dumps(email))
+    assert '_email_parts' not in unpickled.__dict__
+    assert unpickled.display_text == email.display_text
+
+
 def test_extract_recipients(get_email):
     email_to_self: Email = get_email('EFTA01917209').reload()
     assert email_to_self.author == BROCK_PIERCE
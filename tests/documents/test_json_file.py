@@ -0,0 +1,7 @@
+from epstein_files.documents.json_file import load_json
+
+
+def test_load_json(tmp_path):
+    json_path = tmp_path.joinpath('preview.json')
+    json_path.write_bytes(b'\xef\xbb\xbf{"title": "first"}')  # BOM
+    assert load_json(json_path) == {'title': 'first'}
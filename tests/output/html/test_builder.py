@@ -1,4 +1,87 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 from rich.align import Align
+from rich.console import Console
 from rich.padding import Padding
 from rich.panel import Panel
+from rich.table import Table
 from rich.text import Text
+
+from epstein_files.output.html.builder import HTML_CONSOLE_KWARGS, console_buffer_to_html, render_at_width, render_to_html
+from epstein_files.output.html.elements import PRE_CONSOLE_TEMPLATE, SPLITTER
+from epstein_files.output.html.renderer_pool import RendererPool
+from epstein_files.output.html.rich_style import RichStyle
+from epstein_files.output.rich import RICH_THEME, THEME_STYLES
+from epstein_files.util.constant.html import HTML_TERMINAL_THEME
+
+INLINE_POOL = RendererPool(HTML_CONSOLE_KWARGS, HTML_TERMINAL_THEME)
+WIDTHS = [20, 40, 80]
+
+
+def _export_html(obj, width: int) -> str:
+    """The old way: print to a recording console and split off the junk from export_html()."""
+    _console = Console(**{**HTML_CONSOLE_KWARGS, 'width': width})
+    _console.print(obj, end='')
+    html = _console.export_html(code_format=PRE_CONSOLE_TEMPLATE, inline_styles=True, theme=HTML_TERMINAL_THEME)
+    return html.split(SPLITTER)[0]
+
+
+def _renderables() -> list:
+    table = Table('Name', 'Count', title='Title', border_style='red')
+    table.add_row(Text('Jeffrey Epstein', style='bold'), '12')
+    table.add_row('<b>escape me</b> & stuff', '3')
+
+    return [
+        Text('plain text that is long enough to wrap around at narrow widths'),
+        Text('bright red on blue', style='bright_red on blue').append(' and some [link=https://x.com]link[/link]'),
+        Text.from_markup('[link=https://example.com]a link[/link] and [italic]italics[/italic]'),
+        Panel('panel text', border_style='green', style='on gray11'),
+        Align.center(Padding(Text('padded and centered'), (1, 2))),
+        table,
+    ]
+
+
+def test_render_matches_export_html():
+    for width in WIDTHS:
+        for obj in _renderables():
+            assert INLINE_POOL.render_html(obj, width) == _export_html(obj, width)
+
+    assert render_to_html(Text('foo')).startswith('<pre>')
+
+
+def test_console_buffer_to_html():
+    obj = _renderables()[1]
+    _console = Console(**{**HTML_CONSOLE_KWARGS, 'width': WIDTHS[-1]})
+    _console.print(obj, end='')
+    html = console_buffer_to_html(_console, clear=False)
+    assert re.sub(r'<[^>]+>', '', html) == re.sub(r'<[^>]+>', '', _export_html(obj, WIDTHS[-1]))
+    assert console_buffer_to_html(_console) == html
+    assert console_buffer_to_html(_console) == console_buffer_to_html(Console(**HTML_CONSOLE_KWARGS))
+
+
+def test_concurrent_rendering():
+    jobs = [(obj, width) for width in WIDTHS for obj in _renderables()] * 5
+    expected = [_export_html(obj, width) for obj, width in jobs]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        rendered = list(executor.map(lambda job: INLINE_POOL.render_html(*job), jobs))
+
+    assert rendered == expected
+
+    with INLINE_POOL.renderer(WIDTHS[0]) as _console:
+        assert _console.width == WIDTHS[0]
+
+
+def test_css_class_rendering():
+    for style_name in THEME_STYLES:
+        if (css := RICH_THEME.styles[style_name].get_html_style(HTML_TERMINAL_THEME)):
+            assert f"{{ {RichStyle.normalize_css(css)}; }}" in RichStyle.stylesheet()
+
+    for obj in _renderables():
+        html = render_at_width(obj, WIDTHS[-1])
+        assert 'style=' not in html
+        assert re.sub(r'<[^>]+>', '', html) == re.sub(r'<[^>]+>', '', _export_html(obj, WIDTHS[-1]))
+
+        for css_class in re.findall(r'class="(\w+)"', html):
+            assert f".{css_class} {{" in RichStyle.stylesheet()
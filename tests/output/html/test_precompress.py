@@ -0,0 +1,43 @@
+import gzip
+
+from epstein_files.output.html import precompress
+from epstein_files.output.html.precompress import (GZIP_EXTENSION, MANIFEST_FILENAME, Precompressor,
+     compressed_path, compressed_sizes_str)
+
+HTML = '<html><body>' + ('<span class="rs1">Jeffrey Epstein</span> ' * 1_000) + '</body></html>'
+
+
+def test_precompress(tmp_path):
+    html_path = tmp_path.joinpath('page.html')
+    html_path.write_text(HTML)
+    gz_path = compressed_path(html_path, GZIP_EXTENSION)
+    precompressor = Precompressor(gzip_level=6)
+
+    precompressor.submit(html_path)
+    assert gz_path in precompressor.wait()
+    assert gzip.decompress(gz_path.read_bytes()).decode() == HTML
+    assert tmp_path.joinpath(MANIFEST_FILENAME).exists()
+    assert compressed_sizes_str(html_path).startswith(f"{GZIP_EXTENSION}: ")
+
+    # Unchanged contents are not recompressed
+    assert precompressor.compress(html_path) == []
+
+    # Changed contents or compression levels are
+    html_path.write_text(HTML + 'more')
+    assert gz_path in precompressor.compress(html_path)
+    assert Precompressor(gzip_level=1).compress(html_path)
+
+
+def test_no_brotli_warning_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(precompress, 'brotli', None)
+    warnings = []
+    monkeypatch.setattr(precompress.logger, 'warning', lambda msg: warnings.append(msg))
+    precompressor = Precompressor(gzip_level=1)
+
+    for i in range(3):
+        html_path = tmp_path.joinpath(f"page{i}.html")
+        html_path.write_text(HTML)
+        precompressor.submit(html_path)
+
+    precompressor.wait()
+    assert len([w for w in warnings if 'not installed' in w]) == 1
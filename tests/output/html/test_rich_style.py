@@ -24,3 +24,23 @@ def test_hex():
     dim = RichStyle('dim')
     assert dim.foreground_color_hex == '#c0c0c0'
     assert dim.background_color_hex == ''
+
+
+def test_interning():
+    red = RichStyle.get(BRIGHT_RED)
+    assert RichStyle.get(BRIGHT_RED) is red
+    assert red.to_css == {'color': RED_RGB}
+    red.to_css['color'] = 'mutated'
+    assert red.to_css == {'color': RED_RGB}
+
+
+def test_css_class():
+    assert RichStyle.get(None).css_class == ''
+    red_class = RichStyle.get(BRIGHT_RED).css_class
+    assert red_class.startswith('rs')
+    assert RichStyle.get('red1').css_class == red_class  # Same CSS => same class
+    assert RichStyle.get(f'{BRIGHT_RED} bold').css_class != red_class
+    assert f".{red_class} {{ color: {RED_RGB}; }}" in RichStyle.stylesheet()
+    assert RichStyle.css_class_for(f"font-weight:bold;color:{RED_RGB};") == \
+        RichStyle.css_class_for(f"color: {RED_RGB}; font-weight: bold") == \
+        RichStyle.get(f'{BRIGHT_RED} bold').css_class
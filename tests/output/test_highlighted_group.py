@@ -1,6 +1,8 @@
 from rich.text import Text
 
-from epstein_files.output.highlight_config import CATEGORY_STYLES, HIGHLIGHT_GROUPS, get_style_for_category
+from epstein_files.output.highlight_config import (CATEGORY_STYLES, HIGHLIGHT_GROUPS, NameResolver, get_entity,
+     get_style_for_category)
+from epstein_files.output.highlighted_names import HighlightedNames
 from epstein_files.util.constants import *
 from epstein_files.util.helpers.data_helpers import ALL_NAMES
 
@@ -30,5 +32,36 @@ def test_highlight_labels():
         labels.add(highlight_group.label)
 
 
+def test_name_resolver():
+    resolver = NameResolver(HIGHLIGHT_GROUPS)
+
+    for name in ALL_NAMES + ['Ghislaine', 'Nobody In Particular']:
+        group = next((hg for hg in HIGHLIGHT_GROUPS if hg.regex.search(name)), None)
+        assert resolver.group(name) is group
+        assert resolver.group(name) is group  # cached
+        assert resolver.entity(name) is _scan_for_entity(name)
+
+    for name, entity_name in [
+        (BILL_GATES, BILL_GATES),
+        (ELON_MUSK, ELON_MUSK),
+        ('Ghislaine', GHISLAINE_MAXWELL),
+        (JEFFREY_EPSTEIN, JEFFREY_EPSTEIN),
+    ]:
+        assert get_entity(name).name == entity_name
+
+    assert get_entity('Nobody In Particular') is None
+
+
 def test_styled_category():
     assert get_style_for_category('crypto') == 'orange1 bold'
+
+
+def _scan_for_entity(name: str):
+    """The linear sweep of every highlight group's regex that `NameResolver` replaced."""
+    group = next((hg for hg in HIGHLIGHT_GROUPS if hg.regex.search(name)), None)
+
+    if group and isinstance(group, HighlightedNames):
+        if (entity := group.entities_by_name.get(name)):
+            return entity
+
+        return next((entity for entity in group.entities if entity.highlight_regex.search(name)), None)
@@ -0,0 +1,57 @@
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from epstein_files.output.json_metadata import JsonMetadataWriter
+
+BIOS = {'Jeffrey Epstein': 'financier', 'Ghislaine Maxwell': 'socialite'}
+
+DOCS_BY_TYPE = {
+    'Email': [
+        SimpleNamespace(metadata={'id': '012345', 'timestamp': datetime(2015, 1, 2), 'recipients': ['a', None]}),
+        SimpleNamespace(metadata={'id': '023456', 'extracted_file': {'url': 'http://x', 'explanation': 'y'}}),
+    ],
+    'JsonFile': [],
+    'MessengerLog': [SimpleNamespace(metadata={'id': '034567', None: 'unknown'})],
+}
+
+
+def _expected_metadata() -> dict:
+    return {
+        'files': {
+            k: [{'None' if k is None else k: v.isoformat() if isinstance(v, datetime) else v for k, v in d.metadata.items()} for d in docs]
+            for k, docs in DOCS_BY_TYPE.items()
+        },
+        'people': BIOS,
+    }
+
+
+def test_nested_matches_json_dumps(tmp_path):
+    writer = JsonMetadataWriter(tmp_path.joinpath('metadata.json'))
+    paths = writer.write(DOCS_BY_TYPE, BIOS)
+    assert paths == [tmp_path.joinpath('metadata.json')]
+    assert paths[0].read_text() == json.dumps(_expected_metadata(), indent=4, sort_keys=True)
+
+
+def test_ndjson(tmp_path):
+    paths = JsonMetadataWriter(tmp_path.joinpath('metadata.json'), ndjson=True).write(DOCS_BY_TYPE, BIOS)
+    assert paths == [tmp_path.joinpath('metadata.ndjson')]
+    records = [json.loads(line) for line in paths[0].read_text().splitlines()]
+    expected = _expected_metadata()
+    assert records[:3] == expected['files']['Email'] + expected['files']['MessengerLog']
+    assert {r['name']: r['bio'] for r in records[3:]} == BIOS
+
+
+def test_sharded(tmp_path):
+    writer = JsonMetadataWriter(tmp_path.joinpath('metadata.json'), shard=True)
+    paths = writer.write(DOCS_BY_TYPE, BIOS)
+    expected = _expected_metadata()
+    assert [p.name for p in paths] == [f"metadata.{k}.json" for k in [*DOCS_BY_TYPE, 'people']]
+
+    for doc_type, records in expected['files'].items():
+        assert json.loads(writer.shard_path(doc_type).read_text()) == records
+
+    assert json.loads(writer.shard_path('people').read_text()) == BIOS
+    ndjson_paths = JsonMetadataWriter(tmp_path.joinpath('metadata.json'), ndjson=True, shard=True).write(DOCS_BY_TYPE, BIOS)
+    assert ndjson_paths[0].name == 'metadata.Email.ndjson'
+    assert ndjson_paths[1].read_text() == ''
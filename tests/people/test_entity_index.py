@@ -0,0 +1,51 @@
+from epstein_files.documents.emails.emailers import CONFIGURED_NON_ENTITIES, ENTITIES_DICT, ENTITY_INDEX, PHONE_BOOK, get_entity
+from epstein_files.people.entity import Entity
+from epstein_files.people.entity_index import EntityIndex, pattern_spellings, spelling_key
+from epstein_files.people.names import *
+
+
+def test_entity_index():
+    nas = Entity('Nasir Jones', aliases=['Nas', 'Escobar'], email_addresses=['nas@illmatic.com'], phone_numbers=['212-555-1212'])
+    esco = Entity('Escobar')
+    index = EntityIndex([nas, esco])
+    assert index.get('Nasir Jones') is nas
+    assert index.get('nasir  JONES') is nas
+    assert index.get('NAS') is nas
+    assert index.get('nas@illmatic.com') is nas
+    assert index.get('Escobar') is esco  # Names beat other entities' aliases
+    assert index.get('Jones, Nasir') is None
+    assert index.get_by_phone_number('(212) 555-1212') is nas
+    assert index.get('212.555.1212') is nas
+    assert index.get('nasir.jones') is nas
+
+    # Regex matches are remembered
+    assert index.search('Jones, Nasir') is nas
+    assert index.get('Jones, Nasir') is nas
+    assert index.search('Illmatic') is None
+
+
+def test_emailer_pattern_spellings():
+    leff = Entity('Samuel Leff', emailer_pattern=r"Sam(uel)?[-_.\s]*Leff|Leff,?\s*Sam")
+    index = EntityIndex([leff])
+    assert index.get('Sam Leff') is leff
+    assert index.get('sam_leff') is leff
+    assert index.get('Leff, Sam') is leff
+    assert index.get('SamLeff') is leff
+    assert pattern_spellings(r"Sam(uel)?\s+Leff") == ['sam leff', 'samuel leff']
+    assert pattern_spellings(r"\bBS Ste(m|rn)\b") == ['bs stem', 'bs stern']
+    assert pattern_spellings(r"Jeff.*") == []
+
+
+def test_get_entity_prefers_configured_non_entities(monkeypatch):
+    name = 'Nasir Jones'
+    non_entity = Entity(name, is_interesting=False)
+    monkeypatch.setitem(CONFIGURED_NON_ENTITIES, name, non_entity)
+    monkeypatch.setitem(ENTITY_INDEX._by_spelling, spelling_key(name), Entity(name))
+    assert get_entity(name) is non_entity
+
+
+def test_phone_book():
+    lefkowitz = ENTITIES_DICT[JAY_LEFKOWITZ]
+    assert PHONE_BOOK['9176172278'] is lefkowitz
+    assert ENTITY_INDEX.get_by_phone_number('917-617-2278') is lefkowitz
+    assert ENTITY_INDEX.get(JAY_LEFKOWITZ) is lefkowitz
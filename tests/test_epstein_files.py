@@ -7,11 +7,12 @@ from rich.panel import Panel
 from epstein_files.documents.config.pic_cfg import PicCfg
 from epstein_files.documents.document import Document
 from epstein_files.documents.email import Email
+from epstein_files.documents.emails.multi_email_files import detect_email_dump_ids
 from epstein_files.documents.messenger_log import MessengerLog
 from epstein_files.documents.other_file import OtherFile
 from epstein_files.output.rich import console, print_subtitle_panel
 from epstein_files.people.names import *
-from epstein_files.util.constants import CONFIGS_BY_ID
+from epstein_files.util.constants import CONFIGS_BY_ID, EMAIL_DUMP_IDS
 from epstein_files.util.helpers.data_helpers import days_between_abs, uniquify
 from epstein_files.util.helpers.file_helper import diff_files
 from epstein_files.util.helpers.string_helper import prop_str
@@ -101,6 +102,7 @@ def test_imessage_text_counts(epstein_files):
     immesage_log_ids = sorted([doc.file_id for doc in epstein_files.imessage_logs])
     assert immesage_log_ids == IMESSAGE_LOG_IDS
     assert MessengerLog.count_authors(epstein_files.imessage_logs) == MESSENGER_LOG_AUTHOR_COUNTS
+    assert MessengerLog.count_authors(epstein_files.imessage_logs, epstein_files.message_index) == MESSENGER_LOG_AUTHOR_COUNTS
 
 
 def test_no_files_after_2025(epstein_files):
@@ -147,3 +149,9 @@ def test_big_files_were_split_up(epstein_files, split_up_big_email):
     assert split_up_big_email.file_id not in all_doc_ids
     assert split_up_big_email._was_split_up is True
     assert split_up_big_email.reload()._was_split_up is False
+
+
+def test_email_dumps_are_configured(epstein_files):
+    """Splitting up a newly detected email dump has to be a deliberate change to EMAIL_DUMP_IDS."""
+    emails = [doc for doc in epstein_files._documents if isinstance(doc, Email)]
+    assert detect_email_dump_ids(emails) == EMAIL_DUMP_IDS
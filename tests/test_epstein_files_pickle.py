@@ -0,0 +1,98 @@
+import gzip
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+from epstein_files import epstein_files as epstein_files_module
+from epstein_files.documents.document import Document
+from epstein_files.documents.documents import text_store
+from epstein_files.documents.documents.text_store import TextStore
+from epstein_files.epstein_files import EpsteinFiles
+from epstein_files.util.env import args
+
+
+@dataclass
+class PickledInfo:
+    local_path: str
+
+
+@pytest.fixture
+def rebuilt(monkeypatch) -> list[bool]:
+    """Replaces `EpsteinFiles._build_new()` with a stub that records that it was called."""
+    calls = []
+    monkeypatch.setattr(EpsteinFiles, '_build_new', classmethod(lambda cls, timer: calls.append(True) or 'rebuilt'))
+    monkeypatch.setattr(args, 'overwrite_pickle', False)
+    return calls
+
+
+def test_corrupt_pickle_is_rebuilt(tmp_path, monkeypatch, rebuilt):
+    pickle_path = tmp_path.joinpath('corrupt.pkl.gz')
+
+    with gzip.open(pickle_path, 'wb') as file:
+        file.write(b'not a pickle')
+
+    monkeypatch.setattr(args, 'pickle_path', pickle_path)
+    assert EpsteinFiles.get_files() == 'rebuilt'
+    assert rebuilt == [True]
+
+
+def test_pickle_from_before_slots_is_rebuilt(tmp_path, monkeypatch, rebuilt):
+    pickle_path = tmp_path.joinpath('old.pkl.gz')
+
+    with gzip.open(pickle_path, 'wb') as file:
+        pickle.dump(PickledInfo('old.txt'), file)  # Stores a __dict__ state
+
+    @dataclass(slots=True)
+    class SlottedInfo:
+        local_path: str
+
+    monkeypatch.setattr(sys.modules[__name__], 'PickledInfo', SlottedInfo)
+    monkeypatch.setattr(args, 'pickle_path', pickle_path)
+    assert EpsteinFiles.get_files() == 'rebuilt'
+    assert rebuilt == [True]
+
+
+def test_pickle_with_missing_texts_is_rebuilt(tmp_path, monkeypatch, rebuilt):
+    pickle_path = tmp_path.joinpath('texts_gone.pkl.gz')
+    epstein_files = EpsteinFiles.__new__(EpsteinFiles)
+    epstein_files._documents = []
+    epstein_files._pickle_version = EpsteinFiles.PICKLE_VERSION
+    epstein_files._text_blob_id = 'deleted'
+
+    with gzip.open(pickle_path, 'wb') as file:
+        pickle.dump(epstein_files, file)
+
+    monkeypatch.setattr(args, 'pickle_path', pickle_path)
+    assert EpsteinFiles.get_files() == 'rebuilt'
+    assert rebuilt == [True]
+
+
+def test_save_to_disk(tmp_path, monkeypatch, rebuilt):
+    store = TextStore(tmp_path.joinpath('saved.texts'))
+    monkeypatch.setattr(text_store, 'TEXT_STORE', store)
+    monkeypatch.setattr(epstein_files_module, 'TEXT_STORE', store)
+    monkeypatch.setattr(args, 'pickle_path', tmp_path.joinpath('saved.pkl.gz'))
+    doc_path = tmp_path.joinpath('HOUSE_OVERSIGHT_999997.txt')
+    doc_path.write_text('some text')
+    epstein_files = EpsteinFiles.__new__(EpsteinFiles)
+    epstein_files._documents = [Document(doc_path)]
+    epstein_files._pickle_version = EpsteinFiles.PICKLE_VERSION
+    epstein_files._save_to_disk()
+    first_blob_path = store.blob_path(epstein_files._text_blob_id)
+    os.utime(first_blob_path, ns=(0, 0))
+
+    # Saving again writes a new blob and only then removes the old one
+    epstein_files._save_to_disk()
+    assert not first_blob_path.exists()
+    assert sorted(p.name for p in tmp_path.iterdir() if p != doc_path) == sorted([
+        args.pickle_path.name,
+        store.blob_path(epstein_files._text_blob_id).name,
+    ])
+
+    store.close()
+    loaded = EpsteinFiles.get_files()
+    assert rebuilt == []
+    assert loaded._documents[0].text == 'some text'
@@ -1,4 +1,7 @@
+import pytest
+
 from epstein_files.documents.email import Email
+from epstein_files.util.helpers import file_helper
 from epstein_files.util.helpers.file_helper import *
 
 DOJ_ID = 'EFTA01001153'
@@ -9,6 +12,36 @@ def test_build_filename_for_id():
     assert house_file_stem('001234_2') == 'HOUSE_OVERSIGHT_001234_2'
 
 
+def test_coerce_file_path(doj_txts_dir):
+    assert coerce_file_path(DOJ_ID) == doj_txts_dir.joinpath('DataSet 9', f"{DOJ_ID}.txt")
+
+    with pytest.raises(FileNotFoundError):
+        coerce_file_path('EFTA00000001')
+
+    # Files that show up after the first lookup are still found
+    new_file = doj_txts_dir.joinpath('DataSet 1', 'EFTA00000001.txt')
+    new_file.write_text('new')
+    assert coerce_file_path('EFTA00000001') == new_file
+
+
+def test_all_txt_paths(doj_txts_dir, tmp_path, monkeypatch):
+    docs_dir = tmp_path.joinpath('docs')
+    docs_dir.mkdir()
+    docs_dir.joinpath('HOUSE_OVERSIGHT_012345.txt').write_text('house')
+    emls_dir = tmp_path.joinpath('emls')
+    emls_dir.mkdir()
+    monkeypatch.setattr(file_helper, 'DOCS_DIR', docs_dir)
+    monkeypatch.setattr(file_helper, 'DROPSITE_EMLS_DIR', emls_dir)
+    assert sorted(p.name for p in all_txt_paths()) == ['EFTA00000020.txt', f"{DOJ_ID}.txt", 'HOUSE_OVERSIGHT_012345.txt']
+    assert doj_txt_paths_by_name()[f"{DOJ_ID}.txt"] == doj_txts_dir.joinpath('DataSet 9', f"{DOJ_ID}.txt")
+
+    monkeypatch.setattr(file_helper, 'DOJ_TXTS_20260130_DIR', None)
+    doj_txt_paths_by_name.cache_clear()
+    assert doj_txt_paths() == []
+    assert doj_txt_paths_by_name() == {}
+    assert [p.name for p in all_txt_paths()] == ['HOUSE_OVERSIGHT_012345.txt']
+
+
 def test_coerce_file_stem(house_file_id, house_stem, house_filename, house_extract_filename):
     assert coerce_file_stem(house_file_id) == house_stem
     assert coerce_file_stem(house_stem) == house_stem
@@ -47,3 +80,18 @@ def test_is_valid_id(doj_local_file_id, house_extract_file_id, house_file_id):
 def test_local_doj_file_path(get_email):
     email: Email = get_email(DOJ_ID)
     assert email.file_info.local_pdf_path == local_doj_file_path(DOJ_ID, 9)
+
+
+@pytest.fixture
+def doj_txts_dir(tmp_path, monkeypatch):
+    txts_dir = tmp_path.joinpath('doj_txts')
+
+    for data_set_id, file_id in [(1, 'EFTA00000020'), (9, DOJ_ID)]:
+        data_set_dir = txts_dir.joinpath(f"DataSet {data_set_id}")
+        data_set_dir.mkdir(parents=True)
+        data_set_dir.joinpath(f"{file_id}.txt").write_text(file_id)
+
+    monkeypatch.setattr(file_helper, 'DOJ_TXTS_20260130_DIR', txts_dir)
+    doj_txt_paths_by_name.cache_clear()
+    yield txts_dir
+    doj_txt_paths_by_name.cache_clear()
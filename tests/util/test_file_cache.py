@@ -0,0 +1,32 @@
+import os
+
+from epstein_files.util.file_cache import FileCache
+
+
+def test_file_cache(tmp_path):
+    path = tmp_path.joinpath('data.txt')
+    path.write_text('first')
+    cache = FileCache(lambda p: [p.read_text()])
+    data = cache.load(path)
+    assert data == ['first']
+    assert cache.load(path) is data
+
+    path.write_text('second')
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+    assert cache.load(path) == ['second']
+
+
+def test_file_cache_eviction(tmp_path):
+    paths = [tmp_path.joinpath(f"{i}.txt") for i in range(3)]
+
+    for path in paths:
+        path.write_text(path.stem)
+
+    cache = FileCache(lambda p: [p.read_text()], max_entries=2)
+    first = cache.load(paths[0])
+    cache.load(paths[1])
+    assert cache.load(paths[0]) is first  # Most recently used now
+    cache.load(paths[2])  # Evicts paths[1]
+    assert len(cache) == 2
+    assert cache.load(paths[0]) is first
+    assert cache.load(paths[1]) == ['1']